@@ -20,6 +20,8 @@ class ServerProfile:
     sasl_user: Optional[str] = None  # SASL username (defaults to nick/user)
     # When True, disable certificate verification and hostname checks (self-signed certs)
     ignore_invalid_certs: bool = False
+    # Capabilities ACK'd on the last session with this host; when set, CAP LS is skipped
+    cached_caps: Optional[list[str]] = None
 
 
 class IRCManager:
@@ -71,6 +73,9 @@ class IRCManager:
         # MONITOR callbacks: lists of nicks online/offline
         self.on_monitor_online: Optional[Callable[[list[str]], None]] = None
         self.on_monitor_offline: Optional[Callable[[list[str]], None]] = None
+        # Capability cache callbacks: persist ACK'd caps / drop a stale cache
+        self.on_caps_cached: Optional[Callable[[list[str]], None]] = None  # (active caps)
+        self.on_caps_invalidated: Optional[Callable[[], None]] = None
         self.current_channel = self.p.channels[0] if self.p.channels else None
         self._stop = False
         # IRCv3 state
@@ -84,6 +89,7 @@ class IRCManager:
         self._cap_ls_pending = False
         self._sasl_in_progress = False
         self._sasl_payload_sent = False
+        self._cap_from_cache = False
         # Batch state
         self._batches: dict[str, dict] = {}
         self._batch_names: dict[str, dict[str, list[str]]] = {}
@@ -116,12 +122,24 @@ class IRCManager:
             self.reader, self.writer = await asyncio.open_connection(self.p.host, self.p.port)
         # Start CAP negotiation (IRCv3)
         self._cap_negotiating = True
-        if self.on_status:
-            try:
-                self.on_status("starting CAP negotiation (LS 302)")
-            except Exception:
-                pass
-        await self._send("CAP LS 302")
+        cached = [c for c in (self.p.cached_caps or []) if c != "sasl" or self.p.password]
+        if cached:
+            # Same server as last time: request the known-good set directly, skipping LS
+            if self.on_status:
+                try:
+                    self.on_status("starting CAP negotiation (cached REQ)")
+                except Exception:
+                    pass
+            self._cap_from_cache = True
+            self._requested_caps.update(cached)
+            await self._send("CAP REQ :" + " ".join(cached))
+        else:
+            if self.on_status:
+                try:
+                    self.on_status("starting CAP negotiation (LS 302)")
+                except Exception:
+                    pass
+            await self._send("CAP LS 302")
         # Begin registration
         await self._send(f"NICK {self.p.nick}")
         await self._send(f"USER {self.p.user} 0 * :{self.p.realname}")
@@ -494,9 +512,15 @@ class IRCManager:
                     continue
 
                 # SASL result numerics
+                if cmd == "908":
+                    # RPL_SASLMECHS: our mechanism is unsupported; a 904 follows
+                    self._invalidate_cached_caps()
+                    continue
                 if cmd in ("903", "904", "905", "906", "907"):
                     # 903 = success; others are failure/abort/already authed
                     self._sasl_in_progress = False
+                    if cmd == "904":
+                        self._invalidate_cached_caps()
                     if self.on_status:
                         try:
                             self.on_status(f"SASL result {cmd}")
@@ -678,13 +702,33 @@ class IRCManager:
         elif subcmd == "ACK":
             acks = payload.split()
             self._active_caps.update(acks)
+            if self.on_caps_cached:
+                try:
+                    self.on_caps_cached(sorted(self._active_caps))
+                except Exception:
+                    pass
             if "sasl" in acks and self.p.password:
                 await self._begin_sasl()
             else:
                 await self._end_cap()
         elif subcmd == "NAK":
+            if self._cap_from_cache:
+                # Server no longer accepts the cached set; fall back to full LS negotiation
+                self._invalidate_cached_caps()
+                self._requested_caps.clear()
+                await self._send("CAP LS 302")
+                return
             await self._end_cap()
 
+    def _invalidate_cached_caps(self):
+        self._cap_from_cache = False
+        self.p.cached_caps = None
+        if self.on_caps_invalidated:
+            try:
+                self.on_caps_invalidated()
+            except Exception:
+                pass
+
     async def _begin_sasl(self):
         try:
             self._sasl_in_progress = True
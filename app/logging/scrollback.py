@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
+
+
+class ScrollbackStore:
+    """Per-channel chat history files: one JSON-encoded HTML string per line, append-only.
+
+    Once ``limit`` lines have been appended to a file it is rewritten from the caller's
+    in-memory tail, so files stay around ``2 * limit`` lines without per-message rewrites.
+    """
+
+    def __init__(self, base_dir: str | Path | None, limit: int) -> None:
+        self.base = Path(base_dir) if base_dir else None
+        self.limit = limit
+        # Channel -> lines appended since its file was last (re)written
+        self._appends: dict[str, int] = {}
+
+    def path_for(self, channel: str) -> Path | None:
+        if self.base is None:
+            return None
+        self.base.mkdir(parents=True, exist_ok=True)
+        safe = "".join(
+            c if c.isalnum() or c in ("#", "-", "_", "@", ".", ":", "+") else "_" for c in channel
+        )
+        return self.base / f"scrollback_{safe}.jsonl"
+
+    def save(self, channel: str, lines: Iterable[str]) -> None:
+        """Rewrite the channel's file with the last ``limit`` lines."""
+        path = self.path_for(channel)
+        if path is None:
+            return
+        data = list(lines)[-self.limit :]
+        with path.open("w", encoding="utf-8") as f:
+            f.writelines(json.dumps(h, ensure_ascii=False) + "\n" for h in data)
+        self._appends[channel] = 0
+
+    def append(self, channel: str, html: str, tail: Iterable[str]) -> bool:
+        """Append one line; returns True when the file was compacted from ``tail`` instead.
+
+        ``tail`` is the caller's bounded history, already including ``html``.
+        """
+        path = self.path_for(channel)
+        if path is None:
+            return False
+        if self._appends.get(channel, 0) >= self.limit:
+            self.save(channel, tail)
+            return True
+        with path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(html, ensure_ascii=False) + "\n")
+        self._appends[channel] = self._appends.get(channel, 0) + 1
+        return False
+
+    def load(self, channel: str) -> list[str] | None:
+        """Last ``limit`` lines of the channel's history; unreadable lines are skipped."""
+        path = self.path_for(channel)
+        if path is None:
+            return None
+        if not path.exists():
+            return self._migrate_legacy(channel, path)
+        # Stream the file, keeping only the tail
+        with path.open(encoding="utf-8", errors="replace") as f:
+            tail = deque(f, maxlen=self.limit)
+        out = []
+        for line in tail:
+            try:
+                out.append(str(json.loads(line)))
+            except ValueError:
+                pass
+        return out
+
+    def clear(self, channel: str) -> None:
+        """Delete the channel's history file (and any legacy one)."""
+        self._appends.pop(channel, None)
+        path = self.path_for(channel)
+        if path is None:
+            return
+        for p in (path, path.with_suffix(".json")):
+            if p.exists():
+                os.remove(p)
+
+    def _migrate_legacy(self, channel: str, path: Path) -> list[str] | None:
+        # Pre-jsonl files hold one JSON list; convert once, then drop the old file
+        legacy = path.with_suffix(".json")
+        if not legacy.exists():
+            return None
+        with legacy.open(encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            return None
+        out = [str(x) for x in data][-self.limit :]
+        self.save(channel, out)
+        os.remove(legacy)
+        return out
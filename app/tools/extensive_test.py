@@ -49,7 +49,7 @@ class TestRunner:
         }
         for ch, names in data.items():
             try:
-                self.win._on_names(ch, names)
+                self.win._on_names(*ch.split(":", 1), names)
                 self.log(f"[OK] Names updated for {ch}: {len(names)} nicks")
             except Exception as e:
                 self.log(f"[ERR] _on_names for {ch} failed: {e}")
@@ -22,11 +22,11 @@ def run():
     def step1():
         # Emit channels and set current channel
         try:
-            w.bridge.channelsUpdated.emit([ch1, ch2])
+            w.bridge.channelsUpdated.emit((ch1, ch2))
             w.bridge.set_current_channel(ch1)
             # Emit names for both channels with different lists
-            w.bridge.namesUpdated.emit(ch1, ["alice", "bob", "carol"])
-            w.bridge.namesUpdated.emit(ch2, ["dave", "erin", "frank", "grace"])
+            w.bridge.namesUpdated.emit(*ch1.split(":", 1), ["alice", "bob", "carol"])
+            w.bridge.namesUpdated.emit(*ch2.split(":", 1), ["dave", "erin", "frank", "grace"])
         except Exception as e:
             print("Error step1:", e)
 
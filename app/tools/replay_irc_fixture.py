@@ -42,12 +42,14 @@ class ReplayDriver:
         self.win = win
         self.lines = [ln.rstrip("\n") for ln in lines if ln.strip()]
         self._names: dict[str, list[str]] = {}
+        # Fixtures carry bare channel names; attribute them to a synthetic network
+        self.net = "replay"
 
     def _flush_names(self, ch: str) -> None:
         names = self._names.pop(ch, None)
         if names is not None:
             try:
-                self.win._on_names(ch, names)
+                self.win._on_names(self.net, ch, names)
             except Exception:
                 pass
 
@@ -71,7 +71,7 @@ class TinyIRCD(asyncio.Protocol):
             self.send(f":tiny.server 353 {self.nick} = {ch} :@alice +bob {self.nick}")
             self.send(f":tiny.server 366 {self.nick} {ch} :End of /NAMES list.")
             # Schedule scripted events
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             t = 0
             for ev in self.script:
                 t += ev.delay_ms
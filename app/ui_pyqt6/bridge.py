@@ -3,35 +3,42 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Iterable
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QSettings, pyqtSignal
 from qasync import asyncSlot
 
 from ..irc.manager import IRCManager, ServerProfile
 
 
+def composite(net: str, ch: str) -> str:
+    """Build the packed 'net:#chan' label used by sidebar/scrollback keys."""
+    return net + ":" + ch
+
+
 class BridgeQt(QObject):
     statusChanged = pyqtSignal(str)
-    messageReceived = pyqtSignal(str, str, str, float)  # nick, target, text, ts
-    namesUpdated = pyqtSignal(str, list)  # channel, names
+    messageReceived = pyqtSignal(str, str, str, str, float)  # net, nick, target, text, ts
+    namesUpdated = pyqtSignal(str, str, list)  # net, channel, names
     currentChannelChanged = pyqtSignal(str)
-    channelsUpdated = pyqtSignal(list)
+    channelsUpdated = pyqtSignal(tuple)  # immutable snapshot of composite labels
     monitorOnline = pyqtSignal(list)  # list of nicks
     monitorOffline = pyqtSignal(list)  # list of nicks
     # Typed events from IRCManager (network-aware)
-    userJoined = pyqtSignal(str, str)  # composite channel, nick
-    userParted = pyqtSignal(str, str)  # composite channel, nick
+    userJoined = pyqtSignal(str, str, str)  # net, channel, nick
+    userParted = pyqtSignal(str, str, str)  # net, channel, nick
     userQuit = pyqtSignal(str, str)  # net, nick
     userNickChanged = pyqtSignal(str, str, str)  # net, old, new
-    channelTopic = pyqtSignal(str, str, str)  # composite channel, actor, topic
-    channelMode = pyqtSignal(str, str, str)  # composite channel, actor, modes_with_args
-    channelModeUsers = pyqtSignal(str, list)  # composite channel, [(add, mode, nick)]
+    channelTopic = pyqtSignal(str, str, str, str)  # net, channel, actor, topic
+    channelMode = pyqtSignal(str, str, str, str)  # net, channel, actor, modes_with_args
+    channelModeUsers = pyqtSignal(str, str, list)  # net, channel, [(add, mode, nick)]
 
     def __init__(self):
         super().__init__()
         # Multiple networks keyed by id (use host as id for now)
         self._ircs: dict[str, IRCManager] = {}
-        # Union list of composite labels like 'net:#chan'
+        # Union list of composite labels like 'net:#chan' (ordered for emission),
+        # with a set sidecar for O(1) membership during JOIN bursts
         self._all_channels: list[str] = []
+        self._all_channels_set: set[str] = set()
         self._current_channel: str | None = None
 
     def current_channel(self) -> str | None:
@@ -90,7 +97,8 @@ class BridgeQt(QObject):
             pass
         # Filter out channels belonging to this net
         self._all_channels = [c for c in self._all_channels if not c.startswith(f"{net}:")]
-        self.channelsUpdated.emit(list(self._all_channels))
+        self._all_channels_set = set(self._all_channels)
+        self.channelsUpdated.emit(tuple(self._all_channels))
         # Adjust current channel if it belonged to the removed net
         cur = self._current_channel or ""
         if cur.startswith(f"{net}:"):
@@ -119,20 +127,19 @@ class BridgeQt(QObject):
             pass
         self.statusChanged.emit(f"Connecting to {host}:{port} (TLS={'on' if tls else 'off'})…")
         # Normalize channels (ensure leading '#')
+        # Materialize once: a generator would be exhausted by a second pass
+        src = list(channels) if channels else []
         norm_channels = []
-        try:
-            for ch in list(channels or []):
-                ch = ch.strip()
-                if not ch:
-                    continue
-                # If a composite like 'net:#chan' (or worse: '#net:#chan:...'), take the last segment
-                if ":" in ch and not ch.startswith("["):
-                    ch = ch.split(":")[-1]
-                if not (ch.startswith("#") or ch.startswith("&")):
-                    ch = "#" + ch
-                norm_channels.append(ch)
-        except Exception:
-            norm_channels = list(channels or [])
+        for ch in src:
+            ch = str(ch).strip()
+            if not ch:
+                continue
+            # If a composite like 'net:#chan' (or worse: '#net:#chan:...'), take the last segment
+            if ":" in ch and not ch.startswith("["):
+                ch = ch.split(":")[-1]
+            if not (ch.startswith("#") or ch.startswith("&")):
+                ch = "#" + ch
+            norm_channels.append(ch)
         prof = ServerProfile(
             name=host,
             host=host,
@@ -145,6 +152,7 @@ class BridgeQt(QObject):
             password=password,
             sasl_user=sasl_user,
             ignore_invalid_certs=bool(ignore_invalid_certs),
+            cached_caps=self._load_cached_caps(host),
         )
         net = host  # simple id; could include port if needed
         irc = IRCManager(prof)
@@ -153,27 +161,27 @@ class BridgeQt(QObject):
             irc.debug = True
         except Exception:
             pass
-        # Prefix callbacks with network id, and emit composite labels
+        # Prefix callbacks with network id; consumers build composite labels if needed
         irc.on_status = lambda s, _net=net: self.statusChanged.emit(f"[{_net}] {s}")
-        irc.on_message = lambda n, t, x, ts, _net=net: self.messageReceived.emit(
-            n, f"{_net}:{t}", x, ts
-        )
-        irc.on_names = lambda ch, ns, _net=net: self.namesUpdated.emit(f"{_net}:{ch}", ns)
-        irc.on_join = lambda ch, nick, _net=net: self.userJoined.emit(f"{_net}:{ch}", nick)
-        irc.on_part = lambda ch, nick, _net=net: self.userParted.emit(f"{_net}:{ch}", nick)
+        irc.on_message = lambda n, t, x, ts, _net=net: self.messageReceived.emit(_net, n, t, x, ts)
+        irc.on_names = lambda ch, ns, _net=net: self.namesUpdated.emit(_net, ch, ns)
+        irc.on_join = lambda ch, nick, _net=net: self.userJoined.emit(_net, ch, nick)
+        irc.on_part = lambda ch, nick, _net=net: self.userParted.emit(_net, ch, nick)
         irc.on_quit = lambda nick, _net=net: self.userQuit.emit(_net, nick)
         irc.on_nick = lambda old, new, _net=net: self.userNickChanged.emit(_net, old, new)
         irc.on_topic = lambda ch, actor, topic, _net=net: self.channelTopic.emit(
-            f"{_net}:{ch}", actor, topic
+            _net, ch, actor, topic
         )
         irc.on_mode_channel = lambda ch, actor, modes, _net=net: self.channelMode.emit(
-            f"{_net}:{ch}", actor, modes
+            _net, ch, actor, modes
         )
         irc.on_mode_users = lambda ch, changes, _net=net: self.channelModeUsers.emit(
-            f"{_net}:{ch}", changes
+            _net, ch, changes
         )
         irc.on_monitor_online = lambda nicks: self.monitorOnline.emit(nicks)
         irc.on_monitor_offline = lambda nicks: self.monitorOffline.emit(nicks)
+        irc.on_caps_cached = lambda caps, _host=host: self._store_cached_caps(_host, caps)
+        irc.on_caps_invalidated = lambda _host=host: self._store_cached_caps(_host, None)
         try:
             # Apply a sane timeout to avoid hanging forever on unreachable hosts
             await asyncio.wait_for(irc.connect(), timeout=15.0)
@@ -184,16 +192,34 @@ class BridgeQt(QObject):
         self._ircs[net] = irc
         self.statusChanged.emit(f"[{net}] Connected. Registering…")
         # Build composite channel labels for this net
-        new_list = [f"{net}:{c}" for c in list(prof.channels or [])]
+        new_list = [composite(net, c) for c in list(prof.channels or [])]
         # Merge into union list (preserve order; append new ones)
         for lbl in new_list:
-            if lbl not in self._all_channels:
-                self._all_channels.append(lbl)
+            self._add_channel_label(lbl)
         # Set initial selection to first channel of this net if none selected
         if new_list and (self._current_channel is None):
             self.set_current_channel(new_list[0])
         # Notify UI with union list
-        self.channelsUpdated.emit(list(self._all_channels))
+        self.channelsUpdated.emit(tuple(self._all_channels))
+
+    # ----- Per-host capability cache (shares the key MainWindow persists ACKs under) -----
+    def _load_cached_caps(self, host: str) -> list[str] | None:
+        try:
+            s = QSettings("DeadHop", "DeadHopClient")
+            caps = s.value(f"network/server_caps/{host}", [], type=list) or []
+            return [str(c) for c in caps if c] or None
+        except Exception:
+            return None
+
+    def _store_cached_caps(self, host: str, caps: list[str] | None) -> None:
+        try:
+            s = QSettings("DeadHop", "DeadHopClient")
+            if caps:
+                s.setValue(f"network/server_caps/{host}", list(caps))
+            else:
+                s.remove(f"network/server_caps/{host}")
+        except Exception:
+            pass
 
     @asyncSlot(str)
     async def sendMessage(self, text: str) -> None:
@@ -270,6 +296,14 @@ class BridgeQt(QObject):
                 self.statusChanged.emit(f"[{net}] Monitor update failed: {e}")
 
     # ----- Channel management (multi-server aware) -----
+    def _add_channel_label(self, lbl: str) -> bool:
+        """Append a composite label if unseen; return True when it was added."""
+        if lbl in self._all_channels_set:
+            return False
+        self._all_channels_set.add(lbl)
+        self._all_channels.append(lbl)
+        return True
+
     def _split(self, composite: str) -> tuple[str | None, str | None]:
         if not composite or composite.startswith("[") or ":" not in composite:
             return None, None
@@ -301,10 +335,9 @@ class BridgeQt(QObject):
         except Exception as e:
             self.statusChanged.emit(f"[{net}] JOIN {ch} failed: {e}")
             return
-        lbl = f"{net}:{ch}"
-        if lbl not in self._all_channels:
-            self._all_channels.append(lbl)
-            self.channelsUpdated.emit(list(self._all_channels))
+        lbl = composite(net, ch)
+        if self._add_channel_label(lbl):
+            self.channelsUpdated.emit(tuple(self._all_channels))
         # Switch current channel to the joined one
         self.set_current_channel(lbl)
 
@@ -321,11 +354,12 @@ class BridgeQt(QObject):
         except Exception as e:
             self.statusChanged.emit(f"[{net}] PART {ch} failed: {e}")
             return
-        lbl = f"{net}:{ch}"
+        lbl = composite(net, ch)
         # Optimistically remove from union list
-        if lbl in self._all_channels:
+        if lbl in self._all_channels_set:
+            self._all_channels_set.discard(lbl)
             self._all_channels.remove(lbl)
-            self.channelsUpdated.emit(list(self._all_channels))
+            self.channelsUpdated.emit(tuple(self._all_channels))
         # If current was parted, select another
         if self._current_channel == lbl:
             self.set_current_channel(self._all_channels[0] if self._all_channels else "")
@@ -24,8 +24,9 @@ class ConnectDialog(QDialog):
         self.port = QLineEdit("6697")
         self.tls = QCheckBox("Use TLS")
         self.tls.setChecked(True)
-        # Default nick: DeadRabbit + random 4-digit number
-        self.nick = QLineEdit(self._rand_nick())
+        # Default nick: DeadRabbit + random 4-digit number, drawn in values() only if left empty
+        self.nick = QLineEdit("")
+        self.nick.setPlaceholderText(self._rand_nick_template())
         self.user = QLineEdit("peach")
         self.realname = QLineEdit("DeadHop")
         self.channels = QLineEdit("#peach,#python")
@@ -87,6 +88,9 @@ class ConnectDialog(QDialog):
             autoconnect,
         )
 
+    def _rand_nick_template(self) -> str:
+        return "DeadRabbit####"
+
     def _rand_nick(self) -> str:
         try:
             return f"DeadRabbit{random.randint(1000, 9999)}"
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QSize,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+)
+from PyQt6.QtGui import QFont, QIcon
 from PyQt6.QtWidgets import (
+    QApplication,
     QDialog,
     QDialogButtonBox,
-    QGridLayout,
     QHBoxLayout,
     QLineEdit,
-    QPushButton,
-    QScrollArea,
+    QListView,
     QVBoxLayout,
     QWidget,
 )
@@ -82,6 +89,99 @@ EMOJIS = [
 ]
 
 
+def _build_trigrams(entries: list[tuple[str, str]]) -> dict[str, set[int]]:
+    """Map every 3-char slice of each lowercased name to the indices that contain it."""
+    index: dict[str, set[int]] = {}
+    for idx, (_em, name) in enumerate(entries):
+        low = name.lower()
+        for i in range(len(low) - 2):
+            index.setdefault(low[i : i + 3], set()).add(idx)
+    return index
+
+
+TRIGRAMS = _build_trigrams(EMOJIS)
+# Lowercased once so queries never re-lowercase the catalog
+NAMES_LC = tuple(name.lower() for _em, name in EMOJIS)
+
+
+def _row_matches(i: int, t: str) -> bool:
+    """The one match rule: the lowercased name or the emoji itself contains ``t``."""
+    return t in NAMES_LC[i] or t in EMOJIS[i][0]
+
+
+def _search(t: str) -> set[int]:
+    """Indices of EMOJIS matching ``t`` (lowercase); trigram index for 3+ chars."""
+    if len(t) >= 3:
+        return _trigram_search(t)
+    return {i for i in range(len(EMOJIS)) if _row_matches(i, t)}
+
+
+def _trigram_search(t: str) -> set[int]:
+    """Indices of EMOJIS whose name contains ``t`` (lowercase, len >= 3).
+
+    Emoji are at most two code points, so a 3+ char query can only match via the name.
+    """
+    cands: set[int] | None = None
+    for i in range(len(t) - 2):
+        hits = TRIGRAMS.get(t[i : i + 3])
+        if not hits:
+            return set()
+        cands = set(hits) if cands is None else cands & hits
+        if not cands:
+            return set()
+    # Trigrams can all match without the full query being contiguous; verify
+    return {i for i in cands or () if _row_matches(i, t)}
+
+
+class EmojiModel(QAbstractListModel):
+    """Flat list model over EMOJIS: display role is the emoji, tooltip is its name."""
+
+    def __init__(self, entries: list[tuple[str, str]], parent=None) -> None:
+        super().__init__(parent)
+        self._rows = entries
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        em, name = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return em
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return name
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+
+class _EmojiFilterProxy(QSortFilterProxyModel):
+    """Filters and ranks rows from a per-query rank table computed once in set_query."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        # Source row -> rank (0 = prefix match, 1 = substring); None shows the whole catalog
+        self._rank: dict[int, int] | None = None
+
+    def set_query(self, t: str) -> None:
+        if t:
+            # Rank only the hits; the catalog's names were lowercased at import
+            self._rank = {i: 0 if NAMES_LC[i].startswith(t) else 1 for i in _search(t)}
+        else:
+            self._rank = None
+        self.invalidate()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        return self._rank is None or source_row in self._rank
+
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        # Prefix matches first, then substring matches, each in catalog order
+        rank = self._rank or {}
+        lr, rr = left.row(), right.row()
+        return (rank.get(lr, 0), lr) < (rank.get(rr, 0), rr)
+
+
 class EmojiPickerDialog(QDialog):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -98,53 +198,51 @@ class EmojiPickerDialog(QDialog):
         top.addWidget(self.search)
         root.addLayout(top)
 
-        scroll = QScrollArea(self)
-        scroll.setWidgetResizable(True)
-        holder = QWidget(scroll)
-        grid = QGridLayout(holder)
-        grid.setContentsMargins(6, 6, 6, 6)
-        grid.setSpacing(6)
-
-        self._buttons: list[QPushButton] = []
-        cols = 12
-        for idx, (em, name) in enumerate(EMOJIS):
-            btn = QPushButton(em, holder)
-            try:
-                f = btn.font()
-                f.setFamily("Segoe UI Emoji")
-                f.setPointSize(max(f.pointSize() + 8, 20))
-                btn.setFont(f)
-            except Exception:
-                pass
-            btn.setFixedSize(48, 48)
-            btn.setStyleSheet("QPushButton{padding:0; border:none; font-size:28px;}")
-            btn.setToolTip(name)
-            btn.setProperty("names", name)
-            btn.clicked.connect(lambda _=False, e=em: self._choose(e))
-            self._buttons.append(btn)
-            r, c = divmod(idx, cols)
-            grid.addWidget(btn, r, c)
-
-        holder.setLayout(grid)
-        scroll.setWidget(holder)
-        root.addWidget(scroll, 1)
+        # Model/view grid: only the cells in the viewport are painted, however
+        # large the catalog gets
+        self._model = EmojiModel(EMOJIS, self)
+        self._proxy = _EmojiFilterProxy(self)
+        self._proxy.setSourceModel(self._model)
+        self._proxy.sort(0)
+        view = QListView(self)
+        view.setViewMode(QListView.ViewMode.IconMode)
+        view.setMovement(QListView.Movement.Static)
+        view.setResizeMode(QListView.ResizeMode.Adjust)
+        view.setUniformItemSizes(True)
+        view.setSpacing(4)
+        view.setGridSize(QSize(52, 52))
+        view.setWordWrap(False)
+        emoji_font = QFont("Segoe UI Emoji")
+        emoji_font.setPointSize(max(QApplication.font().pointSize() + 8, 20))
+        view.setFont(emoji_font)
+        view.setModel(self._proxy)
+        view.clicked.connect(self._on_index_clicked)
+        self.view = view
+        root.addWidget(view, 1)
 
         bb = QDialogButtonBox(QDialogButtonBox.StandardButton.Cancel, self)
         bb.rejected.connect(self.reject)
         root.addWidget(bb)
 
-        self.search.textChanged.connect(self._apply_filter)
+        # Debounce: restarting the single-shot timer on each keystroke means only
+        # the last key in a burst triggers a filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.search.textChanged.connect(self._filter_timer.start)
+
+    def _on_index_clicked(self, index: QModelIndex) -> None:
+        em = index.data(Qt.ItemDataRole.DisplayRole)
+        if em:
+            self._choose(em)
 
     def _choose(self, em: str) -> None:
         self.selected = em
         self.accept()
 
-    def _apply_filter(self, text: str) -> None:
-        t = (text or "").strip().lower()
-        for b in self._buttons:
-            names = (b.property("names") or "").lower()
-            show = True if not t else (t in b.text().lower() or t in names)
-            b.setVisible(show)
+    def _apply_filter(self) -> None:
+        self._proxy.set_query((self.search.text() or "").strip().lower())
 
 
 def pick_emoji(parent: QWidget | None = None) -> str | None:
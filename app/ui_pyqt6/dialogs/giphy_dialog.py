@@ -1,12 +1,29 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import itertools
 import json
 import os
+import threading
 from pathlib import Path
 from time import time
 
 import requests
-from PyQt6.QtCore import QSettings, Qt
+from PyQt6.QtCore import (
+    QCoreApplication,
+    QEvent,
+    QObject,
+    QPoint,
+    QRect,
+    QRunnable,
+    QSettings,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -19,11 +36,258 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
+from requests.adapters import HTTPAdapter
+
+try:
+    import keyring
+except Exception:  # optional: OS keychain for the API key
+    keyring = None
+
+try:
+    import ijson
+except Exception:  # optional: streaming JSON parse for search replies
+    ijson = None
 
 GIPHY_SEARCH_URL = "https://api.giphy.com/v1/gifs/search"
 CACHE_DIR = Path(__file__).resolve().parents[2] / "resources" / "cache"
-CACHE_FILE = CACHE_DIR / "giphy_cache.json"
-CACHE_TTL_SEC = 24 * 3600  # 1 day
+CACHE_FILE = CACHE_DIR / "giphy_cache.json.gz"
+LEGACY_CACHE_FILE = CACHE_DIR / "giphy_cache.json"  # plaintext; read once, then migrated
+CACHE_TTL_SEC = 24 * 3600  # 1 day; fallback for entries written without a ttl
+# Short queries are ambiguous and their results churn; specific ones stay stable
+QUERY_TTL_SHORT_SEC = 3600
+QUERY_TTL_LONG_SEC = 7 * 86400
+CACHE_MAX_QUERIES = 200
+THUMB_DIR = CACHE_DIR / "giphy_thumbs"
+THUMB_TTL_SEC = 30 * 86400  # thumbnails are immutable; expire only when unused this long
+THUMB_MAX_FILES = 200
+MAX_RESULTS = 24  # matches the search `limit` and the recent-list window
+GRID_COLS = 4
+HTTP_MAX_THREADS = 6  # keep parallel fetches modest for GIPHY rate limits
+THUMB_SIZE = (132, 96)
+KEYRING_SERVICE = "DeadHop"
+KEYRING_USER = "giphy_api_key"
+
+# Still/preview renditions to use as tile thumbnails, in order of preference
+_THUMB_KEYS = (
+    "fixed_height_small_still",
+    "downsized_still",
+    "fixed_width_small_still",
+    "original_still",
+)
+
+_pool: QThreadPool | None = None
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+# API key cached for the session; None until first looked up
+_api_key_cache: str | None = None
+
+
+def _load_api_key() -> str:
+    """Return the saved GIPHY key from the OS keychain, else legacy QSettings (cached)."""
+    global _api_key_cache
+    if _api_key_cache is not None:
+        return _api_key_cache
+    key = ""
+    if keyring is not None:
+        try:
+            key = keyring.get_password(KEYRING_SERVICE, KEYRING_USER) or ""
+        except Exception:
+            key = ""
+    if not key:
+        try:
+            s = QSettings("DeadHop", "DeadHopClient")
+            key = s.value("giphy/api_key", "", str) or ""
+        except Exception:
+            key = ""
+    _api_key_cache = key
+    return key
+
+
+def _store_api_key(key: str) -> None:
+    """Save to the keychain and drop any plaintext copy; QSettings only without a backend."""
+    global _api_key_cache
+    _api_key_cache = key
+    stored = False
+    if keyring is not None:
+        try:
+            keyring.set_password(KEYRING_SERVICE, KEYRING_USER, key)
+            stored = True
+        except Exception:
+            stored = False
+    try:
+        s = QSettings("DeadHop", "DeadHopClient")
+        if stored:
+            s.remove("giphy/api_key")
+        else:
+            s.setValue("giphy/api_key", key)
+    except Exception:
+        pass
+
+
+def _http_pool() -> QThreadPool:
+    """Shared, app-lifetime pool so closing the dialog never blocks on in-flight fetches."""
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(HTTP_MAX_THREADS)
+    return _pool
+
+
+def _http_session() -> requests.Session:
+    """Shared keep-alive session so TLS handshakes to GIPHY hosts are paid once.
+
+    The connection pool is sized to the worker pool so every thread can hold a
+    live connection to the API host and to the media CDN.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            sess = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_MAX_THREADS)
+            sess.mount("https://", adapter)
+            sess.mount("http://", adapter)
+            _session = sess
+        return _session
+
+
+class _HttpSignals(QObject):
+    finished = pyqtSignal(object, object, str)  # tag, payload bytes or None, error
+
+
+class _HttpWorker(QRunnable):
+    """GET a URL on a pool thread and report the body back to the UI thread."""
+
+    def __init__(
+        self,
+        tag,
+        url: str,
+        params: dict | None = None,
+        timeout: float = 10,
+        cache_path: Path | None = None,
+        items_limit: int | None = None,
+        scale_to: tuple[int, int] | None = None,
+    ) -> None:
+        super().__init__()
+        self.tag = tag
+        self.url = url
+        self.params = params
+        self.timeout = timeout
+        self.cache_path = cache_path
+        # When set, parse a GIPHY reply here and emit at most this many `data` items
+        self.items_limit = items_limit
+        # When set, decode the body here and emit a QImage scaled to fit (w, h)
+        self.scale_to = scale_to
+        self.signals = _HttpSignals()
+
+    def run(self) -> None:
+        try:
+            if self.items_limit is not None:
+                self.signals.finished.emit(self.tag, self._fetch_items(), "")
+                return
+            body = self._read_cached()
+            if body is None:
+                r = _http_session().get(self.url, params=self.params, timeout=self.timeout)
+                r.raise_for_status()
+                body = r.content
+                self._write_cached(body)
+            if self.scale_to is not None:
+                self.signals.finished.emit(self.tag, self._decode_scaled(body), "")
+                return
+            self.signals.finished.emit(self.tag, body, "")
+        except Exception as e:
+            self.signals.finished.emit(self.tag, None, str(e))
+
+    def _fetch_items(self) -> list:
+        sess = _http_session()
+        with sess.get(self.url, params=self.params, timeout=self.timeout, stream=True) as r:
+            r.raise_for_status()
+            if ijson is None:
+                return list(r.json().get("data") or [])[: self.items_limit]
+            # Stream-parse and stop after the last wanted item instead of building the whole tree
+            r.raw.decode_content = True
+            items = ijson.items(r.raw, "data.item", use_float=True)
+            return list(itertools.islice(items, self.items_limit))
+
+    def _decode_scaled(self, body: bytes) -> QImage | None:
+        # QImage is safe off the GUI thread; the UI thread only wraps it in a QPixmap
+        img = QImage()
+        if not img.loadFromData(body):
+            return None
+        w, h = self.scale_to
+        return img.scaled(
+            w,
+            h,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
+    def _read_cached(self) -> bytes | None:
+        p = self.cache_path
+        if p is None:
+            return None
+        try:
+            if time() - p.stat().st_mtime >= THUMB_TTL_SEC:
+                return None
+            body = p.read_bytes()
+            os.utime(p)  # bump mtime so eviction is least-recently-used
+            return body
+        except Exception:
+            return None
+
+    def _write_cached(self, body: bytes) -> None:
+        p = self.cache_path
+        if p is None or not body:
+            return
+        try:
+            tmp = p.with_suffix(".tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, p)
+        except Exception:
+            pass
+
+
+def _first_url(images: dict, keys: tuple[str, ...], field: str = "url") -> str | None:
+    """Return ``images[k][field]`` for the first rendition ``k`` that has one."""
+    for k in keys:
+        d = images.get(k)
+        if d:
+            u = d.get(field)
+            if u:
+                return u
+    return None
+
+
+def _query_key(q: str, data) -> tuple:
+    """Render key for a result set: the query plus the GIPHY ids in display order."""
+    return ("query", q, tuple(item.get("id") for item in data or [] if isinstance(item, dict)))
+
+
+def _thumb_path(url: str) -> Path:
+    return THUMB_DIR / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".img")
+
+
+_thumbs_evicted = False
+
+
+def _evict_thumb_cache() -> None:
+    """Drop thumbnails unused past the TTL, then trim to THUMB_MAX_FILES by mtime."""
+    try:
+        now = time()
+        files = []
+        for p in THUMB_DIR.glob("*.img"):
+            try:
+                mtime = p.stat().st_mtime
+            except OSError:
+                continue
+            if now - mtime >= THUMB_TTL_SEC:
+                p.unlink(missing_ok=True)
+            else:
+                files.append((mtime, p))
+        files.sort(reverse=True)
+        for _mtime, p in files[THUMB_MAX_FILES:]:
+            p.unlink(missing_ok=True)
+    except Exception:
+        pass
 
 
 class GiphyDialog(QDialog):
@@ -35,24 +299,30 @@ class GiphyDialog(QDialog):
         self.selected_url: str | None = None
         self._api_key = api_key or os.getenv("GIPHY_API_KEY")
         self._cache = self._load_cache()
+        self._init_thumb_cache()
+        # In-memory hit/miss counters for tuning the TTL tiers
+        self._cache_stats = {"hits": 0, "misses": 0}
+        # Sequence numbers let late network replies be dropped once superseded
+        self._search_seq = 0
+        self._render_gen = 0
+        # Identity of what the tiles currently show, so an identical re-render is skipped
+        self._last_rendered_key: tuple | None = None
+        # Single-flight: query -> search seqs waiting on the one request in flight
+        self._inflight: dict[str, list[int]] = {}
 
         root = QVBoxLayout(self)
         # API key row
         keyRow = QHBoxLayout()
         self.keyEdit = QLineEdit(self)
         self.keyEdit.setPlaceholderText("GIPHY API Key")
-        # Preload from env or QSettings
+        # Preload from env, else the keychain (QSettings fallback)
+        if not self._api_key:
+            self._api_key = _load_api_key() or None
         if self._api_key:
             self.keyEdit.setText(self._api_key)
-        else:
-            try:
-                s = QSettings("DeadHop", "DeadHopClient")
-                k = s.value("giphy/api_key", "", str)
-                if k:
-                    self._api_key = k
-                    self.keyEdit.setText(k)
-            except Exception:
-                pass
+        # Only look at the field again after the user has typed in it
+        self._key_dirty = False
+        self.keyEdit.textEdited.connect(self._on_key_edited)
         self.btnSaveKey = QPushButton("Save Key", self)
         self.btnSaveKey.clicked.connect(self._save_key_clicked)
         keyRow.addWidget(self.keyEdit, 1)
@@ -84,7 +354,19 @@ class GiphyDialog(QDialog):
         self.grid.setContentsMargins(6, 6, 6, 6)
         self.grid.setSpacing(8)
         self.container.setLayout(self.grid)
+        # Fixed pool of result tiles, built once and recycled for every search
+        self._tiles: list[tuple[QPushButton, QLabel]] = []
+        # Thumbnail URL per tile; cleared once its fetch is dispatched
+        self._tile_thumbs: list[str | None] = [None] * MAX_RESULTS
+        for idx in range(MAX_RESULTS):
+            btn, lab = self._make_tile()
+            btn.clicked.connect(self._on_tile_clicked)
+            btn.hide()
+            self.grid.addWidget(btn, *divmod(idx, GRID_COLS))
+            self._tiles.append((btn, lab))
         self.scroll.setWidget(self.container)
+        # Thumbnails are fetched only as tiles scroll into view
+        self.scroll.verticalScrollBar().valueChanged.connect(self._dispatch_visible_thumbs)
         root.addWidget(self.scroll, 1)
 
         bb = QDialogButtonBox(QDialogButtonBox.StandardButton.Cancel, self)
@@ -98,131 +380,235 @@ class GiphyDialog(QDialog):
         # Show recent on open if any
         self._show_recent()
 
-    def _clear_results(self) -> None:
-        while self.grid.count():
-            item = self.grid.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.deleteLater()
+    def _make_tile(self) -> tuple[QPushButton, QLabel]:
+        btn = QPushButton(self.container)
+        btn.setFixedSize(140, 120)
+        btn.setStyleSheet(
+            "QPushButton { background: #222; color: #ccc; border: 1px solid #333; border-radius: 8px; }"
+        )
+        vbox = QVBoxLayout()
+        vbox.setContentsMargins(6, 6, 6, 6)
+        vbox.setSpacing(4)
+        lab = QLabel(btn)
+        lab.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        lab.setStyleSheet("color:#bbb")
+        vbox.addWidget(lab, 1)
+        btn.setLayout(vbox)
+        return btn, lab
+
+    def _on_tile_clicked(self) -> None:
+        # Shared slot: the tile carries its current selection URL as a property
+        btn = self.sender()
+        url = btn.property("url") if btn is not None else None
+        if url:
+            self._choose(url)
+
+    def _clear_results(self, start: int = 0) -> None:
+        """Hide pooled tiles from ``start`` onward instead of destroying them."""
+        for idx in range(start, len(self._tiles)):
+            btn, lab = self._tiles[idx]
+            if not btn.isHidden():
+                btn.hide()
+            lab.clear()
+            btn.setProperty("url", None)
+            self._tile_thumbs[idx] = None
 
     def _do_search(self) -> None:
         q = (self.query.text() or "").strip()
         if not q:
             return
-        # Ensure we have an API key (read from field each time)
-        key = (self.keyEdit.text() or "").strip()
-        if key and key != self._api_key:
-            self._api_key = key
-            self._persist_key(key)
+        # Pick up a key typed since the last search; otherwise use the cached one
+        if self._key_dirty:
+            self._key_dirty = False
+            key = (self.keyEdit.text() or "").strip()
+            if key and key != self._api_key:
+                self._api_key = key
+                self._persist_key(key)
+        # Any new search, cached or not, supersedes replies still in flight
+        self._search_seq += 1
         # Check cache first
         cached = self._cache.get("queries", {}).get(q)
         now = time()
-        if cached and isinstance(cached, dict) and (now - cached.get("ts", 0) < CACHE_TTL_SEC):
+        if (
+            cached
+            and isinstance(cached, dict)
+            and (now - cached.get("ts", 0) < cached.get("ttl", CACHE_TTL_SEC))
+        ):
+            self._cache_stats["hits"] += 1
+            cached["last_used"] = now
             data = cached.get("items", [])
             self.status.setText(f"Showing cached results for ‘{q}’ ({len(data)} items)")
-            self._render_results(data)
+            self._render_results(data, _query_key(q, data))
             return
         if not self._api_key:
             self.status.setText("Missing API key. Enter and Save above.")
             return
+        self._cache_stats["misses"] += 1
+        self.status.setText(f"Searching ‘{q}’ …")
+        params = {
+            "api_key": self._api_key,
+            "q": q,
+            "limit": MAX_RESULTS,
+            "rating": "pg",
+            "lang": "en",
+        }
+        waiters = self._inflight.get(q)
+        if waiters is not None:
+            # Identical request already on the wire; share its reply
+            waiters.append(self._search_seq)
+            return
+        self._inflight[q] = [self._search_seq]
+        self._submit(
+            q, GIPHY_SEARCH_URL, self._on_search_done, params, 10, items_limit=MAX_RESULTS
+        )
+
+    def _init_thumb_cache(self) -> None:
+        global _thumbs_evicted
         try:
-            self.status.setText(f"Searching ‘{q}’ …")
-            params = {
-                "api_key": self._api_key,
-                "q": q,
-                "limit": 24,
-                "rating": "pg",
-                "lang": "en",
-            }
-            r = requests.get(GIPHY_SEARCH_URL, params=params, timeout=10)
-            r.raise_for_status()
-            data = r.json().get("data", [])
-            # Save to cache
-            self._cache.setdefault("queries", {})[q] = {"ts": now, "items": data}
-            self._save_cache()
-        except Exception as e:
-            self.status.setText(f"Search failed: {e}")
+            THUMB_DIR.mkdir(parents=True, exist_ok=True)
+        except Exception:
             return
+        if not _thumbs_evicted:
+            # Once per process, off the UI thread
+            _thumbs_evicted = True
+            _http_pool().start(_evict_thumb_cache)
+
+    def _submit(
+        self,
+        tag,
+        url: str,
+        slot,
+        params: dict | None = None,
+        timeout: float = 8,
+        cache_path: Path | None = None,
+        items_limit: int | None = None,
+        scale_to: tuple[int, int] | None = None,
+    ) -> None:
+        worker = _HttpWorker(tag, url, params, timeout, cache_path, items_limit, scale_to)
+        # Bound-method slot: Qt drops the connection if the dialog is destroyed first
+        worker.signals.finished.connect(slot)
+        _http_pool().start(worker)
 
+    def _on_search_done(self, q, payload, err: str) -> None:
+        # Render only if the latest search (or Recent view) is one of this reply's waiters
+        current = self._search_seq in self._inflight.pop(q, ())
+        try:
+            if payload is None:
+                raise RuntimeError(err)
+            data = payload  # already parsed and capped on the worker thread
+        except Exception as e:
+            if current:
+                self.status.setText(f"Search failed: {e}")
+            return
+        # Save to cache even if a newer search has since been started
+        now = time()
+        ttl = QUERY_TTL_LONG_SEC if len(q) >= 4 else QUERY_TTL_SHORT_SEC
+        self._cache.setdefault("queries", {})[q] = {
+            "ts": now,
+            "ttl": ttl,
+            "items": data,
+            "last_used": now,
+        }
+        self._save_cache()
+        if not current:
+            return
         self.status.setText(f"Found {len(data)} results for ‘{q}’.")
-        self._render_results(data)
+        self._render_results(data, _query_key(q, data))
 
-    def _render_results(self, data) -> None:
-        self._clear_results()
-        row = col = 0
+    def _on_thumb_loaded(self, tag, payload, err: str) -> None:
+        gen, idx = tag
+        if gen != self._render_gen:
+            return  # tile has been recycled for a newer result set
+        lab = self._tiles[idx][1]
+        # Decoded and scaled on the worker; payload is a QImage or None
+        if payload is not None and not payload.isNull():
+            lab.setPixmap(QPixmap.fromImage(payload))
+        else:
+            lab.setText("GIF")
+
+    def _render_results(self, data, key: tuple | None = None) -> None:
+        if key is not None and key == self._last_rendered_key:
+            # Tiles (and any thumbnails still loading) already show exactly this
+            if not data:
+                self.status.setText("No results.")
+            return
+        self._last_rendered_key = key
+        # New generation: thumbnails still in flight for the old tiles are dropped
+        self._render_gen += 1
+        used = 0
+        tiles = self._tiles
         for item in data or []:
-            images = item.get("images", {}) if isinstance(item, dict) else {}
+            if used >= len(tiles):
+                break
+            images = item.get("images") if isinstance(item, dict) else None
+            if not images:
+                continue
             # Prefer GIF url over MP4 for selection
-            gif_url = (images.get("original", {}) or {}).get("url")
-            mp4_url = (images.get("original_mp4", {}) or {}).get("mp4")
-            select_url = gif_url or mp4_url
+            select_url = _first_url(images, ("original",)) or _first_url(
+                images, ("original_mp4",), "mp4"
+            )
             if not select_url:
                 continue
             # Pick a still/preview thumbnail
-            thumb = None
-            for key in (
-                "fixed_height_small_still",
-                "downsized_still",
-                "fixed_width_small_still",
-                "original_still",
-            ):
-                u = (images.get(key, {}) or {}).get("url")
-                if u:
-                    thumb = u
-                    break
-            btn = QPushButton(self.container)
-            btn.setFixedSize(140, 120)
-            btn.setStyleSheet(
-                "QPushButton { background: #222; color: #ccc; border: 1px solid #333; border-radius: 8px; }"
-            )
-            vbox = QVBoxLayout()
-            vbox.setContentsMargins(6, 6, 6, 6)
-            vbox.setSpacing(4)
-            lab = QLabel(btn)
-            lab.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            lab.setStyleSheet("color:#bbb")
+            thumb = _first_url(images, _THUMB_KEYS)
+            btn, lab = tiles[used]
+            btn.setProperty("url", select_url)
+            lab.clear()
+            self._tile_thumbs[used] = thumb
             if thumb:
-                try:
-                    r = requests.get(thumb, timeout=8)
-                    r.raise_for_status()
-                    from PyQt6.QtCore import QByteArray
-                    from PyQt6.QtGui import QPixmap
-
-                    ba = QByteArray(r.content)
-                    pm = QPixmap()
-                    if pm.loadFromData(ba):
-                        lab.setPixmap(
-                            pm.scaled(
-                                132,
-                                96,
-                                Qt.AspectRatioMode.KeepAspectRatio,
-                                Qt.TransformationMode.SmoothTransformation,
-                            )
-                        )
-                    else:
-                        lab.setText("GIF")
-                except Exception:
-                    lab.setText("GIF")
+                # Placeholder until the tile is visible and its fetch lands
+                lab.setText("…")
             else:
                 lab.setText("GIF")
-            vbox.addWidget(lab, 1)
-            btn.setLayout(vbox)
-            btn.clicked.connect(lambda _=False, u=select_url: self._choose(u))
-            self.grid.addWidget(btn, row, col)
-            col += 1
-            if col >= 4:
-                col = 0
-                row += 1
+            btn.show()
+            used += 1
+        # Hide whatever the previous render used beyond this one
+        self._clear_results(used)
+        # Queue the first visibility pass so the grid layout settles first
+        QTimer.singleShot(0, self._dispatch_visible_thumbs)
         if not data:
             self.status.setText("No results.")
 
+    def _dispatch_visible_thumbs(self, *_args) -> None:
+        """Start thumbnail fetches for shown tiles that intersect the scroll viewport."""
+        # Tiles shown since the last layout pass still report stale geometry, and the
+        # scroll area resizes the container only on its own pending layout request
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.LayoutRequest)
+        vp = self.scroll.viewport()
+        visible = QRect(self.container.mapFrom(vp, QPoint(0, 0)), vp.size())
+        gen = self._render_gen
+        for idx, thumb in enumerate(self._tile_thumbs):
+            if not thumb:
+                continue
+            btn = self._tiles[idx][0]
+            if btn.isHidden() or not btn.geometry().intersects(visible):
+                continue
+            self._tile_thumbs[idx] = None
+            self._submit(
+                (gen, idx),
+                thumb,
+                self._on_thumb_loaded,
+                cache_path=_thumb_path(thumb),
+                scale_to=THUMB_SIZE,
+            )
+
+    def resizeEvent(self, ev) -> None:  # type: ignore[override]
+        super().resizeEvent(ev)
+        # Growing the dialog (including the first show) can reveal more tiles
+        self._dispatch_visible_thumbs()
+
     def _show_recent(self) -> None:
+        # Supersede any search still in flight so its reply doesn't replace this view
+        self._search_seq += 1
         recent = (self._cache.get("recent") or [])[-24:]
         data = [{"images": {"original": {"url": u}}} for u in reversed(recent)]
-        self._render_results(data)
+        self._render_results(data, ("recent", tuple(recent)))
         if not recent:
             self.status.setText("No recent GIFs. Search to begin.")
 
+    def _on_key_edited(self, _text: str) -> None:
+        self._key_dirty = True
+
     def _save_key_clicked(self) -> None:
         key = (self.keyEdit.text() or "").strip()
         if not key:
@@ -232,6 +618,7 @@ class GiphyDialog(QDialog):
                 pass
             return
         self._api_key = key
+        self._key_dirty = False
         self._persist_key(key)
         try:
             self.status.setText("API key saved.")
@@ -260,28 +647,47 @@ class GiphyDialog(QDialog):
         try:
             CACHE_DIR.mkdir(parents=True, exist_ok=True)
             if CACHE_FILE.exists():
-                with open(CACHE_FILE, encoding="utf-8") as f:
+                with gzip.open(CACHE_FILE, "rt", encoding="utf-8") as f:
                     data = json.load(f)
-                    if isinstance(data, dict):
-                        return data
+            elif LEGACY_CACHE_FILE.exists():
+                with open(LEGACY_CACHE_FILE, encoding="utf-8") as f:
+                    data = json.load(f)
+            else:
+                data = None
+            if isinstance(data, dict):
+                return data
         except Exception:
             pass
         return {}
 
+    def _evict_cache(self) -> None:
+        """Once over CACHE_MAX_QUERIES, drop the least recently used quarter."""
+        queries = self._cache.get("queries")
+        if not isinstance(queries, dict) or len(queries) <= CACHE_MAX_QUERIES:
+            return
+        by_use = sorted(
+            queries,
+            key=lambda k: (queries[k] or {}).get("last_used", (queries[k] or {}).get("ts", 0)),
+        )
+        for k in by_use[: len(queries) // 4]:
+            queries.pop(k, None)
+
     def _save_cache(self) -> None:
+        self._evict_cache()
         try:
             CACHE_DIR.mkdir(parents=True, exist_ok=True)
-            with open(CACHE_FILE, "w", encoding="utf-8") as f:
-                json.dump(self._cache, f)
+            # Low compression level: the nested image dicts shrink well even at 3
+            tmp = CACHE_FILE.with_suffix(".tmp")
+            with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=3) as f:
+                json.dump(self._cache, f, separators=(",", ":"))
+            os.replace(tmp, CACHE_FILE)
+            if LEGACY_CACHE_FILE.exists():
+                LEGACY_CACHE_FILE.unlink()
         except Exception:
             pass
 
     def _persist_key(self, key: str) -> None:
-        try:
-            s = QSettings("DeadHop", "DeadHopClient")
-            s.setValue("giphy/api_key", key)
-        except Exception:
-            pass
+        _store_api_key(key)
 
 
 def pick_gif(parent: QWidget | None = None) -> str | None:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QCheckBox,
@@ -17,6 +19,34 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QIntValidator
 from PyQt6.QtCore import QSettings
 
+# Session cache of 'servers/names'. Assumes every in-process writer goes through
+# store_server_names; pass refresh=True to pick up edits made behind its back.
+_NAMES_CACHE: list[str] | None = None
+_NAMES_LOCK = threading.Lock()
+
+
+def _get_list(s: QSettings, key: str) -> list:
+    """Read a list setting; anything that is not a list (e.g. None) reads as empty."""
+    v = s.value(key, [], list)
+    return v if isinstance(v, list) else []
+
+
+def load_server_names(s: QSettings, refresh: bool = False) -> list[str]:
+    """Return a copy of the saved profile names; refresh re-reads them from QSettings."""
+    global _NAMES_CACHE
+    with _NAMES_LOCK:
+        if _NAMES_CACHE is None or refresh:
+            _NAMES_CACHE = [str(n) for n in _get_list(s, "servers/names")]
+        return list(_NAMES_CACHE)
+
+
+def store_server_names(s: QSettings, names: list[str]) -> None:
+    """Write the profile names through to QSettings and the session cache."""
+    global _NAMES_CACHE
+    with _NAMES_LOCK:
+        s.setValue("servers/names", list(names))
+        _NAMES_CACHE = list(names)
+
 
 class ServerEditorDialog(QDialog):
     """
@@ -71,6 +101,14 @@ class ServerEditorDialog(QDialog):
     def name(self) -> str:
         return (self.ed_name.text() or "").strip()
 
+    @property
+    def host(self) -> str:
+        return (self.ed_host.text() or "").strip()
+
+    @property
+    def port(self) -> int:
+        return int(self.ed_port.value())
+
     # ----- Internals -----
     def _load_into_fields(self, name: str) -> None:
         s = QSettings("DeadHop", "DeadHopClient")
@@ -101,7 +139,8 @@ class ServerEditorDialog(QDialog):
             return
 
         s = QSettings("DeadHop", "DeadHopClient")
-        names: list[str] = s.value("servers/names", [], list) or []
+        # Cached list; this dialog writes it back only via store_server_names
+        names = load_server_names(s)
         # Handle rename: if new name collides with different existing, block
         if name != self.name_original and name in names:
             QMessageBox.warning(
@@ -111,26 +150,30 @@ class ServerEditorDialog(QDialog):
             )
             return
 
-        # Persist details
-        base = f"servers/{name}"
-        s.setValue(f"{base}/host", host)
-        s.setValue(f"{base}/port", port)
-        s.setValue(f"{base}/tls", bool(self.chk_tls.isChecked()))
-        s.setValue(f"{base}/channels", (self.ed_channels.text() or "").strip())
-        s.setValue(f"{base}/password", self.ed_password.text())
-        s.setValue(f"{base}/sasl_user", (self.ed_sasl_user.text() or "").strip())
-        s.setValue(f"{base}/ignore_invalid_certs", bool(self.chk_ignore_invalid.isChecked()))
-        # Update names list
-        if name not in names:
-            names.append(name)
-        if self.name_original and self.name_original != name:
-            # remove old record
+        old = self.name_original
+        if old and old != name:
+            # Rename: drop the old record before writing the new group
             try:
-                s.remove(f"servers/{self.name_original}")
-                names = [n for n in names if n != self.name_original]
-                names.append(name)
+                s.remove(f"servers/{old}")
             except Exception:
                 pass
-        s.setValue("servers/names", names)
+        # One pass covers new, rename (keeps the list position) and unchanged
+        new_names = [name if n == old else n for n in names]
+        if name not in new_names:
+            new_names.append(name)
+
+        # Persist details in one group; flushed once below
+        s.beginGroup(f"servers/{name}")
+        s.setValue("host", host)
+        s.setValue("port", port)
+        s.setValue("tls", bool(self.chk_tls.isChecked()))
+        s.setValue("channels", (self.ed_channels.text() or "").strip())
+        s.setValue("password", self.ed_password.text())
+        s.setValue("sasl_user", (self.ed_sasl_user.text() or "").strip())
+        s.setValue("ignore_invalid_certs", bool(self.chk_ignore_invalid.isChecked()))
+        s.endGroup()
+        if new_names != names:
+            store_server_names(s, new_names)
+        s.sync()
 
         self.accept()
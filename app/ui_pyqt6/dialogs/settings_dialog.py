@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import re
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING
+
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
     QDialog,
     QDialogButtonBox,
-    QFileDialog,
-    QFontDialog,
     QFormLayout,
     QHBoxLayout,
     QLabel,
@@ -20,6 +23,57 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+if TYPE_CHECKING:  # for type hints; the file/font dialogs are imported where first used
+    from PyQt6.QtWidgets import QFileDialog
+
+
+@dataclass
+class SettingsValues:
+    """Everything the Settings dialog edits, read out of the widgets in one pass."""
+
+    theme: str | None
+    opacity: float
+    font_family: str | None
+    font_point_size: int | None
+    highlight_words: list[str]
+    friends: list[str]
+    word_wrap: bool
+    show_timestamps: bool
+    autoconnect: bool
+    auto_negotiate: bool
+    prefer_tls: bool
+    try_starttls: bool
+    notify_toast: bool
+    notify_tray: bool
+    notify_sound: bool
+    presence_sound_enabled: bool
+    sound_msg: str | None
+    sound_hl: str | None
+    sound_presence: str | None
+    sound_volume: float
+    scrollback_ttl_days: int
+    scrollback_max_files: int
+
+
+_CSV_RE = re.compile(r"\s*,\s*")
+
+
+def _split_csv(text: str) -> list[str]:
+    # Separators swallow surrounding whitespace, so only the ends need stripping
+    return [p for p in _CSV_RE.split(text.strip()) if p]
+
+
+def _fmt_font(family: str | None, point_size: int | None) -> str:
+    """Font field text: "Family, 12pt", just the family without a size, or ""."""
+    if not family:
+        return ""
+    return f"{family}, {point_size}pt" if point_size else family
+
+
+def _volume_percent(sound_volume: float | None) -> int:
+    """Slider position (0-100) for a 0.0-1.0 volume; 70 when unset."""
+    return 70 if sound_volume is None else max(0, min(100, int(float(sound_volume) * 100)))
+
 
 class SettingsDialog(QDialog):
     def __init__(
@@ -53,6 +107,56 @@ class SettingsDialog(QDialog):
     ) -> None:
         super().__init__(parent)
         self.setWindowTitle("Settings")
+        # Widgets are built on first show (see showEvent); keep the inputs until then
+        self._init_args = {
+            "theme_options": theme_options,
+            "current_theme": current_theme,
+            "opacity": opacity,
+            "font_family": font_family,
+            "font_point_size": font_point_size,
+            "highlight_words": highlight_words,
+            "friends": friends,
+            "word_wrap": word_wrap,
+            "show_timestamps": show_timestamps,
+            "autoconnect": autoconnect,
+            "auto_negotiate": auto_negotiate,
+            "prefer_tls": prefer_tls,
+            "try_starttls": try_starttls,
+            "scrollback_ttl_days": scrollback_ttl_days,
+            "scrollback_max_files": scrollback_max_files,
+        }
+        self._sounds_init = {
+            "notify_toast": notify_toast,
+            "notify_tray": notify_tray,
+            "notify_sound": notify_sound,
+            "presence_sound_enabled": presence_sound_enabled,
+            "sound_msg_path": sound_msg_path,
+            "sound_hl_path": sound_hl_path,
+            "sound_presence_path": sound_presence_path,
+            "sound_volume": sound_volume,
+        }
+        self._sounds_built = False
+        self._sound_picker: QFileDialog | None = None
+        self._built = False
+        self._font_family = font_family
+        self._font_pt = font_point_size or 0
+
+    def showEvent(self, ev) -> None:  # type: ignore[override]
+        self._ensure_ui()
+        super().showEvent(ev)
+
+    def _ensure_ui(self) -> None:
+        if not self._built:
+            self._built = True
+            # Hold repaints while ~25 widgets go in, then size once for the finished tree
+            self.setUpdatesEnabled(False)
+            try:
+                self._build_ui()
+            finally:
+                self.setUpdatesEnabled(True)
+            self.adjustSize()
+
+    def _build_ui(self) -> None:
         vroot = QVBoxLayout(self)
         vroot.setContentsMargins(12, 12, 12, 12)
         vroot.setSpacing(10)
@@ -60,7 +164,7 @@ class SettingsDialog(QDialog):
         vroot.addWidget(tabs, 1)
 
         # --- General tab ---
-        pg_general = QDialog(self)
+        pg_general = QWidget(self)
         v = QVBoxLayout(pg_general)
         v.setContentsMargins(8, 8, 8, 8)
         v.setSpacing(10)
@@ -68,10 +172,7 @@ class SettingsDialog(QDialog):
         h_theme = QHBoxLayout()
         h_theme.addWidget(QLabel("Theme:"))
         self.cmb_theme = QComboBox(self)
-        theme_options = theme_options or []
-        self.cmb_theme.addItems(theme_options)
-        if current_theme and current_theme in theme_options:
-            self.cmb_theme.setCurrentText(current_theme)
+        self._theme_options: list[str] = []
         h_theme.addWidget(self.cmb_theme, 1)
         v.addLayout(h_theme)
 
@@ -80,7 +181,6 @@ class SettingsDialog(QDialog):
         h_op.addWidget(QLabel("Window Opacity:"))
         self.sld_opacity = QSlider(Qt.Orientation.Horizontal, self)
         self.sld_opacity.setRange(50, 100)
-        self.sld_opacity.setValue(int(opacity * 100))
         h_op.addWidget(self.sld_opacity, 1)
         v.addLayout(h_op)
 
@@ -88,11 +188,6 @@ class SettingsDialog(QDialog):
         h_font = QHBoxLayout()
         h_font.addWidget(QLabel("Font:"))
         self.le_font = QLineEdit(self)
-        if font_family:
-            if font_point_size:
-                self.le_font.setText(f"{font_family}, {font_point_size}pt")
-            else:
-                self.le_font.setText(font_family)
         self.btn_font = QPushButton("Choose…", self)
         h_font.addWidget(self.le_font, 1)
         h_font.addWidget(self.btn_font)
@@ -100,17 +195,14 @@ class SettingsDialog(QDialog):
 
         # Word wrap and timestamps
         self.chk_wrap = QCheckBox("Word Wrap in Chat", self)
-        self.chk_wrap.setChecked(word_wrap)
         v.addWidget(self.chk_wrap)
         self.chk_ts = QCheckBox("Show Timestamps", self)
-        self.chk_ts.setChecked(show_timestamps)
         v.addWidget(self.chk_ts)
 
         # Highlight words
         h_hl = QHBoxLayout()
         h_hl.addWidget(QLabel("Highlight Words (comma-separated):"))
         self.le_highlight = QLineEdit(self)
-        self.le_highlight.setText(", ".join(highlight_words or []))
         h_hl.addWidget(self.le_highlight, 1)
         v.addLayout(h_hl)
 
@@ -118,7 +210,6 @@ class SettingsDialog(QDialog):
         h_fr = QHBoxLayout()
         h_fr.addWidget(QLabel("Friends (comma-separated):"))
         self.le_friends = QLineEdit(self)
-        self.le_friends.setText(", ".join(friends or []))
         h_fr.addWidget(self.le_friends, 1)
         v.addLayout(h_fr)
 
@@ -126,22 +217,18 @@ class SettingsDialog(QDialog):
 
         # Auto-connect toggle
         self.chk_autoc = QCheckBox("Auto-connect on startup", self)
-        self.chk_autoc.setChecked(bool(autoconnect))
         v.addWidget(self.chk_autoc)
 
         # Auto-negotiate IRCv3 features
         self.chk_auto_neg = QCheckBox("Auto-negotiate IRCv3 features", self)
-        self.chk_auto_neg.setChecked(bool(auto_negotiate))
         v.addWidget(self.chk_auto_neg)
 
         # Prefer TLS/STARTTLS
         self.chk_prefer_tls = QCheckBox("Prefer TLS/STARTTLS", self)
-        self.chk_prefer_tls.setChecked(bool(prefer_tls))
         v.addWidget(self.chk_prefer_tls)
 
         # Try STARTTLS when available (requires server support)
         self.chk_try_starttls = QCheckBox("Try STARTTLS when available", self)
-        self.chk_try_starttls.setChecked(bool(try_starttls))
         v.addWidget(self.chk_try_starttls)
 
         # --- History / Scrollback retention ---
@@ -149,9 +236,6 @@ class SettingsDialog(QDialog):
         row_hist1.addWidget(QLabel("Scrollback TTL (days, 0 = disabled):"))
         self.sp_ttl_days = QSpinBox(self)
         self.sp_ttl_days.setRange(0, 3650)
-        self.sp_ttl_days.setValue(
-            int(0 if scrollback_ttl_days is None else max(0, int(scrollback_ttl_days)))
-        )
         row_hist1.addWidget(self.sp_ttl_days)
         row_hist1.addStretch(1)
         v.addLayout(row_hist1)
@@ -160,15 +244,99 @@ class SettingsDialog(QDialog):
         row_hist2.addWidget(QLabel("Max scrollback files (0 = unlimited):"))
         self.sp_max_files = QSpinBox(self)
         self.sp_max_files.setRange(0, 10000)
-        self.sp_max_files.setValue(
-            int(0 if scrollback_max_files is None else max(0, int(scrollback_max_files)))
-        )
         row_hist2.addWidget(self.sp_max_files)
         row_hist2.addStretch(1)
         v.addLayout(row_hist2)
 
-        # --- Sounds tab ---
-        pg_sounds = QDialog(self)
+        # --- Sounds tab (built on first activation) ---
+        self._tabs = tabs
+        self._sounds_index = tabs.addTab(QWidget(self), "Sounds")
+        # All connections in this dialog are same-thread; connect them Direct
+        direct = Qt.ConnectionType.DirectConnection
+        tabs.currentChanged.connect(self._maybe_build_sounds, direct)
+
+        # Buttons
+        btns = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel, self
+        )
+        vroot.addWidget(btns)
+        btns.accepted.connect(self.accept, direct)
+        btns.rejected.connect(self.reject, direct)
+        self.btn_font.clicked.connect(self._choose_font, direct)
+        self._seed_general()
+
+    def _seed_general(self) -> None:
+        """Write _init_args into the General tab widgets."""
+        a = self._init_args
+        theme_options = list(a["theme_options"] or [])
+        # Fill the model in one batch with signals off, then select by known index
+        self.cmb_theme.blockSignals(True)
+        if theme_options != self._theme_options:
+            self.cmb_theme.clear()
+            model = self.cmb_theme.model()
+            model.insertRows(0, len(theme_options))
+            for i, name in enumerate(theme_options):
+                model.setData(model.index(i, 0), name)
+            self._theme_options = theme_options
+        cur = a["current_theme"]
+        if cur and cur in theme_options:
+            self.cmb_theme.setCurrentIndex(theme_options.index(cur))
+        self.cmb_theme.blockSignals(False)
+        self.sld_opacity.setValue(int(a["opacity"] * 100))
+        self.le_font.setText(_fmt_font(a["font_family"], a["font_point_size"]))
+        self.chk_wrap.setChecked(a["word_wrap"])
+        self.chk_ts.setChecked(a["show_timestamps"])
+        # Empty lists (the first-run case) leave a fresh field untouched
+        lists = ((self.le_highlight, a["highlight_words"]), (self.le_friends, a["friends"]))
+        for le, words in lists:
+            if words:
+                le.setText(", ".join(words))
+            elif le.text():
+                le.clear()  # reused dialog: drop the previous open's list
+        self.chk_autoc.setChecked(bool(a["autoconnect"]))
+        self.chk_auto_neg.setChecked(bool(a["auto_negotiate"]))
+        self.chk_prefer_tls.setChecked(bool(a["prefer_tls"]))
+        self.chk_try_starttls.setChecked(bool(a["try_starttls"]))
+        ttl_days = a["scrollback_ttl_days"]
+        self.sp_ttl_days.setValue(int(0 if ttl_days is None else max(0, int(ttl_days))))
+        max_files = a["scrollback_max_files"]
+        self.sp_max_files.setValue(int(0 if max_files is None else max(0, int(max_files))))
+
+    def reset(self, **kwargs) -> None:
+        """Re-seed a reused dialog with fresh constructor-style values before exec()."""
+        for k, val in kwargs.items():
+            if k in self._init_args:
+                self._init_args[k] = val
+            elif k in self._sounds_init:
+                self._sounds_init[k] = val
+            else:
+                raise TypeError(f"reset() got an unexpected keyword argument {k!r}")
+        self._font_family = self._init_args["font_family"]
+        self._font_pt = self._init_args["font_point_size"] or 0
+        if self._built:
+            self._seed_general()
+        if self._sounds_built:
+            self._seed_sounds()
+
+    def _maybe_build_sounds(self, idx: int) -> None:
+        if idx != self._sounds_index or self._sounds_built:
+            return
+        self._sounds_built = True
+        tabs = self._tabs
+        tabs.setUpdatesEnabled(False)
+        try:
+            page = self._build_sounds_tab()
+            placeholder = tabs.widget(idx)
+            tabs.removeTab(idx)
+            tabs.insertTab(idx, page, "Sounds")
+            tabs.setCurrentIndex(idx)
+        finally:
+            tabs.setUpdatesEnabled(True)
+        if placeholder is not None:
+            placeholder.deleteLater()
+
+    def _build_sounds_tab(self) -> QWidget:
+        pg_sounds = QWidget(self)
         vs = QVBoxLayout(pg_sounds)
         vs.setContentsMargins(8, 8, 8, 8)
         vs.setSpacing(10)
@@ -180,162 +348,217 @@ class SettingsDialog(QDialog):
         self.chk_toast = QCheckBox("Toast", self)
         self.chk_tray = QCheckBox("Tray", self)
         self.chk_sound = QCheckBox("Sound", self)
-        if notify_toast is not None:
-            self.chk_toast.setChecked(bool(notify_toast))
-        if notify_tray is not None:
-            self.chk_tray.setChecked(bool(notify_tray))
-        if notify_sound is not None:
-            self.chk_sound.setChecked(bool(notify_sound))
         row_notif.addWidget(self.chk_toast)
         row_notif.addWidget(self.chk_tray)
         row_notif.addWidget(self.chk_sound)
         row_notif.addStretch(1)
-        form.addRow("Notifications:", self._row_widget(row_notif))
+        form.addRow("Notifications:", row_notif)
 
         # Sound pickers
-        def _mk_pick(label: str, current_path: str | None) -> tuple[QPushButton, QLineEdit]:
+        def _mk_pick(label: str) -> tuple[QPushButton, QLineEdit]:
             le = QLineEdit(self)
             le.setReadOnly(True)
-            if current_path:
-                le.setText(current_path)
             btn = QPushButton("Pick…", self)
             cont = QHBoxLayout()
             cont.addWidget(le, 1)
             cont.addWidget(btn)
-            form.addRow(label, self._row_widget(cont))
+            form.addRow(label, cont)
             return btn, le
 
-        self.btn_pick_msg, self.le_msg = _mk_pick("Message sound:", sound_msg_path)
-        self.btn_pick_hl, self.le_hl = _mk_pick("Highlight sound:", sound_hl_path)
-        self.btn_pick_pr, self.le_pr = _mk_pick("Friend online:", sound_presence_path)
+        self.btn_pick_msg, self.le_msg = _mk_pick("Message sound:")
+        self.btn_pick_hl, self.le_hl = _mk_pick("Highlight sound:")
+        self.btn_pick_pr, self.le_pr = _mk_pick("Friend online:")
 
-        def _connect_picker(btn: QPushButton, le: QLineEdit) -> None:
-            def run() -> None:
-                fn, _ = QFileDialog.getOpenFileName(
-                    self, "Choose Sound", filter="Sounds (*.wav *.ogg)"
-                )
-                if fn:
-                    le.setText(fn)
-
-            btn.clicked.connect(run)
-
-        _connect_picker(self.btn_pick_msg, self.le_msg)
-        _connect_picker(self.btn_pick_hl, self.le_hl)
-        _connect_picker(self.btn_pick_pr, self.le_pr)
+        direct = Qt.ConnectionType.DirectConnection
+        self.btn_pick_msg.clicked.connect(partial(self._pick_sound, self.le_msg), direct)
+        self.btn_pick_hl.clicked.connect(partial(self._pick_sound, self.le_hl), direct)
+        self.btn_pick_pr.clicked.connect(partial(self._pick_sound, self.le_pr), direct)
 
         # Presence toggle and volume
         row_pr = QHBoxLayout()
         self.chk_presence = QCheckBox("Enable friend-online sound", self)
-        if presence_sound_enabled is not None:
-            self.chk_presence.setChecked(bool(presence_sound_enabled))
         row_pr.addWidget(self.chk_presence)
         row_pr.addStretch(1)
-        form.addRow("Presence:", self._row_widget(row_pr))
+        form.addRow("Presence:", row_pr)
 
         row_vol = QHBoxLayout()
         self.sld_vol = QSlider(Qt.Orientation.Horizontal, self)
         self.sld_vol.setRange(0, 100)
-        curv = 70 if sound_volume is None else int(max(0.0, min(1.0, float(sound_volume))) * 100)
-        self.sld_vol.setValue(curv)
         row_vol.addWidget(self.sld_vol)
-        form.addRow("Volume:", self._row_widget(row_vol))
-
-        tabs.addTab(pg_sounds, "Sounds")
-
-        # Buttons
-        btns = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel, self
-        )
-        vroot.addWidget(btns)
-        btns.accepted.connect(self.accept)
-        btns.rejected.connect(self.reject)
-        self.btn_font.clicked.connect(self._choose_font)
-
-        self._font_family = font_family
-        self._font_pt = font_point_size or 0
-
-    def _row_widget(self, layout: QHBoxLayout) -> QWidget:
-        w = QDialog(self)
-        w.setLayout(layout)
-        return w
+        form.addRow("Volume:", row_vol)
+
+        self._seed_sounds()
+        return pg_sounds
+
+    def _seed_sounds(self) -> None:
+        """Write _sounds_init into the Sounds tab widgets."""
+        init = self._sounds_init
+        self.chk_toast.setChecked(bool(init["notify_toast"]))
+        self.chk_tray.setChecked(bool(init["notify_tray"]))
+        self.chk_sound.setChecked(bool(init["notify_sound"]))
+        self.chk_presence.setChecked(bool(init["presence_sound_enabled"]))
+        self.le_msg.setText(init["sound_msg_path"] or "")
+        self.le_hl.setText(init["sound_hl_path"] or "")
+        self.le_pr.setText(init["sound_presence_path"] or "")
+        self.sld_vol.setValue(_volume_percent(init["sound_volume"]))
+
+    def _pick_sound(self, le: QLineEdit, *_args) -> None:
+        dlg = self._sound_file_dialog()
+        if le.text():
+            dlg.selectFile(le.text())
+        if dlg.exec() == QDialog.DialogCode.Accepted:
+            files = dlg.selectedFiles()
+            if files:
+                le.setText(files[0])
+
+    def _sound_file_dialog(self) -> QFileDialog:
+        # One file dialog, created on first use and shared by the three sound pickers
+        if self._sound_picker is None:
+            from PyQt6.QtWidgets import QFileDialog
+
+            dlg = QFileDialog(self, "Choose Sound")
+            dlg.setNameFilter("Sounds (*.wav *.ogg)")
+            dlg.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._sound_picker = dlg
+        return self._sound_picker
 
     def _choose_font(self) -> None:
+        from PyQt6.QtWidgets import QFontDialog
+
         font, ok = QFontDialog.getFont(parent=self)
         if ok:
             self._font_family = font.family()
             self._font_pt = font.pointSize()
-            self.le_font.setText(f"{self._font_family}, {self._font_pt}pt")
+            self.le_font.setText(_fmt_font(self._font_family, self._font_pt))
+
+    def values(self) -> SettingsValues:
+        """Snapshot all settings, reading each widget once."""
+        self._ensure_ui()
+        fam, pt = self.selected_font()
+        return SettingsValues(
+            theme=self.cmb_theme.currentText() or None,
+            opacity=float(self.sld_opacity.value()) / 100.0,
+            font_family=fam,
+            font_point_size=pt,
+            highlight_words=_split_csv(self.le_highlight.text()),
+            friends=_split_csv(self.le_friends.text()),
+            word_wrap=self.chk_wrap.isChecked(),
+            show_timestamps=self.chk_ts.isChecked(),
+            autoconnect=self.chk_autoc.isChecked(),
+            auto_negotiate=self.chk_auto_neg.isChecked(),
+            prefer_tls=self.chk_prefer_tls.isChecked(),
+            try_starttls=self.chk_try_starttls.isChecked(),
+            # Sounds accessors fall back to the init values if the tab was never built
+            notify_toast=self.selected_notify_toast(),
+            notify_tray=self.selected_notify_tray(),
+            notify_sound=self.selected_notify_sound(),
+            presence_sound_enabled=self.selected_presence_sound_enabled(),
+            sound_msg=self.selected_sound_msg(),
+            sound_hl=self.selected_sound_hl(),
+            sound_presence=self.selected_sound_presence(),
+            sound_volume=self.selected_sound_volume(),
+            scrollback_ttl_days=int(self.sp_ttl_days.value()),
+            scrollback_max_files=int(self.sp_max_files.value()),
+        )
 
-    # Accessors
+    # Per-field accessors
     def selected_theme(self) -> str | None:
+        self._ensure_ui()
         return self.cmb_theme.currentText() or None
 
     def selected_opacity(self) -> float:
+        self._ensure_ui()
         return float(self.sld_opacity.value()) / 100.0
 
     def selected_font(self) -> tuple[str | None, int | None]:
         return self._font_family, (self._font_pt or None)
 
     def selected_highlight_words(self) -> list[str]:
-        return [w.strip() for w in self.le_highlight.text().split(",") if w.strip()]
+        self._ensure_ui()
+        return _split_csv(self.le_highlight.text())
 
     def selected_friends(self) -> list[str]:
-        return [w.strip() for w in self.le_friends.text().split(",") if w.strip()]
+        self._ensure_ui()
+        return _split_csv(self.le_friends.text())
 
     def selected_word_wrap(self) -> bool:
+        self._ensure_ui()
         return self.chk_wrap.isChecked()
 
     def selected_show_timestamps(self) -> bool:
+        self._ensure_ui()
         return self.chk_ts.isChecked()
 
     def selected_autoconnect(self) -> bool:
+        self._ensure_ui()
         return self.chk_autoc.isChecked()
 
     def selected_auto_negotiate(self) -> bool:
+        self._ensure_ui()
         return self.chk_auto_neg.isChecked()
 
     def selected_prefer_tls(self) -> bool:
+        self._ensure_ui()
         return self.chk_prefer_tls.isChecked()
 
     def selected_try_starttls(self) -> bool:
+        self._ensure_ui()
         return self.chk_try_starttls.isChecked()
 
-    # Sounds tab accessors
+    # Sounds tab accessors; the initial values stand in until the tab is first shown
     def selected_notify_toast(self) -> bool:
+        if not self._sounds_built:
+            return bool(self._sounds_init["notify_toast"])
         return self.chk_toast.isChecked()
 
     def selected_notify_tray(self) -> bool:
+        if not self._sounds_built:
+            return bool(self._sounds_init["notify_tray"])
         return self.chk_tray.isChecked()
 
     def selected_notify_sound(self) -> bool:
+        if not self._sounds_built:
+            return bool(self._sounds_init["notify_sound"])
         return self.chk_sound.isChecked()
 
     def selected_presence_sound_enabled(self) -> bool:
+        if not self._sounds_built:
+            return bool(self._sounds_init["presence_sound_enabled"])
         return self.chk_presence.isChecked()
 
     def selected_sound_msg(self) -> str | None:
+        if not self._sounds_built:
+            return (self._sounds_init["sound_msg_path"] or "").strip() or None
         t = self.le_msg.text().strip()
         return t or None
 
     def selected_sound_hl(self) -> str | None:
+        if not self._sounds_built:
+            return (self._sounds_init["sound_hl_path"] or "").strip() or None
         t = self.le_hl.text().strip()
         return t or None
 
     def selected_sound_presence(self) -> str | None:
+        if not self._sounds_built:
+            return (self._sounds_init["sound_presence_path"] or "").strip() or None
         t = self.le_pr.text().strip()
         return t or None
 
     def selected_sound_volume(self) -> float:
+        if not self._sounds_built:
+            return _volume_percent(self._sounds_init["sound_volume"]) / 100.0
         return float(self.sld_vol.value()) / 100.0
 
     # History / Scrollback accessors
     def selected_scrollback_ttl_days(self) -> int:
+        self._ensure_ui()
         try:
             return int(self.sp_ttl_days.value())
         except Exception:
             return 0
 
     def selected_scrollback_max_files(self) -> int:
+        self._ensure_ui()
         try:
             return int(self.sp_max_files.value())
         except Exception:
@@ -6,13 +6,11 @@ from PyQt6.QtWidgets import QDialog, QDialogButtonBox, QLabel, QLineEdit, QVBoxL
 class TopicDialog(QDialog):
     def __init__(self, channel: str, current_topic: str | None = None, parent=None) -> None:
         super().__init__(parent)
-        self.setWindowTitle(f"Edit Topic — {channel}")
         v = QVBoxLayout(self)
-        v.addWidget(QLabel(f"Channel: {channel}"))
+        self.lbl_chan = QLabel(self)
+        v.addWidget(self.lbl_chan)
         self.edit = QLineEdit(self)
         self.edit.setPlaceholderText("Enter new topic…")
-        if current_topic:
-            self.edit.setText(current_topic)
         v.addWidget(self.edit)
         btns = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel, parent=self
@@ -20,6 +18,21 @@ class TopicDialog(QDialog):
         btns.accepted.connect(self.accept)
         btns.rejected.connect(self.reject)
         v.addWidget(btns)
+        self.reset(channel, current_topic)
+
+    def reset(self, channel: str, current_topic: str | None = None) -> None:
+        """Point a reused dialog at another channel/topic before exec()."""
+        self.setWindowTitle(f"Edit Topic — {channel}")
+        self.lbl_chan.setText(f"Channel: {channel}")
+        self.edit.setText(current_topic or "")
+        self._cached: str | None = None
+
+    def accept(self) -> None:
+        # Read the field once when the dialog closes; value() serves this snapshot
+        self._cached = self.edit.text().strip()
+        super().accept()
 
     def value(self) -> str:
+        if self._cached is not None:
+            return self._cached
         return self.edit.text().strip()
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
-from PyQt6.QtCore import QPoint, QSettings, Qt
-from PyQt6.QtGui import QIcon, QPalette
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QPoint, QSettings, Qt
+from PyQt6.QtGui import QColor, QIcon, QPainter, QPalette, QPen, QPixmap
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
     QCheckBox,
     QComboBox,
     QDialog,
@@ -15,8 +18,7 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMessageBox,
     QPushButton,
     QSizePolicy,
@@ -24,9 +26,181 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
-from .server_editor_dialog import ServerEditorDialog
+from .server_editor_dialog import ServerEditorDialog, load_server_names, store_server_names
 from app.ui_pyqt6.delegates.elide_delegate import ElideDelegate
 
+# Decoded once per process; reopening the dialog reuses both
+_APP_ICON: QIcon | None = None
+_APP_ICON_PIXMAPS: dict[int, QPixmap] = {}
+
+# Pre-rendered soft shadow, drawn as a 9-slice border image around the card
+_CARD_SHADOW = Path(__file__).resolve().parents[2] / "resources" / "images" / "card_shadow.png"
+_SHADOW_QSS = (
+    "#WelcomeShadow { border-width: 20px; "
+    f'border-image: url("{_CARD_SHADOW.as_posix()}") 20 20 20 20 stretch stretch; }}'
+)
+
+
+@lru_cache(maxsize=16)
+def _std_icon(pix: QStyle.StandardPixmap) -> QIcon:
+    """Standard style icon, rasterized once per process."""
+    return QApplication.style().standardIcon(pix)
+
+
+# Discord color palette for the welcome card
+_CARD_PALETTE = {
+    "bg": "#36393f",
+    "border": "#202225",
+    "text": "#dcddde",
+    "highlight": "#5865F2",
+    "base": "#ffffff",
+    "danger": "#ed4245",
+    "secondary_bg": "#4f545c",
+    "input_bg": "#2f3136",
+}
+
+# The card's own rounded background is painted by _WelcomeCard, not QSS
+_CARD_QSS_TMPL = """#WelcomeCard QGroupBox {{ color: #b9bbbe; font-weight: 600; margin-top: 8px; }}
+    #WelcomeCard QGroupBox::title {{ subcontrol-origin: margin; left: 6px; padding: 0 2px; }}
+    #WelcomeCard QLabel {{ color: {text}; }}
+    #WelcomeCard QListView {{
+        background: {input_bg};
+        border: 1px solid {border};
+        border-radius: 4px;
+    }}
+    #WelcomeCard QListView::item {{ color: {text}; padding: 4px; }}
+    #WelcomeCard QListView::item:selected {{
+        background: {highlight};
+        color: {base};
+    }}
+    #WelcomeCard QPushButton {{
+        border-radius: 4px;
+        padding: 8px 12px;
+        font-weight: 500;
+        border: none;
+    }}
+    #WelcomeCard QPushButton[class='primary'] {{ background: {highlight}; color: {base}; }}
+    #WelcomeCard QPushButton[class='secondary'] {{ background: {secondary_bg}; color: {text}; }}
+    #WelcomeCard QPushButton[class='danger'] {{ background: {danger}; color: {base}; }}
+    #WelcomeCard QComboBox, #WelcomeCard QComboBox QLineEdit {{
+        background: {input_bg};
+        color: {text};
+        border: 1px solid {border};
+        border-radius: 4px;
+        padding: 4px;
+    }}
+    #WelcomeCard QCheckBox {{ color: {text}; }}
+    """
+
+
+@lru_cache(maxsize=4)
+def _card_qss(palette: tuple[tuple[str, str], ...]) -> str:
+    """Format the card stylesheet once per palette."""
+    return _CARD_QSS_TMPL.format_map(dict(palette))
+
+
+class _WelcomeCard(QFrame):
+    """Card frame whose rounded background + border is a cached pixmap blit."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._bg_cache: QPixmap | None = None
+
+    def resizeEvent(self, e) -> None:
+        self._bg_cache = None
+        super().resizeEvent(e)
+
+    def paintEvent(self, e) -> None:
+        if self._bg_cache is None:
+            self._bg_cache = self._render_bg()
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._bg_cache)
+        p.end()
+
+    def _render_bg(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        pm = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(QPen(QColor(_CARD_PALETTE["border"]), 1))
+        p.setBrush(QColor(_CARD_PALETTE["bg"]))
+        p.drawRoundedRect(self.rect().toRectF().adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+        p.end()
+        return pm
+
+
+class ServerListModel(QAbstractListModel):
+    """Saved-server names; host/port are read from QSettings only for rows that get painted."""
+
+    def __init__(self, settings: QSettings, parent=None) -> None:
+        super().__init__(parent)
+        self._settings = settings
+        self._names: list[str] = []
+        self._name_to_row: dict[str, int] = {}
+        self._labels: dict[int, str] = {}
+
+    def reload(self, names: list[str]) -> None:
+        self.beginResetModel()
+        self._names = list(names)
+        self._name_to_row = {n: i for i, n in enumerate(self._names)}
+        self._labels = {}
+        self.endResetModel()
+
+    def row_of(self, name: str) -> int | None:
+        return self._name_to_row.get(name)
+
+    def upsert(self, old_name: str | None, name: str, host: str, port: int) -> int:
+        """Apply one add/edit in place, in the order the editor stores names; return the row."""
+        label = f"{name}  —  {host}:{port}"
+        row = self._name_to_row.get(old_name) if old_name else None
+        if row is None:
+            row = self._name_to_row.get(name)
+        if row is None:
+            row = len(self._names)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._names.append(name)
+            self._name_to_row[name] = row
+            self._labels[row] = label
+            self.endInsertRows()
+        else:
+            self._name_to_row.pop(self._names[row], None)
+            self._names[row] = name
+            self._name_to_row[name] = row
+            self._labels[row] = label
+            idx = self.index(row, 0)
+            self.dataChanged.emit(idx, idx)
+        return row
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.UserRole:
+            return self._names[row]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self._label(row)
+        return None
+
+    def _label(self, row: int) -> str:
+        text = self._labels.get(row)
+        if text is None:
+            name = self._names[row]
+            s = self._settings
+            # The handle is shared with the dialog, so always close the group again
+            s.beginGroup(f"servers/{name}")
+            try:
+                host = s.value("host", "", str) or ""
+                port = int(s.value("port", 6697))
+            finally:
+                s.endGroup()
+            text = self._labels[row] = f"{name}  —  {host}:{port}"
+        return text
+
 
 class WelcomeDialog(QDialog):
     """DeadHop branded welcome/splash dialog.
@@ -37,6 +211,11 @@ class WelcomeDialog(QDialog):
       - Choose an AI model and whether to enable it for this session
     """
 
+    # One QSettings handle for every welcome dialog in the process
+    _settings: QSettings | None = None
+    # Stateless and never edits, so one instance serves every dialog's list
+    _ELIDE_DELEGATE: ElideDelegate | None = None
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Welcome to DeadHop")
@@ -52,14 +231,28 @@ class WelcomeDialog(QDialog):
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         # Ensure it has a visible footprint
         self.setMinimumSize(600, 460)
+        # Frameless drag state (see mouse*Event)
+        self._drag_pos = QPoint(0, 0)
+        self._dragging = False
 
         # Root layout (compact, responsive)
         root = QVBoxLayout(self)
-        root.setContentsMargins(16, 16, 16, 16)
         root.setSpacing(10)
+        card_host = root
+        if _CARD_SHADOW.exists():
+            # The border-image is a plain blit; no offscreen blur pass on repaint
+            root.setContentsMargins(0, 0, 0, 0)
+            shadow_frame = QFrame(self)
+            shadow_frame.setObjectName("WelcomeShadow")
+            shadow_frame.setStyleSheet(_SHADOW_QSS)
+            card_host = QVBoxLayout(shadow_frame)
+            card_host.setContentsMargins(0, 0, 0, 0)
+            root.addWidget(shadow_frame)
+        else:
+            root.setContentsMargins(16, 16, 16, 16)
 
         # Themed card container (inherits palette from qt-material)
-        card = QFrame(self)
+        card = _WelcomeCard(self)
         card.setObjectName("WelcomeCard")
         card.setFrameShape(QFrame.Shape.NoFrame)
         card.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -69,12 +262,15 @@ class WelcomeDialog(QDialog):
         card_layout.setContentsMargins(16, 16, 16, 16)
         card_layout.setSpacing(10)
 
-        # Soft drop shadow on the card
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setOffset(0, 4)
-        shadow.setColor(self.palette().color(QPalette.ColorRole.Shadow))
-        card.setGraphicsEffect(shadow)
+        # Soft drop shadow on the card (fallback when the shadow image is missing);
+        # a transparent Shadow role would make the blur pass pure waste
+        shadow_color = self.palette().color(QPalette.ColorRole.Shadow)
+        if card_host is root and shadow_color.alpha() > 0:
+            shadow = QGraphicsDropShadowEffect(self)
+            shadow.setBlurRadius(20)
+            shadow.setOffset(0, 4)
+            shadow.setColor(shadow_color)
+            card.setGraphicsEffect(shadow)
 
         # Branding header
         header = QHBoxLayout()
@@ -84,7 +280,10 @@ class WelcomeDialog(QDialog):
         icon = self._app_icon()
         if not icon.isNull():
             logical = self.fontMetrics().height() * 4
-            icon_label.setPixmap(icon.pixmap(logical, logical))
+            pm = _APP_ICON_PIXMAPS.get(logical)
+            if pm is None:
+                pm = _APP_ICON_PIXMAPS[logical] = icon.pixmap(logical, logical)
+            icon_label.setPixmap(pm)
         header.addWidget(icon_label)
 
         branding = QVBoxLayout()
@@ -106,8 +305,11 @@ class WelcomeDialog(QDialog):
         srv_layout.setContentsMargins(8, 8, 8, 8)
         srv_layout.setHorizontalSpacing(8)
         srv_layout.setVerticalSpacing(6)
-        self.server_list = QListWidget()
-        self.server_list.setItemDelegate(ElideDelegate(self.server_list))
+        self.server_model = ServerListModel(self._qsettings(), self)
+        self.server_list = QListView()
+        self.server_list.setModel(self.server_model)
+        self.server_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.server_list.setItemDelegate(self._elide_delegate())
         self.server_list.setUniformItemSizes(True)
         self.server_list.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         srv_layout.addWidget(self.server_list, 0, 0, 4, 1)
@@ -117,20 +319,17 @@ class WelcomeDialog(QDialog):
         self.btn_add = QPushButton("+")
         self.btn_add.setToolTip("Add a new server")
         self.btn_edit = QPushButton(
-            self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView), " Edit"
+            _std_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView), " Edit"
         )
         # self.btn_edit enabled by default
         self.btn_del = QPushButton("-")
         self.btn_del.setToolTip("Delete selected server")
         self.btn_connect = QPushButton("Connect")
         # Apply styling classes now that buttons exist
-        try:
-            self.btn_connect.setProperty("class", "primary")
-            self.btn_add.setProperty("class", "secondary")
-            self.btn_edit.setProperty("class", "secondary")
-            self.btn_del.setProperty("class", "danger")
-        except Exception:
-            pass
+        self.btn_connect.setProperty("class", "primary")
+        self.btn_add.setProperty("class", "secondary")
+        self.btn_edit.setProperty("class", "secondary")
+        self.btn_del.setProperty("class", "danger")
         btns_col.addWidget(self.btn_add)
         btns_col.addWidget(self.btn_edit)
         btns_col.addWidget(self.btn_del)
@@ -145,13 +344,9 @@ class WelcomeDialog(QDialog):
         ai_layout.setContentsMargins(8, 8, 8, 8)
         ai_layout.setHorizontalSpacing(8)
         ai_layout.setVerticalSpacing(6)
-        ai_layout.addWidget(QLabel("Model:"), 0, 0)
-        self.cmb_model = QComboBox()
-        self.cmb_model.setEditable(True)
-        self.cmb_model.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        ai_layout.addWidget(self.cmb_model, 0, 1)
-        self.chk_ai = QCheckBox("Enable AI this session")
-        ai_layout.addWidget(self.chk_ai, 1, 0, 1, 2)
+        # Model combo and checkbox are built on first show (_build_ai_section)
+        self._ai_layout = ai_layout
+        self._ai_built = False
         card_layout.addWidget(ai_box)
 
         # ----- Dialog buttons -----
@@ -161,37 +356,32 @@ class WelcomeDialog(QDialog):
         self._style_primary_button()
         card_layout.addWidget(self.dbb)
 
-        root.addWidget(card)
+        card_host.addWidget(card)
 
         # ----- Load data and wire signals -----
         self._load_ai_prefs()
         self._populate_servers()
         self._wire_signals()
-
-        # Center on the active screen (after sizing)
-        try:
-            self.adjustSize()
-            geo = self.frameGeometry()
-            scr = self.screen()
-            if scr is not None:
-                geo.moveCenter(scr.availableGeometry().center())
-                self.move(geo.topLeft())
-        except Exception:
-            pass
+        # Centered on the first showEvent, once the layout has been sized
+        self._centered = False
 
     # ----- Public API -----
     @property
     def selected_server_name(self) -> str | None:
-        if (items := self.server_list.selectedItems()) and items:
-            return items[0].data(Qt.ItemDataRole.UserRole)
+        if rows := self.server_list.selectionModel().selectedRows():
+            return rows[0].data(Qt.ItemDataRole.UserRole)
         return None
 
     @property
     def ai_enabled(self) -> bool:
+        if not self._ai_built:
+            return self._loaded_ai_enabled
         return self.chk_ai.isChecked()
 
     @property
     def ai_model(self) -> str:
+        if not self._ai_built:
+            return self._loaded_ai_model
         return self.cmb_model.currentText()
 
     # ----- Setup & Teardown -----
@@ -200,67 +390,121 @@ class WelcomeDialog(QDialog):
         self.btn_edit.clicked.connect(self._on_edit)
         self.btn_del.clicked.connect(self._on_delete)
         self.btn_connect.clicked.connect(self.accept)
-        self.server_list.itemDoubleClicked.connect(self.accept)
+        self.server_list.doubleClicked.connect(self.accept)
         self.dbb.accepted.connect(self.accept)
         self.dbb.rejected.connect(self.reject)
 
+    def setVisible(self, visible: bool) -> None:
+        # Before Qt polishes and lays out the tree, so the AI widgets show with it
+        if visible and not self._ai_built:
+            self._build_ai_section()
+        super().setVisible(visible)
+
+    def showEvent(self, e) -> None:
+        if not self._centered:
+            self._centered = True
+            # setMinimumSize marks the window resized, so Qt won't fit it to the layout itself
+            self.adjustSize()
+            scr = self.screen()
+            if scr is not None:
+                geo = self.frameGeometry()
+                geo.moveCenter(scr.availableGeometry().center())
+                self.move(geo.topLeft())
+        super().showEvent(e)
+
+    def _build_ai_section(self) -> None:
+        self._ai_built = True
+        ai_layout = self._ai_layout
+        ai_layout.addWidget(QLabel("Model:"), 0, 0)
+        self.cmb_model = QComboBox()
+        self.cmb_model.setEditable(True)
+        self.cmb_model.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        ai_layout.addWidget(self.cmb_model, 0, 1)
+        self.chk_ai = QCheckBox("Enable AI this session")
+        ai_layout.addWidget(self.chk_ai, 1, 0, 1, 2)
+        # The tree is still hidden, so the group box's cached size hint must be dropped by hand
+        ai_layout.parentWidget().updateGeometry()
+        self._seed_ai()
+
     def accept(self) -> None:
         self.persist_ai_prefs()
+        self._qsettings().sync()
         super().accept()
 
     def reject(self) -> None:
         self.persist_ai_prefs()
+        self._qsettings().sync()
         super().reject()
 
     # ----- Data Loading & Persistence -----
+    def _qsettings(self) -> QSettings:
+        if WelcomeDialog._settings is None:
+            WelcomeDialog._settings = QSettings("DeadHop", "DeadHopClient")
+        return WelcomeDialog._settings
+
+    @classmethod
+    def _elide_delegate(cls) -> ElideDelegate:
+        if cls._ELIDE_DELEGATE is None:
+            cls._ELIDE_DELEGATE = ElideDelegate(QApplication.instance())
+        return cls._ELIDE_DELEGATE
+
     def _app_icon(self) -> QIcon:
-        p = Path(__file__).parent.parent.parent / "assets/icon.png"
-        if p.exists():
-            return QIcon(str(p))
-        return QIcon()
+        global _APP_ICON
+        if _APP_ICON is None:
+            p = Path(__file__).parent.parent.parent / "assets/icon.png"
+            _APP_ICON = QIcon(str(p)) if p.exists() else QIcon()
+        return _APP_ICON
 
     def _populate_servers(self) -> None:
-        self.server_list.clear()
-        s = QSettings("DeadHop", "DeadHopClient")
-        names = s.value("servers/names", [], list) or []
-        for name in names:
-            base = f"servers/{name}"
-            host = s.value(f"{base}/host", "", str) or ""
-            port = int(s.value(f"{base}/port", 6697))
-            display_text = f"{name}  —  {host}:{port}"
-            item = QListWidgetItem(display_text)
-            item.setToolTip(display_text)
-            item.setData(Qt.ItemDataRole.UserRole, name)
-            self.server_list.addItem(item)
-        if self.server_list.count() > 0:
-            self.server_list.setCurrentRow(0)
+        # One model reset; row text is formatted lazily as rows become visible.
+        # Re-read from disk here so edits made outside store_server_names show up.
+        self.server_model.reload(load_server_names(self._qsettings(), refresh=True))
+        if self.server_model.rowCount() > 0:
+            self._select_row(0)
+
+    def _select_row(self, row: int) -> None:
+        self.server_list.setCurrentIndex(self.server_model.index(row, 0))
 
     def _load_ai_prefs(self) -> None:
-        s = QSettings("DeadHop", "DeadHopClient")
-        model = s.value("ai/model", "llama3", str) or "llama3"
-        enabled = s.value("ai/enabled", False, bool)
+        s = self._qsettings()
+        # What is on disk now; persist_ai_prefs only writes keys that differ
+        self._loaded_ai_model = s.value("ai/model", "llama3", str) or "llama3"
+        self._loaded_ai_enabled = bool(s.value("ai/enabled", False, bool))
+        if self._ai_built:
+            self._seed_ai()
+
+    def _seed_ai(self) -> None:
+        model = self._loaded_ai_model
         i = self.cmb_model.findText(model)
         if i >= 0:
             self.cmb_model.setCurrentIndex(i)
         else:
             self.cmb_model.setEditText(model)
-        self.chk_ai.setChecked(enabled)
+        self.chk_ai.setChecked(self._loaded_ai_enabled)
 
     def persist_ai_prefs(self) -> None:
-        s = QSettings("DeadHop", "DeadHopClient")
-        s.setValue("ai/model", self.ai_model)
-        s.setValue("ai/enabled", self.ai_enabled)
+        model, enabled = self.ai_model, self.ai_enabled
+        if model == self._loaded_ai_model and enabled == self._loaded_ai_enabled:
+            return
+        s = self._qsettings()
+        # One group for both keys; accept()/reject() flush with a single sync
+        s.beginGroup("ai")
+        try:
+            if model != self._loaded_ai_model:
+                s.setValue("model", model)
+                self._loaded_ai_model = model
+            if enabled != self._loaded_ai_enabled:
+                s.setValue("enabled", enabled)
+                self._loaded_ai_enabled = enabled
+        finally:
+            s.endGroup()
 
     # ----- Event Handlers -----
     def _on_add(self) -> None:
         dlg = ServerEditorDialog(self)
         if dlg.exec():
-            self._populate_servers()
-            # Select the newly added server
-            for i in range(self.server_list.count()):
-                if self.server_list.item(i).data(Qt.ItemDataRole.UserRole) == dlg.name:
-                    self.server_list.setCurrentRow(i)
-                    break
+            # The editor already knows the new row; no need to re-read QSettings
+            self._select_row(self.server_model.upsert(None, dlg.name, dlg.host, dlg.port))
 
     def _on_edit(self) -> None:
         name = self.selected_server_name
@@ -268,12 +512,7 @@ class WelcomeDialog(QDialog):
             return
         dlg = ServerEditorDialog(self, name)
         if dlg.exec():
-            self._populate_servers()
-            # Reselect the edited server
-            for i in range(self.server_list.count()):
-                if self.server_list.item(i).data(Qt.ItemDataRole.UserRole) == dlg.name:
-                    self.server_list.setCurrentRow(i)
-                    break
+            self._select_row(self.server_model.upsert(name, dlg.name, dlg.host, dlg.port))
 
     def _on_delete(self) -> None:
         name = self.selected_server_name
@@ -292,63 +531,19 @@ class WelcomeDialog(QDialog):
         ):
             return
 
-        s = QSettings("DeadHop", "DeadHopClient")
-        names = [n for n in (s.value("servers/names", [], list) or []) if n != name]
-        s.setValue("servers/names", names)
+        s = self._qsettings()
+        # Cached names are current: writes go through store_server_names
+        names = [n for n in load_server_names(s) if n != name]
+        # Both mutations back to back, then one flush
+        store_server_names(s, names)
         s.remove(f"servers/{name}")
+        s.sync()
         self._populate_servers()
 
     # ----- Styling Helpers -----
     def _apply_card_style(self, w: QFrame) -> None:
         """Style the inner card with a Discord-like theme."""
-        # Discord color palette
-        bg = "#36393f"
-        border = "#202225"
-        text = "#dcddde"
-        highlight = "#5865F2"
-        base = "#ffffff"
-        danger = "#ed4245"
-        secondary_bg = "#4f545c"
-        input_bg = "#2f3136"
-
-        w.setStyleSheet(
-            f"""#WelcomeCard {{
-                background: {bg};
-                border-radius: 8px;
-                border: 1px solid {border};
-            }}
-            #WelcomeCard QGroupBox {{ color: #b9bbbe; font-weight: 600; margin-top: 8px; }}
-            #WelcomeCard QGroupBox::title {{ subcontrol-origin: margin; left: 6px; padding: 0 2px; }}
-            #WelcomeCard QLabel {{ color: {text}; }}
-            #WelcomeCard QListWidget {{
-                background: {input_bg};
-                border: 1px solid {border};
-                border-radius: 4px;
-            }}
-            #WelcomeCard QListWidget::item {{ color: {text}; padding: 4px; }}
-            #WelcomeCard QListWidget::item:selected {{
-                background: {highlight};
-                color: {base};
-            }}
-            #WelcomeCard QPushButton {{
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-weight: 500;
-                border: none;
-            }}
-            #WelcomeCard QPushButton[class='primary'] {{ background: {highlight}; color: {base}; }}
-            #WelcomeCard QPushButton[class='secondary'] {{ background: {secondary_bg}; color: {text}; }}
-            #WelcomeCard QPushButton[class='danger'] {{ background: {danger}; color: {base}; }}
-            #WelcomeCard QComboBox, #WelcomeCard QComboBox QLineEdit {{
-                background: {input_bg};
-                color: {text};
-                border: 1px solid {border};
-                border-radius: 4px;
-                padding: 4px;
-            }}
-            #WelcomeCard QCheckBox {{ color: {text}; }}
-            """
-        )
+        w.setStyleSheet(_card_qss(tuple(_CARD_PALETTE.items())))
         # Do not touch button properties here; buttons may not yet exist
 
     def _style_primary_button(self) -> None:
@@ -366,9 +561,19 @@ class WelcomeDialog(QDialog):
     def mousePressEvent(self, e: QPoint) -> None:
         if e.buttons() & Qt.MouseButton.LeftButton:
             self._drag_pos = e.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            self._dragging = True
             e.accept()
 
     def mouseMoveEvent(self, e: QPoint) -> None:
-        if (e.buttons() & Qt.MouseButton.LeftButton) and hasattr(self, "_drag_pos"):
-            self.move(e.globalPosition().toPoint() - self._drag_pos)
-            e.accept()
+        if not self._dragging:
+            return
+        target = e.globalPosition().toPoint() - self._drag_pos
+        # Skip zero-delta moves; each move() dispatches a QMoveEvent
+        if target != self.pos():
+            self.move(target)
+        e.accept()
+
+    def mouseReleaseEvent(self, e: QPoint) -> None:
+        if e.button() == Qt.MouseButton.LeftButton:
+            self._dragging = False
+        super().mouseReleaseEvent(e)
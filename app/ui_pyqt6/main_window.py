@@ -2,11 +2,26 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import queue
 import re
 import shutil
 import time
-
-from PyQt6.QtCore import QByteArray, QSettings, QSize, Qt, QThread, QUrl
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from PyQt6.QtCore import (
+    QByteArray,
+    QMutex,
+    QMutexLocker,
+    QSettings,
+    QSize,
+    Qt,
+    QThread,
+    QTimer,
+    QUrl,
+)
 from PyQt6.QtGui import (
     QAction,
     QDesktopServices,
@@ -37,11 +52,12 @@ from PyQt6.QtWidgets import (
 
 from ..ai.ollama import is_server_up
 from .ai_worker import OllamaStreamWorker
-from .bridge import BridgeQt
+from .bridge import BridgeQt, composite
 from .dialogs.connect_dialog import ConnectDialog
 from .dialogs.emoji_picker import pick_emoji
 from .dialogs.giphy_dialog import pick_gif
 from .dialogs.modes_dialog import ModesDialog
+from .dialogs.server_editor_dialog import load_server_names, store_server_names
 from .dialogs.topic_dialog import TopicDialog
 from .widgets.composer import Composer
 from .widgets.find_bar import FindBar
@@ -56,9 +72,16 @@ try:
     from .theme import theme_manager as _theme_manager
 except Exception:
     _theme_manager = None
+try:
+    from qt_material import apply_stylesheet as _apply_stylesheet
+    from qt_material import list_themes as _list_themes
+except Exception:
+    _apply_stylesheet = None
+    _list_themes = None
 from pathlib import Path
 
 from ..logging.log_writer import LogWriter
+from ..logging.scrollback import ScrollbackStore
 
 # --- Icon utilities ---
 # Prefer filesystem icons placed under `app/resources/icons/custom/`.
@@ -66,153 +89,52 @@ _ICONS_DIR = Path(__file__).resolve().parents[1] / "resources" / "icons"
 _CUSTOM_ICONS_DIR = _ICONS_DIR / "custom"
 
 
-def _icon_from_fs(name: str) -> QIcon:
-    """Try to load an icon by base name from the custom icons folder.
+_ICON_EXTS = (".svg", ".png", ".ico", ".jpg", ".jpeg", ".bmp", ".webp")
+
 
-    Tries common name variants and file extensions.
+@lru_cache(maxsize=1)
+def _icon_index() -> dict[str, str]:
+    """Index the custom icons folder in one scandir: lowercase stem -> path, best extension first.
+
+    Built on first lookup; call ``_icon_index.cache_clear()`` after adding or removing icons.
     """
-    if not name:
-        return QIcon()
-    variants = {
-        name,
-        name.lower(),
-        name.replace(" ", "_").lower(),
-        name.replace(" ", "-").lower(),
-    }
-    exts = (".svg", ".png", ".ico", ".jpg", ".jpeg", ".bmp", ".webp")
+    rank = {ext: i for i, ext in enumerate(_ICON_EXTS)}
+    best: dict[str, tuple[int, str]] = {}
     try:
-        for base in variants:
-            for ext in exts:
-                p = _CUSTOM_ICONS_DIR / f"{base}{ext}"
-                if p.exists():
-                    return QIcon(str(p))
-    except Exception:
-        pass
+        with os.scandir(_CUSTOM_ICONS_DIR) as it:
+            for entry in it:
+                stem, ext = os.path.splitext(entry.name)
+                r = rank.get(ext.lower())
+                if r is None or not entry.is_file():
+                    continue
+                key = stem.lower()
+                cur = best.get(key)
+                if cur is None or r < cur[0]:
+                    best[key] = (r, entry.path)
+    except OSError:
+        return {}
+    return {k: path for k, (_, path) in best.items()}
 
-    def _on_friends_changed(self, friends: list[str]) -> None:
-        """Persist friends, push to bridge MONITOR, and resync presence maps."""
-        try:
-            s = QSettings("DeadHop", "DeadHopClient")
-            s.setValue("friends", list(friends or []))
-        except Exception:
-            pass
 
-        # Settings dialog launcher removed (was incorrectly added here)
-        # Update MONITOR list (async)
-        try:
-            self._schedule_async(self.bridge.setMonitorList, list(friends or []))
-        except Exception:
-            pass
-        # Trim avatar entries for removed friends (optional; keep non-friends avatars for members)
-        try:
-            # Keep as-is to allow member avatars even if not in friends
-            self.friends.set_avatars(self._avatar_map)
-        except Exception:
-            pass
+_QICON_CACHE: dict[str, QIcon] = {}
 
-    def _on_avatars_changed(self, avatars: dict) -> None:
-        """Receive avatar map from FriendsDock and propagate to views + persist."""
-        try:
-            self._avatar_map = dict(avatars or {})
-            # Push to widgets
-            try:
-                self.friends.set_avatars(self._avatar_map)
-            except Exception:
-                pass
-            # No settings dialog handling here; only update avatars in views and persist
-            try:
-                self.members.set_avatars(self._avatar_map)
-            except Exception:
-                pass
-            # Persist
-            try:
-                s = QSettings("DeadHop", "DeadHopClient")
-                s.setValue("avatars", dict(self._avatar_map))
-            except Exception:
-                pass
-        except Exception:
-            pass
 
-    def _on_monitor_online(self, nicks: list[str]) -> None:
-        if not nicks:
-            return
-        try:
-            self._online_set.update(n.strip() for n in nicks if n)
-            # Update views
-            try:
-                self.friends.set_presence(self._online_set)
-            except Exception:
-                pass
-            try:
-                self.members.set_presence(self._online_set)
-            except Exception:
-                pass
-            # Notifications
-            if getattr(self, "_notify_presence_online", True):
-                for n in nicks:
-                    msg = f"{n} is online"
-                    try:
-                        self.toast_host.show_toast(msg)
-                    except Exception:
-                        pass
-                    if getattr(self, "_notify_presence_system", True) and getattr(
-                        self, "tray", None
-                    ):
-                        try:
-                            self.tray.showMessage(
-                                "Friend online", msg, QSystemTrayIcon.MessageIcon.Information, 2500
-                            )
-                        except Exception:
-                            pass
-                    if getattr(self, "_notify_presence_sound", False):
-                        try:
-                            if self._sound_enabled:
-                                se = getattr(self, "_se_presence", None)
-                                if se:
-                                    se.play()
-                                else:
-                                    from PyQt6.QtWidgets import QApplication
-
-                                    QApplication.beep()
-                        except Exception:
-                            pass
-        except Exception:
-            pass
-
-    def _on_monitor_offline(self, nicks: list[str]) -> None:
-        if not nicks:
-            return
-        try:
-            self._online_set.difference_update(n.strip() for n in nicks if n)
-            # Update views
-            try:
-                self.friends.set_presence(self._online_set)
-            except Exception:
-                pass
-            try:
-                self.members.set_presence(self._online_set)
-            except Exception:
-                pass
-            # Notifications
-            if getattr(self, "_notify_presence_offline", False):
-                for n in nicks:
-                    msg = f"{n} went offline"
-                    try:
-                        self.toast_host.show_toast(msg)
-                    except Exception:
-                        pass
-                    if getattr(self, "_notify_presence_system", True) and getattr(
-                        self, "tray", None
-                    ):
-                        try:
-                            self.tray.showMessage(
-                                "Friend offline", msg, QSystemTrayIcon.MessageIcon.Warning, 2500
-                            )
-                        except Exception:
-                            pass
-        except Exception:
-            pass
+def _icon_from_fs(name: str) -> QIcon:
+    """Try to load an icon by base name from the custom icons folder.
 
+    Tries common name variants against the cached folder index.
+    """
+    if not name:
+        return QIcon()
+    index = _icon_index()
+    low = name.lower()
+    for base in (low, low.replace(" ", "_"), low.replace(" ", "-")):
+        path = index.get(base)
+        if path:
+            ic = _QICON_CACHE.get(path)
+            if ic is None:
+                ic = _QICON_CACHE[path] = QIcon(path)
+            return ic
     return QIcon()
 
 
@@ -222,6 +144,11 @@ def get_icon(names: list[str] | tuple[str, ...], awesome_fallback: str | None =
     names: ordered list of candidate base names (without extension).
     awesome_fallback: qtawesome name like 'fa5s.plug' (optional).
     """
+    return _get_icon(tuple(names), awesome_fallback)
+
+
+@lru_cache(maxsize=512)
+def _get_icon(names: tuple[str, ...], awesome_fallback: str | None) -> QIcon:
     # Prefer themed icon via qtawesome if provided
     if awesome_fallback:
         try:
@@ -243,22 +170,307 @@ def get_icon(names: list[str] | tuple[str, ...], awesome_fallback: str | None =
     return QIcon()
 
 
+_APP_ICON: QIcon | None = None
+
+
+def _app_icon() -> QIcon:
+    """Resolve the application icon once: custom app/logo icon, else the first bundled one."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        icon = get_icon(["app", "logo", "deadhop"])
+        if icon.isNull():
+            try:
+                for ext in (".ico", ".png", ".svg"):  # prefer .ico
+                    found = sorted(_ICONS_DIR.glob(f"*{ext}"))
+                    if found:
+                        icon = QIcon(str(found[0]))
+                        break
+            except Exception:
+                pass
+        _APP_ICON = icon
+    return _APP_ICON
+
+
+@lru_cache(maxsize=1)
+def _material_themes() -> tuple[str, ...]:
+    """qt-material theme file names, listed once per process (empty if unavailable)."""
+    if _list_themes is None:
+        return ()
+    try:
+        return tuple(_list_themes())
+    except Exception:
+        return ()
+
+
+# --- Nick colors ---
+def _hsl_hex(h: float, s: float, light: float) -> str:
+    """Convert HSL (approx) to a CSS hex color."""
+    c = (1 - abs(2 * light - 1)) * s
+    x = c * (1 - abs(((h / 60) % 2) - 1))
+    m = light - c / 2
+    if 0 <= h < 60:
+        r, g, b = c, x, 0
+    elif 60 <= h < 120:
+        r, g, b = x, c, 0
+    elif 120 <= h < 180:
+        r, g, b = 0, c, x
+    elif 180 <= h < 240:
+        r, g, b = 0, x, c
+    elif 240 <= h < 300:
+        r, g, b = x, 0, c
+    else:
+        r, g, b = c, 0, x
+    R = int((r + m) * 255)
+    G = int((g + m) * 255)
+    B = int((b + m) * 255)
+    return f"#{R:02x}{G:02x}{B:02x}"
+
+
+# One color per hue at fixed saturation/lightness
+_HUE_LUT = tuple(_hsl_hex(hue, 0.65, 0.6) for hue in range(360))
+
+
+@lru_cache(maxsize=4096)
+def _nick_hex(nick: str) -> str:
+    """Stable color for a lowercased nick: string hash -> hue -> lookup table."""
+    h = 0
+    for b in nick.encode("utf-8"):
+        h = (h * 131 + b) & 0xFFFFFFFF
+    return _HUE_LUT[h % 360]
+
+
+# --- Per-channel state ---
+SCROLLBACK_LIMIT = 1000
+STATUS_LINES_LIMIT = 500
+
+
+@dataclass
+class ChannelState:
+    """Everything MainWindow tracks for one channel label, in one object."""
+
+    # Bounded: appending past the limit evicts the oldest line
+    scrollback: deque[str] = field(default_factory=lambda: deque(maxlen=SCROLLBACK_LIMIT))
+    unread: int = 0
+    highlights: int = 0
+    names: list[str] = field(default_factory=list)
+
+
+@lru_cache(maxsize=1)
+def _scrollback_root() -> str | None:
+    """Create and return the scrollback folder, resolved once per process.
+
+    Prefers AppDataLocation; falls back to resources/scrollback; None disables persistence.
+    """
+    try:
+        from PyQt6.QtCore import QStandardPaths
+
+        base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+    except Exception:
+        base = None
+    try:
+        if base:
+            p = Path(base) / "scrollback"
+        else:
+            p = Path(__file__).resolve().parents[1] / "resources" / "scrollback"
+        p.mkdir(parents=True, exist_ok=True)
+        return str(p)
+    except Exception:
+        return None
+
+
+# --- Bundled sounds ---
+_SOUNDS_DIR = Path(__file__).resolve().parents[1] / "resources" / "sounds"
+
+
+_SOUND_EXTS = (".wav", ".ogg")
+
+
+def _sound_ok(p: str) -> bool:
+    """True for paths QSoundEffect can play (WAV/OGG)."""
+    return p.lower().endswith(_SOUND_EXTS)
+
+
+@lru_cache(maxsize=1)
+def _sound_files() -> tuple[tuple[str, str], ...]:
+    """Bundled .wav/.ogg files as (lowercase file name, path), scanned once per process."""
+    if not _SOUNDS_DIR.exists():
+        return ()
+    paths = [*_SOUNDS_DIR.glob("*.wav"), *_SOUNDS_DIR.glob("*.ogg")]
+    return tuple((p.name.lower(), str(p)) for p in paths)
+
+
+# --- Settings cache ---
+_MISSING = object()
+
+
+class _SettingsWriter(QThread):
+    """Drains queued (key, value) writes into a thread-owned QSettings, one sync per batch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._queue: queue.Queue = queue.Queue()
+        self._running = True
+
+    def post(self, key: str, value) -> None:
+        self._queue.put((key, value))
+
+    def drain(self) -> None:
+        """Block until every posted write has been synced."""
+        self._queue.join()
+
+    def stop(self) -> None:
+        """Write out everything queued so far, then end the thread. Safe to call twice."""
+        if not self._running:
+            return
+        self._running = False
+        self._queue.put(None)  # sentinel: finish this batch, then exit
+        self.wait()
+
+    def run(self) -> None:
+        qs = QSettings("DeadHop", "DeadHopClient")
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            try:
+                while True:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                for item in batch:
+                    if item is None:
+                        stopping = True
+                        continue
+                    qs.setValue(*item)
+                qs.sync()
+            except Exception:
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+class _SettingsCache:
+    """Shared settings with an in-memory read cache; writes go to a background writer.
+
+    Keys read through here should also be written through here; the cache does not
+    see writes made on other QSettings instances.
+    """
+
+    def __init__(self) -> None:
+        self._qs = QSettings("DeadHop", "DeadHopClient")
+        self._lock = QMutex()
+        self._cache: dict[tuple[str, type | None], object] = {}
+        self._written: dict[str, object] = {}
+        self._writer: _SettingsWriter | None = None
+        # Set once the writer has been stopped at shutdown; later writes go straight to disk
+        self._closed = False
+
+    def value(self, key: str, default=None, type=None):
+        with QMutexLocker(self._lock):
+            # Our own writes win; they may not have reached disk yet
+            v = self._written.get(key, _MISSING)
+            if v is not _MISSING:
+                return v
+            ck = (key, type)
+            v = self._cache.get(ck, _MISSING)
+            if v is _MISSING:
+                if type is None:
+                    v = self._qs.value(key, default)
+                else:
+                    v = self._qs.value(key, default, type)
+                if not self._qs.contains(key):
+                    return v
+                self._cache[ck] = v
+            return v
+
+    def setValue(self, key: str, value) -> None:
+        with QMutexLocker(self._lock):
+            if self._written.get(key, _MISSING) == value:
+                return
+            self._written[key] = value
+            if self._closed:
+                # No writer thread after shutdown; nothing would drain the queue
+                self._qs.setValue(key, value)
+                self._qs.sync()
+                return
+        self._ensure_writer().post(key, value)
+
+    def flush(self) -> None:
+        if self._writer is not None:
+            self._writer.drain()
+
+    def close(self) -> None:
+        """Stop the writer after it has synced pending writes (connected to aboutToQuit)."""
+        writer, self._writer = self._writer, None
+        self._closed = True
+        if writer is not None:
+            writer.stop()
+
+    def _ensure_writer(self) -> _SettingsWriter:
+        if self._writer is None:
+            self._writer = _SettingsWriter()
+            app = QApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self.close)
+            self._writer.start()
+        return self._writer
+
+
+_SETTINGS: _SettingsCache | None = None
+
+
+def settings() -> _SettingsCache:
+    """Return the process-wide settings cache."""
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = _SettingsCache()
+    return _SETTINGS
+
+
+# Bridge signals that older bridges may not define -> MainWindow slot
+_OPTIONAL_BRIDGE_SIGNALS = (
+    ("userJoined", "_on_user_joined"),
+    ("userParted", "_on_user_parted"),
+    ("userQuit", "_on_user_quit"),
+    ("userNickChanged", "_on_user_nick_changed"),
+    ("channelTopic", "_on_channel_topic"),
+    ("channelMode", "_on_channel_mode"),
+    ("channelModeUsers", "_on_channel_mode_users"),
+    ("monitorOnline", "_on_monitor_online"),
+    ("monitorOffline", "_on_monitor_offline"),
+)
+
+
+def _first_callable(obj, *names: str):
+    """Return the first of obj's named attributes that is callable, else None."""
+    for name in names:
+        fn = getattr(obj, name, None)
+        if callable(fn):
+            return fn
+    return None
+
+
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("DeadHop")
         self.resize(1200, 800)
         self.bridge = BridgeQt()
-        # In-memory scrollback per channel/label -> list[HTML]
-        self._scrollback: dict[str, list[str]] = {}
-        self._scrollback_limit: int = 1000
+        # Bridge capabilities, resolved once; None when this bridge lacks the API
+        self._bridge_kick = _first_callable(self.bridge, "kickUser")
+        self._bridge_setmodes = _first_callable(self.bridge, "setModes")
+        self._bridge_sendraw = _first_callable(self.bridge, "sendRaw", "sendCommand")
+        # Per channel/label state: scrollback (list[HTML]), unread/highlight counters, NAMES
+        self._channels: dict[str, ChannelState] = {}
+        self._scrollback_limit: int = SCROLLBACK_LIMIT
         # Scrollback retention policy (can be adjusted in Settings later)
         # TTL in days for scrollback files; <=0 disables TTL pruning
         self._scrollback_ttl_days: int = 30
         # Max number of channel scrollback files to retain (newest kept); <=0 disables cap
         self._scrollback_max_files: int = 200
         # Per-network status buffer (server messages rendered when selecting a network)
-        self._status_by_net: dict[str, list[str]] = {}
+        self._status_by_net: dict[str, deque[str]] = {}
         # Track current topic per channel label (e.g. "net:#chan")
         self._topic_by_channel: dict[str, str] = {}
         # Track topic metadata per channel: {comp: (setter:str|None, when:int|None)}
@@ -270,26 +482,8 @@ class MainWindow(QMainWindow):
         # Channels that should have their scrollback dimmed after a reconnect
         self._dim_needed_for_channel: set[str] = set()
         # Filesystem location for persisted scrollback
-        try:
-            from PyQt6.QtCore import QStandardPaths
-
-            base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
-        except Exception:
-            base = None
-        # Create app scrollback dir under AppDataLocation
-        try:
-            if base:
-                p = Path(base) / "scrollback"
-                p.mkdir(parents=True, exist_ok=True)
-                self._scrollback_dir = str(p)
-            else:
-                # Fallback to local relative directory
-                p = Path(__file__).resolve().parents[1] / "resources" / "scrollback"
-                p.mkdir(parents=True, exist_ok=True)
-                self._scrollback_dir = str(p)
-        except Exception:
-            # As a last resort, disable persistence gracefully
-            self._scrollback_dir = None
+        self._scrollback_dir: str | None = _scrollback_root()
+        self._scrollback_store = ScrollbackStore(self._scrollback_dir, self._scrollback_limit)
         # Notification preferences (defaults)
         self._notify_on_pm = True
         self._notify_on_mention = True
@@ -301,19 +495,17 @@ class MainWindow(QMainWindow):
         self._show_timestamps: bool = False
         self._chat_font_family: str | None = None
         self._chat_font_size: int | None = None
-        self._highlight_keywords: list[str] = []
         # Apply default theme (prefer qt-material; fallback to legacy theme manager if present)
         try:
-            from PyQt6.QtWidgets import QApplication
-            from qt_material import apply_stylesheet, list_themes
-
+            if _apply_stylesheet is None:
+                raise ImportError("qt_material")
             app = QApplication.instance()
             if app:
-                themes = list_themes()
+                themes = _material_themes()
                 preferred = "dark_teal.xml"
                 theme = preferred if preferred in themes else (themes[0] if themes else None)
                 if theme:
-                    apply_stylesheet(app, theme=theme)
+                    _apply_stylesheet(app, theme=theme)
         except Exception:
             if _theme_manager is not None:
                 try:
@@ -326,6 +518,9 @@ class MainWindow(QMainWindow):
         self._highlight_keywords: list[str] = []  # defaults to nick later
         # Our current nick (used for highlight detection); set on connect/nick events
         self._my_nick: str = ""
+        # Compiled nick/keyword matcher, rebuilt by _highlight_pattern when its inputs change
+        self._hl_pattern: re.Pattern[str] | None = None
+        self._hl_key: tuple[str, tuple[str, ...]] | None = None
         self._sound_enabled: bool = True
         try:
             from PyQt6.QtMultimedia import QSoundEffect
@@ -337,42 +532,28 @@ class MainWindow(QMainWindow):
             self._se_hl = QSoundEffect(self)
             self._se_presence = QSoundEffect(self)
             try:
-                s = QSettings("DeadHop", "DeadHopClient")
+                s = settings()
                 msg_path = s.value("notify/sound_msg", "", str)
                 hl_path = s.value("notify/sound_hl", "", str)
                 pr_path = s.value("notify/sound_presence", "", str)
                 vol = float(s.value("notify/sound_volume", 0.7))
                 # Sanitize unsupported formats (QSoundEffect typically supports WAV/OGG). Skip MP3.
-                try:
-
-                    def _ok(p: str) -> bool:
-                        if not p:
-                            return False
-                        ext = Path(p).suffix.lower()
-                        return ext in {".wav", ".ogg"}
-
-                    if msg_path and not _ok(msg_path):
-                        msg_path = ""
-                    if hl_path and not _ok(hl_path):
-                        hl_path = ""
-                    if pr_path and not _ok(pr_path):
-                        pr_path = ""
-                except Exception:
-                    pass
+                if msg_path and not _sound_ok(msg_path):
+                    msg_path = ""
+                if hl_path and not _sound_ok(hl_path):
+                    hl_path = ""
+                if pr_path and not _sound_ok(pr_path):
+                    pr_path = ""
                 # If any are unset, pick sensible defaults from resources/sounds
                 try:
-                    snd_dir = Path(__file__).resolve().parents[1] / "resources" / "sounds"
-                    files: list[str] = []
-                    if snd_dir.exists():
-                        wavs = [str(p) for p in snd_dir.glob("*.wav")]
-                        oggs = [str(p) for p in snd_dir.glob("*.ogg")]
-                        files = wavs + oggs
+                    # Warm starts have all three paths saved; skip the lookup entirely
+                    files = () if (msg_path and hl_path and pr_path) else _sound_files()
 
                     def choose(name_part: str) -> str:
-                        for f in files:
-                            if name_part.lower() in Path(f).name.lower():
+                        for low, f in files:
+                            if name_part in low:
                                 return f
-                        return files[0] if files else ""
+                        return files[0][1] if files else ""
 
                     if not msg_path:
                         cand = choose("message") or choose("sms")
@@ -420,15 +601,9 @@ class MainWindow(QMainWindow):
 
         # Set window/app icon from resources/icons if available
         try:
-            icons_dir = Path(__file__).resolve().parents[1] / "resources" / "icons"
-            cand = None
-            for ext in (".ico", ".png", ".svg"):  # prefer .ico
-                found = list(icons_dir.glob(f"*{ext}"))
-                if found:
-                    cand = found[0]
-                    break
-            if cand is not None:
-                self.setWindowIcon(QIcon(str(cand)))
+            app_icon = _app_icon()
+            if not app_icon.isNull():
+                self.setWindowIcon(app_icon)
         except Exception:
             pass
 
@@ -516,11 +691,6 @@ class MainWindow(QMainWindow):
         self.split_lr.setStretchFactor(1, 1)
         self.split_lr.setStretchFactor(2, 0)
         self.split_lr.setSizes([240, 800, 240])
-        # Ensure member context menu actions are handled
-        try:
-            self.members.memberAction.connect(self._on_member_action)
-        except Exception:
-            pass
 
         # Assemble center
         center = QWidget()
@@ -538,7 +708,7 @@ class MainWindow(QMainWindow):
         self.toast_host = ToastHost(self)
         # Notification preferences (default ON); load from QSettings
         try:
-            s = QSettings("DeadHop", "DeadHopClient")
+            s = settings()
             self._notify_toast: bool = bool(s.value("notify/toast", True, bool))
             self._notify_tray: bool = bool(s.value("notify/tray", True, bool))
             self._notify_sound: bool = bool(s.value("notify/sound", True, bool))
@@ -546,22 +716,18 @@ class MainWindow(QMainWindow):
             self._notify_toast = True
             self._notify_tray = True
             self._notify_sound = True
+        # Presence notification defaults; _load_settings overrides them from QSettings
+        self._notify_presence_online: bool = True
+        self._notify_presence_offline: bool = False
+        self._notify_presence_system: bool = True
+        self._notify_presence_sound: bool = False
         self._init_notifications()
 
-        # Reflect channel list updates from bridge into the sidebar
-        try:
-            self.bridge.channelsUpdated.connect(self._on_channels_updated)
-        except Exception:
-            pass
-
-        # IRC Log dock
-        self.log_view = QTextEdit(self)
-        self.log_view.setReadOnly(True)
-        self.log_view.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
-        self.log_dock = QDockWidget("IRC Log", self)
-        self.log_dock.setWidget(self.log_view)
-        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.log_dock)
-        self.log_dock.hide()
+        # IRC Log and Find docks start hidden; built on first show (_show_log_dock/_show_find_dock)
+        self.log_view: QTextEdit | None = None
+        self.log_dock: QDockWidget | None = None
+        self.find_bar: FindBar | None = None
+        self.find_dock: QDockWidget | None = None
 
         # Ensure tray icon has a visible icon to avoid warnings
         try:
@@ -596,14 +762,6 @@ class MainWindow(QMainWindow):
         # Standalone in-app browser window (created lazily)
         self.browser_window = None
 
-        # Find bar dock
-        self.find_bar = FindBar(self)
-        self.find_bar.searchRequested.connect(self._on_find)
-        self.find_dock = QDockWidget("Find", self)
-        self.find_dock.setWidget(self.find_bar)
-        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.find_dock)
-        self.find_dock.hide()
-
         # Friends dock (MONITOR)
         self.friends = FriendsDock(self)
         self.friends_dock = QDockWidget("Friends", self)
@@ -613,6 +771,13 @@ class MainWindow(QMainWindow):
         # Avatars and presence caches
         self._avatar_map: dict[str, str | None] = {}
         self._online_set: set[str] = set()
+        # MONITOR bursts (e.g. on reconnect) are summarized into one notification
+        self._pending_online: list[str] = []
+        self._pending_offline: list[str] = []
+        self._presence_debounce = QTimer(self)
+        self._presence_debounce.setSingleShot(True)
+        self._presence_debounce.setInterval(200)
+        self._presence_debounce.timeout.connect(self._flush_presence_notifications)
         # React to friends/avatars edits
         try:
             self.friends.friendsChanged.connect(self._on_friends_changed)
@@ -631,9 +796,7 @@ class MainWindow(QMainWindow):
                 available = True
             if available:
                 self.tray = QSystemTrayIcon(self)
-                app_icon = (
-                    get_icon(["app", "logo", "deadhop"]) if "get_icon" in globals() else QIcon()
-                )
+                app_icon = _app_icon()
                 if not app_icon.isNull():
                     self.tray.setIcon(app_icon)
                 # Basic tray setup: tooltip and visibility
@@ -678,10 +841,8 @@ class MainWindow(QMainWindow):
         self._ai_stream_open = False
         # Channel and unread/highlight tracking structures
         self._channel_labels: list[str] = []
-        self._unread: dict[str, int] = {}
-        self._highlights: dict[str, int] = {}
         # Per-network status/MOTD cache (list of recent lines)
-        self._status_by_net: dict[str, list[str]] = {}
+        self._status_by_net: dict[str, deque[str]] = {}
         # Per-network ISUPPORT (005) map
         self._isupport_by_net: dict[str, dict[str, str]] = {}
         # Prefer typed JOIN/PART/etc. events over raw parsing when available
@@ -726,30 +887,12 @@ class MainWindow(QMainWindow):
         self.bridge.namesUpdated.connect(self._on_names)
         self.bridge.currentChannelChanged.connect(self._on_current_channel_changed)
         self.bridge.channelsUpdated.connect(self._on_channels_updated)
-        # Typed event wiring (JOIN/PART/QUIT/NICK/TOPIC/MODE)
+        # Optional signals (typed JOIN/PART/QUIT/NICK/TOPIC/MODE events, MONITOR presence)
         try:
-            if hasattr(self.bridge, "userJoined"):
-                self.bridge.userJoined.connect(self._on_user_joined)
-            if hasattr(self.bridge, "userParted"):
-                self.bridge.userParted.connect(self._on_user_parted)
-            if hasattr(self.bridge, "userQuit"):
-                self.bridge.userQuit.connect(self._on_user_quit)
-            if hasattr(self.bridge, "userNickChanged"):
-                self.bridge.userNickChanged.connect(self._on_user_nick_changed)
-            if hasattr(self.bridge, "channelTopic"):
-                self.bridge.channelTopic.connect(self._on_channel_topic)
-            if hasattr(self.bridge, "channelMode"):
-                self.bridge.channelMode.connect(self._on_channel_mode)
-            if hasattr(self.bridge, "channelModeUsers"):
-                self.bridge.channelModeUsers.connect(self._on_channel_mode_users)
-        except Exception:
-            pass
-        # Presence via MONITOR
-        try:
-            if hasattr(self.bridge, "monitorOnline"):
-                self.bridge.monitorOnline.connect(self._on_monitor_online)
-            if hasattr(self.bridge, "monitorOffline"):
-                self.bridge.monitorOffline.connect(self._on_monitor_offline)
+            for sig_name, slot_name in _OPTIONAL_BRIDGE_SIGNALS:
+                sig = getattr(self.bridge, sig_name, None)
+                if sig is not None:
+                    sig.connect(getattr(self, slot_name))
         except Exception:
             pass
 
@@ -791,11 +934,6 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
-        # Unread/highlight counters
-        self._unread: dict[str, int] = {}
-        self._highlights: dict[str, int] = {}
-        # Cache of NAMES per composite channel label (e.g. "net:#chan")
-        self._names_by_channel: dict[str, list[str]] = {}
         # Apply global rounded corners styling overlay
         try:
             self._apply_rounded_corners(8)
@@ -843,24 +981,169 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def _schedule_async(self, func, *args, **kwargs) -> None:
-        """Schedule a callable; if it returns a coroutine, create a task."""
+    # ----- Friends / presence -----
+    def _on_friends_changed(self, friends: list[str]) -> None:
+        """Persist friends, push to bridge MONITOR, and resync presence maps."""
+        try:
+            cache = settings()
+            # set_friends on startup echoes the stored list back; skip rewriting it
+            if sorted(cache.value("friends", [], type=list) or []) != sorted(friends or []):
+                cache.setValue("friends", list(friends or []))
+        except Exception:
+            pass
+
+        # Settings dialog launcher removed (was incorrectly added here)
+        # Update MONITOR list (async)
+        try:
+            self._schedule_async(self.bridge.setMonitorList, list(friends or []))
+        except Exception:
+            pass
+        # Trim avatar entries for removed friends (optional; keep non-friends avatars for members)
+        try:
+            # Keep as-is to allow member avatars even if not in friends
+            self.friends.set_avatars(self._avatar_map)
+        except Exception:
+            pass
 
-        def runner() -> None:
+    def _on_avatars_changed(self, avatars: dict) -> None:
+        """Receive avatar map from FriendsDock and propagate to views + persist."""
+        try:
+            # One snapshot shared by the views and the settings cache; never mutated in place
+            new_map = dict(avatars or {})
+            if new_map == self._avatar_map:
+                return
+            self._avatar_map = new_map
+            # FriendsDock emitted this map, so only the members view needs it pushed
             try:
-                res = func(*args, **kwargs)
-                # If coroutine, schedule it; if Task/future, do nothing
-                if asyncio.iscoroutine(res):
-                    asyncio.create_task(res)
+                self.members.set_avatars(new_map)
             except Exception:
                 pass
+            # Persist
+            try:
+                settings().setValue("avatars", new_map)
+            except Exception:
+                pass
+        except Exception:
+            pass
 
+    def _on_monitor_online(self, nicks: list[str]) -> None:
+        if not nicks:
+            return
+        try:
+            cleaned = [n.strip() for n in nicks if n]
+            self._online_set.update(cleaned)
+            # Update views with just the delta; full set_presence is for the initial sync
+            for view in (self.friends, self.members):
+                try:
+                    delta = getattr(view, "add_presence", None)
+                    if delta is not None:
+                        delta(cleaned)
+                    else:
+                        view.set_presence(self._online_set)
+                except Exception:
+                    pass
+            # Notifications (coalesced; see _flush_presence_notifications)
+            # A nick that flapped within the window is reported by its latest state only
+            back = set(cleaned)
+            self._pending_offline = [n for n in self._pending_offline if n not in back]
+            if self._notify_presence_online:
+                self._pending_online.extend(cleaned)
+                if not self._presence_debounce.isActive():
+                    self._presence_debounce.start()
+        except Exception:
+            pass
+
+    def _on_monitor_offline(self, nicks: list[str]) -> None:
+        if not nicks:
+            return
         try:
-            from PyQt6.QtCore import QTimer
+            cleaned = [n.strip() for n in nicks if n]
+            self._online_set.difference_update(cleaned)
+            # Update views with just the delta; full set_presence is for the initial sync
+            for view in (self.friends, self.members):
+                try:
+                    delta = getattr(view, "remove_presence", None)
+                    if delta is not None:
+                        delta(cleaned)
+                    else:
+                        view.set_presence(self._online_set)
+                except Exception:
+                    pass
+            # Notifications (coalesced; see _flush_presence_notifications)
+            gone = set(cleaned)
+            self._pending_online = [n for n in self._pending_online if n not in gone]
+            if self._notify_presence_offline:
+                self._pending_offline.extend(cleaned)
+                if not self._presence_debounce.isActive():
+                    self._presence_debounce.start()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _presence_summary(nicks: list[str], one: str, many: str) -> str:
+        if len(nicks) == 1:
+            return f"{nicks[0]} {one}"
+        shown = ", ".join(nicks[:5])
+        more = "…" if len(nicks) > 5 else ""
+        return f"{len(nicks)} friends {many}: {shown}{more}"
+
+    def _flush_presence_notifications(self) -> None:
+        """One toast, one tray message and at most one sound per presence burst."""
+        # Repeated MONITOR lines name the same nick more than once; keep first-seen order
+        online = list(dict.fromkeys(self._pending_online))
+        offline = list(dict.fromkeys(self._pending_offline))
+        self._pending_online, self._pending_offline = [], []
+        tray = self.tray if self._notify_presence_system else None
+        if online:
+            msg = self._presence_summary(online, "is online", "online")
+            try:
+                self.toast_host.show_toast(msg)
+            except Exception:
+                pass
+            if tray is not None:
+                try:
+                    tray.showMessage(
+                        "Friend online", msg, QSystemTrayIcon.MessageIcon.Information, 2500
+                    )
+                except Exception:
+                    pass
+            if self._notify_presence_sound:
+                try:
+                    if self._sound_enabled:
+                        se = self._se_presence
+                        if se:
+                            se.play()
+                        else:
+                            QApplication.beep()
+                except Exception:
+                    pass
+        if offline:
+            msg = self._presence_summary(offline, "went offline", "went offline")
+            try:
+                self.toast_host.show_toast(msg)
+            except Exception:
+                pass
+            if tray is not None:
+                try:
+                    tray.showMessage(
+                        "Friend offline", msg, QSystemTrayIcon.MessageIcon.Warning, 2500
+                    )
+                except Exception:
+                    pass
 
-            QTimer.singleShot(0, runner)
+    def _schedule_async(self, func, *args, **kwargs) -> None:
+        """Call func now; if it returns a coroutine, schedule it on the qasync loop.
+
+        The Qt loop is the asyncio loop (see main_pyqt6), so no timer hop is needed;
+        bridge @asyncSlot methods already return a scheduled Task.
+        """
+        try:
+            res = func(*args, **kwargs)
+            # If coroutine, schedule it; if Task/future, do nothing
+            if asyncio.iscoroutine(res):
+                asyncio.ensure_future(res)
         except Exception:
-            runner()
+            pass
 
     # ----- Member actions -----
 
@@ -909,20 +1192,9 @@ class MainWindow(QMainWindow):
                 self, "Kick", f"Reason for kicking {nick} from {ch}:", text=""
             )
             if ok:
-                sent = False
-                for meth, cmd in (
-                    ("kickUser", None),
-                    ("sendRaw", f"KICK {ch} {nick} :{reason}"),
-                    ("sendCommand", f"KICK {ch} {nick} :{reason}"),
-                ):
-                    fn = getattr(self.bridge, meth, None)
-                    if callable(fn):
-                        try:
-                            fn(ch, nick, reason) if cmd is None else fn(cmd)
-                            sent = True
-                            break
-                        except Exception:
-                            pass
+                sent = self._bridge_dispatch(
+                    self._bridge_kick, (ch, nick, reason), f"KICK {ch} {nick} :{reason}"
+                )
                 if not sent:
                     self.toast_host.show_toast("Kick not implemented in bridge")
         elif action == "ban":
@@ -931,20 +1203,9 @@ class MainWindow(QMainWindow):
                 self, "Ban", f"Ban mask or nick for {ch} (e.g. {nick} or *!*@host):", text=nick
             )
             if ok and mask.strip():
-                sent = False
-                for meth, cmd in (
-                    ("setModes", None),
-                    ("sendRaw", f"MODE {ch} +b {mask}"),
-                    ("sendCommand", f"MODE {ch} +b {mask}"),
-                ):
-                    fn = getattr(self.bridge, meth, None)
-                    if callable(fn):
-                        try:
-                            fn(ch, "+b " + mask) if cmd is None else fn(cmd)
-                            sent = True
-                            break
-                        except Exception:
-                            pass
+                sent = self._bridge_dispatch(
+                    self._bridge_setmodes, (ch, "+b " + mask), f"MODE {ch} +b {mask}"
+                )
                 if not sent:
                     self.toast_host.show_toast("Ban not implemented in bridge")
         elif action == "op":
@@ -967,16 +1228,8 @@ class MainWindow(QMainWindow):
                 ]
                 if nick not in current:
                     current.append(nick)
+                    # friendsChanged -> _on_friends_changed persists and updates MONITOR
                     self.friends.set_friends(current)
-                    try:
-                        self._schedule_async(self.bridge.setMonitorList, current)
-                    except Exception:
-                        pass
-                    try:
-                        s = QSettings("DeadHop", "DeadHopClient")
-                        s.setValue("friends", current)
-                    except Exception:
-                        pass
                 self.toast_host.show_toast(f"Added {nick} to friends")
             except Exception:
                 pass
@@ -1296,14 +1549,14 @@ class MainWindow(QMainWindow):
             a_view_cookies.triggered.connect(self._import_system_cookies_for_current_site)
             m_view.addSeparator()
             a_view_urls = m_view.addAction("Show &URL Grabber")
-            a_view_urls.triggered.connect(lambda: self.url_dock.show())
+            a_view_urls.triggered.connect(self._show_url_dock)
             a_view_friends = m_view.addAction("Show &Friends")
-            a_view_friends.triggered.connect(lambda: self.friends_dock.show())
+            a_view_friends.triggered.connect(self._show_friends_dock)
             a_view_log = m_view.addAction("Show &IRC Log")
-            a_view_log.triggered.connect(lambda: self.log_dock.show())
+            a_view_log.triggered.connect(self._show_log_dock)
             a_view_find = m_view.addAction("&Find…")
             a_view_find.setShortcut(QKeySequence.StandardKey.Find)
-            a_view_find.triggered.connect(lambda: self.find_dock.show())
+            a_view_find.triggered.connect(self._show_find_dock)
 
             # Tools
             m_tools = mb.addMenu("&Tools")
@@ -1362,6 +1615,7 @@ class MainWindow(QMainWindow):
 
     # ----- Formatting helpers -----
     _URL_RE = re.compile(r"(https?://\S+)")
+    _WS_RE = re.compile(r"\s+")
     _IMG_EXTS = (".png", ".jpg", ".jpeg", ".gif", ".webp")
     _VID_EXTS = (".mp4", ".webm", ".mov")
 
@@ -1382,25 +1636,25 @@ class MainWindow(QMainWindow):
         safe_text = text or ""
         # Build embeds for all URLs and strip URLs from visible text
         embeds: list[str] = []
-        embedded_urls: list[str] = []
+        # Visible text is rebuilt from the slices between embedded URLs in the same pass
+        visible: list[str] = []
+        last = 0
         for m in self._URL_RE.finditer(safe_text):
             url = m.group(1)
             low = url.lower()
-            if any(low.endswith(ext) for ext in self._IMG_EXTS):
+            if low.endswith(self._IMG_EXTS):
                 embeds.append(
                     f"<br><img src='{url}' style='border-radius: 8px;' data-msize='small'>"
                 )
-                embedded_urls.append(url)
-                continue
-            if any(low.endswith(ext) for ext in self._VID_EXTS):
+            elif low.endswith(self._VID_EXTS):
                 embeds.append(
                     "<br>"
                     f"<video data-msize='small' controls src='{url}' preload='metadata'></video>"
                 )
-                embedded_urls.append(url)
-                continue
-            yid = self._youtube_id(url)
-            if yid:
+            else:
+                yid = self._youtube_id(url)
+                if not yid:
+                    continue
                 embeds.append(
                     "<br>"
                     f"<iframe data-msize='small' width='560' height='315' src='https://www.youtube.com/embed/{yid}'"
@@ -1408,12 +1662,10 @@ class MainWindow(QMainWindow):
                     " allow='accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture'"
                     " allowfullscreen></iframe>"
                 )
-                embedded_urls.append(url)
-        # Strip URLs from displayed text
-        display_text = safe_text
-        for u in embedded_urls:
-            display_text = display_text.replace(u, "")
-        display_text = re.sub(r"\s+", " ", display_text).strip()
+            visible.append(safe_text[last : m.start()])
+            last = m.end()
+        visible.append(safe_text[last:])
+        display_text = self._WS_RE.sub(" ", "".join(visible)).strip()
         embed_html = "".join(embeds)
         prefix = ""
         if getattr(self, "_show_timestamps", False):
@@ -1465,36 +1717,7 @@ class MainWindow(QMainWindow):
 
     def _nick_color(self, nick: str) -> str:
         try:
-            s = (nick or "").lower().encode("utf-8")
-            h = 0
-            for b in s:
-                h = (h * 131 + int(b)) & 0xFFFFFFFF
-            # map to pleasant hue range, fixed saturation/lightness
-            hue = h % 360
-
-            # Convert HSL to RGB (approx) for CSS hex
-            def hsl_to_rgb(h, s, light):
-                c = (1 - abs(2 * light - 1)) * s
-                x = c * (1 - abs(((h / 60) % 2) - 1))
-                m = light - c / 2
-                if 0 <= h < 60:
-                    r, g, b = c, x, 0
-                elif 60 <= h < 120:
-                    r, g, b = x, c, 0
-                elif 120 <= h < 180:
-                    r, g, b = 0, c, x
-                elif 180 <= h < 240:
-                    r, g, b = 0, x, c
-                elif 240 <= h < 300:
-                    r, g, b = x, 0, c
-                else:
-                    r, g, b = c, 0, x
-                R = int((r + m) * 255)
-                G = int((g + m) * 255)
-                B = int((b + m) * 255)
-                return f"#{R:02x}{G:02x}{B:02x}"
-
-            return hsl_to_rgb(hue, 0.65, 0.6)
+            return _nick_hex((nick or "").lower())
         except Exception:
             return "#82b1ff"
 
@@ -1588,6 +1811,20 @@ class MainWindow(QMainWindow):
                         scrollToBottom();
                     } catch (e) {}
                 }
+                function appendBatch(items) {
+                    try {
+                        const c = document.getElementById('chat');
+                        const frag = document.createDocumentFragment();
+                        for (const html of items) {
+                            const d = document.createElement('div');
+                            d.className = 'msg';
+                            d.innerHTML = html;
+                            frag.appendChild(d);
+                        }
+                        c.appendChild(frag);
+                        scrollToBottom();
+                    } catch (e) {}
+                }
                 function setTopic(text, tip) {
                     try {
                         const bar = document.getElementById('topic');
@@ -1785,9 +2022,9 @@ class MainWindow(QMainWindow):
             # Flush any pending messages
             buf = list(getattr(self, "_chat_buf", []) or [])
             setattr(self, "_chat_buf", [])
-            for html in buf:
+            if buf:
                 try:
-                    self.chat.page().runJavaScript(f"appendMessage({json.dumps(html)})")
+                    self.chat.page().runJavaScript(f"appendBatch({json.dumps(buf)})")
                 except Exception:
                     pass
             # Apply topic + decorations for current channel
@@ -1895,9 +2132,8 @@ class MainWindow(QMainWindow):
             pass
         try:
             if self._chat_buf:
-                for item in list(self._chat_buf):
-                    # If item looks like a raw HTML string, append directly
-                    self.chat.page().runJavaScript(f"appendMessage({json.dumps(item)})")
+                # One renderer round-trip and one layout pass for the whole backlog
+                self.chat.page().runJavaScript(f"appendBatch({json.dumps(self._chat_buf)})")
         except Exception:
             pass
         finally:
@@ -1906,16 +2142,27 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
+    def _chan(self, label: str) -> ChannelState:
+        """State for a composite channel label (e.g. "net:#chan"), created on first use."""
+        st = self._channels.get(label)
+        if st is None:
+            st = self._channels[label] = ChannelState()
+        return st
+
+    def _status_lines(self, net: str) -> deque[str]:
+        """Recent plain-text status lines for a network, capped at STATUS_LINES_LIMIT."""
+        buf = self._status_by_net.get(net)
+        if buf is None:
+            buf = self._status_by_net[net] = deque(maxlen=STATUS_LINES_LIMIT)
+        return buf
+
     def _chat_append(self, html: str) -> None:
         # Cache into per-channel scrollback first
         try:
             cur = self.bridge.current_channel() or "status"
-            buf = self._scrollback.setdefault(cur, [])
-            buf.append(html)
-            if len(buf) > self._scrollback_limit:
-                del buf[: -self._scrollback_limit]
+            self._chan(cur).scrollback.append(html)
             # Persist to disk best-effort
-            self._scrollback_save(cur, buf)
+            self._scrollback_append(cur, html)
         except Exception:
             pass
         # Then render (or buffer until webview ready)
@@ -1931,69 +2178,33 @@ class MainWindow(QMainWindow):
     def _replay_scrollback(self, ch: str | None = None) -> None:
         try:
             key = ch or (self.bridge.current_channel() or "status")
-            hist = list(self._scrollback.get(key, []))
+            hist = list(self._chan(key).scrollback)
             if not hist:
                 # Attempt to load from disk
                 loaded = self._scrollback_load(key)
                 if loaded:
-                    self._scrollback[key] = list(loaded)
+                    self._chan(key).scrollback = deque(loaded, maxlen=self._scrollback_limit)
                     hist = list(loaded)
             if not hist:
                 return
-            # Efficiently append in order
-            for h in hist:
-                self.chat.page().runJavaScript(f"appendMessage({json.dumps(h)})")
-            # Ensure we are at bottom (match base_html helper)
-            self.chat.page().runJavaScript("scrollToBottom()")
+            # Append in order with a single runJavaScript call (appendBatch scrolls to bottom)
+            self.chat.page().runJavaScript(f"appendBatch({json.dumps(hist)})")
         except Exception:
             pass
 
-    def _scrollback_path(self, ch: str) -> str | None:
+    def _scrollback_append(self, ch: str, html: str) -> None:
+        """Append one line to a channel's scrollback file, compacting from the deque."""
         try:
-            base = self._scrollback_dir
-            if not base:
-                return None
-            import os
-
-            os.makedirs(base, exist_ok=True)
-            # sanitize filename
-            safe = "".join(
-                c if c.isalnum() or c in ("#", "-", "_", "@", ".", ":", "+") else "_" for c in ch
-            )
-            return os.path.join(base, f"scrollback_{safe}.json")
-        except Exception:
-            return None
-
-    def _scrollback_save(self, ch: str, buf: list[str]) -> None:
-        try:
-            path = self._scrollback_path(ch)
-            if not path:
-                return
-            import json as _json
-
-            data = buf[-self._scrollback_limit :]
-            with open(path, "w", encoding="utf-8") as f:
-                _json.dump(data, f, ensure_ascii=False)
+            if self._scrollback_store.append(ch, html, self._chan(ch).scrollback):
+                self._prune_scrollback()
         except Exception:
             pass
 
     def _scrollback_load(self, ch: str) -> list[str] | None:
         try:
-            path = self._scrollback_path(ch)
-            if not path:
-                return None
-            import json as _json
-            import os
-
-            if not os.path.exists(path):
-                return None
-            with open(path, encoding="utf-8") as f:
-                data = _json.load(f)
-            if isinstance(data, list):
-                return [str(x) for x in data][-self._scrollback_limit :]
+            return self._scrollback_store.load(ch)
         except Exception:
-            pass
-        return None
+            return None
 
     def _chat_start_ai_line(self) -> None:
         try:
@@ -2221,19 +2432,50 @@ class MainWindow(QMainWindow):
 
     def _send_raw(self, line: str) -> None:
         sent = False
-        for meth in ("sendRaw", "sendCommand"):
-            fn = getattr(self.bridge, meth, None)
-            if callable(fn):
-                try:
-                    # Schedule; supports async slots transparently
-                    self._schedule_async(fn, line)
-                    sent = True
-                    break
-                except Exception:
-                    pass
+        if self._bridge_sendraw is not None:
+            try:
+                # Schedule; supports async slots transparently
+                self._schedule_async(self._bridge_sendraw, line)
+                sent = True
+            except Exception:
+                pass
         if not sent:
             self.toast_host.show_toast("Raw command not supported by bridge")
 
+    def _bridge_dispatch(self, fn, args: tuple, raw: str) -> bool:
+        """Call a typed bridge method, falling back to the raw IRC line; False if neither worked."""
+        if fn is not None:
+            try:
+                fn(*args)
+                return True
+            except Exception:
+                pass
+        if self._bridge_sendraw is not None:
+            try:
+                self._bridge_sendraw(raw)
+                return True
+            except Exception:
+                pass
+        return False
+
+    def _highlight_pattern(self) -> re.Pattern[str] | None:
+        """Return one case-insensitive regex matching our nick or any highlight keyword.
+
+        Recompiled only when the nick or keyword list changed since the last call.
+        """
+        key = (self._my_nick, tuple(self._highlight_keywords))
+        if key != self._hl_key:
+            words = [w for w in (self._my_nick, *self._highlight_keywords) if w]
+            self._hl_pattern = (
+                re.compile(
+                    r"(?<!\w)(?:" + "|".join(map(re.escape, words)) + r")(?!\w)", re.IGNORECASE
+                )
+                if words
+                else None
+            )
+            self._hl_key = key
+        return self._hl_pattern
+
     def _strip_irc_codes(self, s: str) -> str:
         """Strip common IRC formatting/control codes from text.
 
@@ -2293,10 +2535,8 @@ class MainWindow(QMainWindow):
                         if not net:
                             return
                         # Persist as plain text; network select will re-render
-                        buf = self._status_by_net.setdefault(net, [])
+                        buf = self._status_lines(net)
                         buf.append(text)
-                        if len(buf) > 500:
-                            del buf[:-500]
                         # Live render if network is selected
                         if getattr(self, "_selected_network", None) == net:
                             html = f"<span class='sys'><i>{self._strip_irc_codes(text)}</i></span>"
@@ -2496,13 +2736,11 @@ class MainWindow(QMainWindow):
                                 if not comp:
                                     return
                                 # Persist to scrollback
-                                sb = self._scrollback.setdefault(comp, [])
+                                sb = self._chan(comp).scrollback
                                 html = (
                                     f"<span class='sys'><i>{self._strip_irc_codes(text)}</i></span>"
                                 )
                                 sb.append(html)
-                                if len(sb) > self._scrollback_limit:
-                                    del sb[: -self._scrollback_limit]
                                 # Live render if active
                                 if (self.bridge.current_channel() or "") == comp:
                                     self.chat.page().runJavaScript(
@@ -2511,10 +2749,9 @@ class MainWindow(QMainWindow):
                                 else:
                                     # Increment unread for that channel
                                     try:
-                                        self._unread[comp] = self._unread.get(comp, 0) + 1
-                                        self.sidebar.set_unread(
-                                            comp, self._unread[comp], self._highlights.get(comp, 0)
-                                        )
+                                        st = self._chan(comp)
+                                        st.unread += 1
+                                        self.sidebar.set_unread(comp, st.unread, st.highlights)
                                     except Exception:
                                         pass
                             except Exception:
@@ -2522,24 +2759,24 @@ class MainWindow(QMainWindow):
 
                         def members_add(comp: str, who: str) -> None:
                             try:
-                                names = set(self._names_by_channel.get(comp, []))
+                                names = set(self._chan(comp).names)
                                 if who not in names:
                                     names.add(who)
-                                    self._names_by_channel[comp] = sorted(names)
+                                    self._chan(comp).names = sorted(names)
                                     if (self.bridge.current_channel() or "") == comp:
-                                        self.members.set_members(list(self._names_by_channel[comp]))
+                                        self.members.set_members(list(self._chan(comp).names))
                                         self.composer.set_completion_names(
-                                            list(self._names_by_channel[comp])
+                                            list(self._chan(comp).names)
                                         )
                             except Exception:
                                 pass
 
                         def members_remove(comp: str, who: str) -> None:
                             try:
-                                names = list(self._names_by_channel.get(comp, []))
+                                names = list(self._chan(comp).names)
                                 if who in names:
                                     names = [x for x in names if x != who]
-                                    self._names_by_channel[comp] = names
+                                    self._chan(comp).names = names
                                     if (self.bridge.current_channel() or "") == comp:
                                         self.members.set_members(list(names))
                                         self.composer.set_completion_names(list(names))
@@ -2579,7 +2816,7 @@ class MainWindow(QMainWindow):
                         if cmd == "QUIT":
                             reason = raw.split(":", 2)[-1] if ":" in raw else ""
                             # Emit to all channels where nick is present on this net
-                            for comp, names in list(self._names_by_channel.items()):
+                            for comp, names in [(c, st.names) for c, st in self._channels.items()]:
                                 if not comp.startswith(f"{net}:"):
                                     continue
                                 if nick in names:
@@ -2591,7 +2828,7 @@ class MainWindow(QMainWindow):
                             return
                         if cmd == "NICK" and len(parts) >= 3:
                             new_nick = parts[2].lstrip(":")
-                            for comp, names in list(self._names_by_channel.items()):
+                            for comp, names in [(c, st.names) for c, st in self._channels.items()]:
                                 if not comp.startswith(f"{net}:"):
                                     continue
                                 if nick in names:
@@ -2599,13 +2836,13 @@ class MainWindow(QMainWindow):
                                     # Update member list
                                     try:
                                         updated = [new_nick if x == nick else x for x in names]
-                                        self._names_by_channel[comp] = sorted(set(updated))
+                                        self._chan(comp).names = sorted(set(updated))
                                         if (self.bridge.current_channel() or "") == comp:
                                             self.members.set_members(
-                                                list(self._names_by_channel[comp])
+                                                list(self._chan(comp).names)
                                             )
                                             self.composer.set_completion_names(
-                                                list(self._names_by_channel[comp])
+                                                list(self._chan(comp).names)
                                             )
                                     except Exception:
                                         pass
@@ -2710,7 +2947,13 @@ class MainWindow(QMainWindow):
             except Exception:
                 self.toast_host.show_toast("Part not implemented in bridge")
         elif a == "topic":
-            dlg = TopicDialog(ch, None, self)
+            # One topic dialog per window, re-pointed at the channel on each edit
+            dlg = getattr(self, "_topic_dlg", None)
+            if dlg is None:
+                dlg = TopicDialog(ch, None, self)
+                self._topic_dlg = dlg
+            else:
+                dlg.reset(ch, None)
             if dlg.exec() == dlg.DialogCode.Accepted:
                 new_topic = dlg.value()
                 try:
@@ -2771,18 +3014,14 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
         try:
-            friends = s.value("friends", [], type=list)
+            friends = settings().value("friends", [], type=list)
             if friends:
+                # friendsChanged -> _on_friends_changed pushes the MONITOR list
                 self.friends.set_friends(list(friends))
-                # push to bridge (async)
-                try:
-                    self._schedule_async(self.bridge.setMonitorList, list(friends))
-                except Exception:
-                    pass
         except Exception:
             pass
         try:
-            avatars = s.value("avatars", {}, type=dict)
+            avatars = settings().value("avatars", {}, type=dict)
             if isinstance(avatars, dict):
                 self._avatar_map = dict(avatars)
                 # push to widgets
@@ -2798,10 +3037,11 @@ class MainWindow(QMainWindow):
             pass
         # Presence notification prefs (defaults: online on, offline off)
         try:
-            self._notify_presence_online = s.value("notify/presence_online", True, type=bool)
-            self._notify_presence_offline = s.value("notify/presence_offline", False, type=bool)
-            self._notify_presence_system = s.value("notify/presence_system", True, type=bool)
-            self._notify_presence_sound = s.value("notify/presence_sound", False, type=bool)
+            cache = settings()
+            self._notify_presence_online = cache.value("notify/presence_online", True, type=bool)
+            self._notify_presence_offline = cache.value("notify/presence_offline", False, type=bool)
+            self._notify_presence_system = cache.value("notify/presence_system", True, type=bool)
+            self._notify_presence_sound = cache.value("notify/presence_sound", False, type=bool)
         except Exception:
             self._notify_presence_online = True
             self._notify_presence_offline = False
@@ -2831,28 +3071,21 @@ class MainWindow(QMainWindow):
                 self.friends.list.item(i).data(Qt.ItemDataRole.UserRole)
                 for i in range(self.friends.list.count())
             ]
-            s.setValue("friends", fr)
+            settings().setValue("friends", fr)
         except Exception:
             pass
-        # avatars
+        # avatars (shared cache keys; the writer thread syncs them)
         try:
-            s.setValue("avatars", dict(self._avatar_map))
+            settings().setValue("avatars", self._avatar_map)
         except Exception:
             pass
         # presence notify prefs
         try:
-            s.setValue(
-                "notify/presence_online", bool(getattr(self, "_notify_presence_online", True))
-            )
-            s.setValue(
-                "notify/presence_offline", bool(getattr(self, "_notify_presence_offline", False))
-            )
-            s.setValue(
-                "notify/presence_system", bool(getattr(self, "_notify_presence_system", True))
-            )
-            s.setValue(
-                "notify/presence_sound", bool(getattr(self, "_notify_presence_sound", False))
-            )
+            cache = settings()
+            cache.setValue("notify/presence_online", bool(self._notify_presence_online))
+            cache.setValue("notify/presence_offline", bool(self._notify_presence_offline))
+            cache.setValue("notify/presence_system", bool(self._notify_presence_system))
+            cache.setValue("notify/presence_sound", bool(self._notify_presence_sound))
         except Exception:
             pass
         # Persist geometry and splitter state
@@ -2872,6 +3105,11 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
         finally:
+            # Wait for the background settings writer to catch up
+            try:
+                settings().flush()
+            except Exception:
+                pass
             # Ensure tray icon is hidden and cleaned up on exit
             try:
                 if getattr(self, "tray", None) is not None:
@@ -2982,14 +3220,9 @@ class MainWindow(QMainWindow):
         tb.addWidget(QLabel(" Theme "))
         cbo_theme = QComboBox()
         themes: list[str] = []
-        try:
-            from qt_material import list_themes
-
-            themes = ["Material Dark", "Material Light"] + [
-                t for t in list(list_themes()) if t not in ("Material Dark", "Material Light")
-            ]
-        except Exception:
-            themes = ["Material Dark", "Material Light"]
+        themes = ["Material Dark", "Material Light"] + [
+            t for t in _material_themes() if t not in ("Material Dark", "Material Light")
+        ]
         cbo_theme.addItems(themes)
         if self._current_theme and self._current_theme in themes:
             cbo_theme.setCurrentText(self._current_theme)
@@ -3118,24 +3351,21 @@ class MainWindow(QMainWindow):
         def on_toast(v: bool) -> None:
             self._notify_toast = bool(v)
             try:
-                s = QSettings("DeadHop", "DeadHopClient")
-                s.setValue("notify/toast", bool(v))
+                settings().setValue("notify/toast", bool(v))
             except Exception:
                 pass
 
         def on_tray(v: bool) -> None:
             self._notify_tray = bool(v)
             try:
-                s = QSettings("DeadHop", "DeadHopClient")
-                s.setValue("notify/tray", bool(v))
+                settings().setValue("notify/tray", bool(v))
             except Exception:
                 pass
 
         def on_sound(v: bool) -> None:
             self._notify_sound = bool(v)
             try:
-                s = QSettings("DeadHop", "DeadHopClient")
-                s.setValue("notify/sound", bool(v))
+                settings().setValue("notify/sound", bool(v))
             except Exception:
                 pass
 
@@ -3164,8 +3394,7 @@ class MainWindow(QMainWindow):
                             if getattr(self, "_se_msg", None)
                             else None
                         )
-                        s = QSettings("DeadHop", "DeadHopClient")
-                        s.setValue("notify/sound_msg", fn)
+                        settings().setValue("notify/sound_msg", fn)
                 except Exception:
                     pass
 
@@ -3188,8 +3417,7 @@ class MainWindow(QMainWindow):
                             if getattr(self, "_se_hl", None)
                             else None
                         )
-                        s = QSettings("DeadHop", "DeadHopClient")
-                        s.setValue("notify/sound_hl", fn)
+                        settings().setValue("notify/sound_hl", fn)
                 except Exception:
                     pass
 
@@ -3212,8 +3440,7 @@ class MainWindow(QMainWindow):
                             if getattr(self, "_se_presence", None)
                             else None
                         )
-                        s = QSettings("DeadHop", "DeadHopClient")
-                        s.setValue("notify/sound_presence", fn)
+                        settings().setValue("notify/sound_presence", fn)
                 except Exception:
                     pass
 
@@ -3228,8 +3455,7 @@ class MainWindow(QMainWindow):
                 def on_pr(v: bool) -> None:
                     try:
                         self._notify_presence_sound = bool(v)
-                        s = QSettings("DeadHop", "DeadHopClient")
-                        s.setValue("notify/presence_sound", bool(v))
+                        settings().setValue("notify/presence_sound", bool(v))
                     except Exception:
                         pass
 
@@ -3243,8 +3469,7 @@ class MainWindow(QMainWindow):
             s_vol.setMinimum(0)
             s_vol.setMaximum(100)
             try:
-                s = QSettings("DeadHop", "DeadHopClient")
-                cur = float(s.value("notify/sound_volume", 0.7))
+                cur = float(settings().value("notify/sound_volume", 0.7))
             except Exception:
                 cur = 0.7
             s_vol.setValue(int(cur * 100))
@@ -3267,8 +3492,7 @@ class MainWindow(QMainWindow):
                             self._se_presence.setVolume(vol)
                         except Exception:
                             pass
-                    s = QSettings("DeadHop", "DeadHopClient")
-                    s.setValue("notify/sound_volume", float(vol))
+                    settings().setValue("notify/sound_volume", float(vol))
                 except Exception:
                     pass
 
@@ -3440,13 +3664,10 @@ class MainWindow(QMainWindow):
     def _open_settings_dialog(self) -> None:
         # Build theme options list
         theme_options: list[str] = []
-        try:
-            from qt_material import list_themes
-
-            theme_options = list(list_themes()) or []
-        except Exception:
-            if _theme_manager is not None:
-                theme_options = ["Material Dark", "Material Light"]
+        if _list_themes is not None:
+            theme_options = list(_material_themes())
+        elif _theme_manager is not None:
+            theme_options = ["Material Dark", "Material Light"]
         from .dialogs.settings_dialog import SettingsDialog
 
         fam = self.chat.font().family()
@@ -3471,17 +3692,19 @@ class MainWindow(QMainWindow):
             s = QSettings("DeadHop", "DeadHopClient")
             # Default to autoconnect enabled
             auto = s.value("server/autoconnect", True, type=bool)
-            notify_toast = bool(s.value("notify/toast", getattr(self, "_notify_toast", True)))
-            notify_tray = bool(s.value("notify/tray", getattr(self, "_notify_tray", True)))
-            notify_sound = bool(s.value("notify/sound", getattr(self, "_notify_sound", True)))
+            # notify/* keys are written through the shared cache; read them back the same way
+            cache = settings()
+            notify_toast = bool(cache.value("notify/toast", self._notify_toast, type=bool))
+            notify_tray = bool(cache.value("notify/tray", self._notify_tray, type=bool))
+            notify_sound = bool(cache.value("notify/sound", self._notify_sound, type=bool))
             presence_sound_enabled = bool(
-                s.value("notify/presence_sound", getattr(self, "_notify_presence_sound", False))
+                cache.value("notify/presence_sound", self._notify_presence_sound, type=bool)
             )
-            sound_msg_path = s.value("notify/sound_msg", "", type=str) or None
-            sound_hl_path = s.value("notify/sound_hl", "", type=str) or None
-            sound_presence_path = s.value("notify/sound_presence", "", type=str) or None
+            sound_msg_path = cache.value("notify/sound_msg", "", type=str) or None
+            sound_hl_path = cache.value("notify/sound_hl", "", type=str) or None
+            sound_presence_path = cache.value("notify/sound_presence", "", type=str) or None
             try:
-                sound_volume = float(s.value("notify/sound_volume", 0.7))
+                sound_volume = float(cache.value("notify/sound_volume", 0.7))
             except Exception:
                 sound_volume = 0.7
         except Exception:
@@ -3495,8 +3718,7 @@ class MainWindow(QMainWindow):
             scrollback_max_files = int(s.value("scrollback/max_files", 0, type=int))
         except Exception:
             pass
-        dlg = SettingsDialog(
-            self,
+        init = dict(
             theme_options=theme_options,
             current_theme=self._current_theme,
             opacity=float(self.windowOpacity()),
@@ -3526,9 +3748,18 @@ class MainWindow(QMainWindow):
             scrollback_ttl_days=scrollback_ttl_days,
             scrollback_max_files=scrollback_max_files,
         )
-        if dlg.exec() == dlg.DialogCode.Accepted:
+        # Reuse one dialog per window; later opens only re-seed its widgets
+        dlg = getattr(self, "_settings_dlg", None)
+        if dlg is None:
+            dlg = SettingsDialog(self, **init)
+            self._settings_dlg = dlg
+        else:
+            dlg.reset(**init)
+        accepted = dlg.exec() == dlg.DialogCode.Accepted
+        vals = dlg.values()
+        if accepted:
             # Theme
-            sel = dlg.selected_theme()
+            sel = vals.theme
             if sel:
                 self._current_theme = sel
                 # Apply theme via qt-material if available; fallback to internal theme
@@ -3541,11 +3772,11 @@ class MainWindow(QMainWindow):
                         pass
             # Opacity
             try:
-                self.setWindowOpacity(dlg.selected_opacity())
+                self.setWindowOpacity(vals.opacity)
             except Exception:
                 pass
             # Font
-            fam_sel, pt_sel = dlg.selected_font()
+            fam_sel, pt_sel = vals.font_family, vals.font_point_size
             if fam_sel:
                 self._chat_font_family = fam_sel
             if pt_sel and pt_sel > 0:
@@ -3558,35 +3789,29 @@ class MainWindow(QMainWindow):
                     f.setPointSize(pt_sel)
                 self.chat.setFont(f)
             # Word wrap, timestamps
-            self._set_word_wrap(dlg.selected_word_wrap())
-            self._set_timestamps(dlg.selected_show_timestamps())
+            self._set_word_wrap(vals.word_wrap)
+            self._set_timestamps(vals.show_timestamps)
             # Highlight words
-            self._highlight_keywords = dlg.selected_highlight_words()
+            self._highlight_keywords = vals.highlight_words
             # Friends
-            fr = dlg.selected_friends()
-            self.friends.set_friends(fr)
-            try:
-                self._schedule_async(self.bridge.setMonitorList, fr)
-            except Exception:
-                pass
+            # friendsChanged -> _on_friends_changed persists and updates MONITOR
+            self.friends.set_friends(vals.friends)
             # Network prefs
             try:
-                self._auto_negotiate = dlg.selected_auto_negotiate()
-                self._prefer_tls = dlg.selected_prefer_tls()
-                # Optional STARTTLS attempt preference
-                if hasattr(dlg, "selected_try_starttls"):
-                    self._try_starttls = dlg.selected_try_starttls()
+                self._auto_negotiate = vals.auto_negotiate
+                self._prefer_tls = vals.prefer_tls
+                self._try_starttls = vals.try_starttls
             except Exception:
                 pass
             # Scrollback retention from dialog
             try:
-                self._scrollback_ttl_days = int(max(0, int(dlg.selected_scrollback_ttl_days())))
+                self._scrollback_ttl_days = int(max(0, int(vals.scrollback_ttl_days)))
             except Exception:
                 self._scrollback_ttl_days = max(
                     0, int(getattr(self, "_scrollback_ttl_days", 0) or 0)
                 )
             try:
-                self._scrollback_max_files = int(max(0, int(dlg.selected_scrollback_max_files())))
+                self._scrollback_max_files = int(max(0, int(vals.scrollback_max_files)))
             except Exception:
                 self._scrollback_max_files = max(
                     0, int(getattr(self, "_scrollback_max_files", 0) or 0)
@@ -3598,7 +3823,7 @@ class MainWindow(QMainWindow):
         try:
             # Save autoconnect flag only (server details saved via Connect dialog)
             s = QSettings("DeadHop", "DeadHopClient")
-            s.setValue("server/autoconnect", dlg.selected_autoconnect())
+            s.setValue("server/autoconnect", vals.autoconnect)
             # Persist scrollback retention
             s.setValue("scrollback/ttl_days", int(getattr(self, "_scrollback_ttl_days", 0) or 0))
             s.setValue("scrollback/max_files", int(getattr(self, "_scrollback_max_files", 0) or 0))
@@ -3752,7 +3977,7 @@ class MainWindow(QMainWindow):
         # Reset the chat document
         self._init_chat_webview()
 
-    def _on_channels_updated(self, labels: list[str]) -> None:
+    def _on_channels_updated(self, labels: tuple[str, ...]) -> None:
         """Keep sidebar tree in sync with bridge channel list."""
         try:
             self._channel_labels = list(labels or [])
@@ -3897,20 +4122,9 @@ class MainWindow(QMainWindow):
                 self, "Kick", f"Reason for kicking {nick} from {ch}:", text=""
             )
             if ok:
-                sent = False
-                for meth, cmd in (
-                    ("kickUser", None),
-                    ("sendRaw", f"KICK {ch} {nick} :{reason}"),
-                    ("sendCommand", f"KICK {ch} {nick} :{reason}"),
-                ):
-                    fn = getattr(self.bridge, meth, None)
-                    if callable(fn):
-                        try:
-                            fn(ch, nick, reason) if cmd is None else fn(cmd)
-                            sent = True
-                            break
-                        except Exception:
-                            pass
+                sent = self._bridge_dispatch(
+                    self._bridge_kick, (ch, nick, reason), f"KICK {ch} {nick} :{reason}"
+                )
                 if not sent:
                     self.toast_host.show_toast("Kick not implemented in bridge")
         elif action == "ban":
@@ -3919,62 +4133,56 @@ class MainWindow(QMainWindow):
                 self, "Ban", f"Ban mask or nick for {ch} (e.g. {nick} or *!*@host):", text=nick
             )
             if ok and mask.strip():
-                sent = False
-                for meth, cmd in (
-                    ("setModes", None),
-                    ("sendRaw", f"MODE {ch} +b {mask}"),
-                    ("sendCommand", f"MODE {ch} +b {mask}"),
-                ):
-                    fn = getattr(self.bridge, meth, None)
-                    if callable(fn):
-                        try:
-                            fn(ch, "+b " + mask) if cmd is None else fn(cmd)
-                            sent = True
-                            break
-                        except Exception:
-                            pass
+                sent = self._bridge_dispatch(
+                    self._bridge_setmodes, (ch, "+b " + mask), f"MODE {ch} +b {mask}"
+                )
                 if not sent:
                     self.toast_host.show_toast("Ban not implemented in bridge")
         elif action == "op":
             ch = self.bridge.current_channel() or ""
-            sent = False
-            for meth, cmd in (
-                ("setModes", None),
-                ("sendRaw", f"MODE {ch} +o {nick}"),
-                ("sendCommand", f"MODE {ch} +o {nick}"),
-            ):
-                fn = getattr(self.bridge, meth, None)
-                if callable(fn):
-                    try:
-                        fn(ch, "+o " + nick) if cmd is None else fn(cmd)
-                        sent = True
-                        break
-                    except Exception:
-                        pass
+            sent = self._bridge_dispatch(
+                self._bridge_setmodes, (ch, "+o " + nick), f"MODE {ch} +o {nick}"
+            )
             if not sent:
                 self.toast_host.show_toast("Op not implemented in bridge")
         elif action == "deop":
             ch = self.bridge.current_channel() or ""
-            sent = False
-            for meth, cmd in (
-                ("setModes", None),
-                ("sendRaw", f"MODE {ch} -o {nick}"),
-                ("sendCommand", f"MODE {ch} -o {nick}"),
-            ):
-                fn = getattr(self.bridge, meth, None)
-                if callable(fn):
-                    try:
-                        fn(ch, "-o " + nick) if cmd is None else fn(cmd)
-                        sent = True
-                        break
-                    except Exception:
-                        pass
+            sent = self._bridge_dispatch(
+                self._bridge_setmodes, (ch, "-o " + nick), f"MODE {ch} -o {nick}"
+            )
             if not sent:
                 self.toast_host.show_toast("Deop not implemented in bridge")
         else:
             self.toast_host.show_toast(f"Action '{action}' for {nick} not yet implemented")
 
     # ----- Find in buffer -----
+    def _show_url_dock(self) -> None:
+        self.url_dock.show()
+
+    def _show_friends_dock(self) -> None:
+        self.friends_dock.show()
+
+    def _show_log_dock(self) -> None:
+        """Show the IRC Log dock, creating it on first use."""
+        if self.log_dock is None:
+            self.log_view = QTextEdit(self)
+            self.log_view.setReadOnly(True)
+            self.log_view.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+            self.log_dock = QDockWidget("IRC Log", self)
+            self.log_dock.setWidget(self.log_view)
+            self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.log_dock)
+        self.log_dock.show()
+
+    def _show_find_dock(self) -> None:
+        """Show the Find dock, creating it on first use."""
+        if self.find_dock is None:
+            self.find_bar = FindBar(self)
+            self.find_bar.searchRequested.connect(self._on_find)
+            self.find_dock = QDockWidget("Find", self)
+            self.find_dock.setWidget(self.find_bar)
+            self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.find_dock)
+        self.find_dock.show()
+
     def _on_find(self, pattern: str, forward: bool) -> None:
         if not pattern:
             return
@@ -4034,12 +4242,11 @@ class MainWindow(QMainWindow):
     def _apply_qt_material(self, theme: str) -> None:
         # Apply qt-material stylesheet if available; otherwise fallback to our theme manager
         try:
-            from PyQt6.QtWidgets import QApplication
-            from qt_material import apply_stylesheet, list_themes
-
+            if _apply_stylesheet is None:
+                raise ImportError("qt_material")
             app = QApplication.instance()
             if app:
-                themes = list_themes()
+                themes = _material_themes()
                 chosen = theme
                 if chosen not in themes:
                     candidates = []
@@ -4063,7 +4270,7 @@ class MainWindow(QMainWindow):
                         else (themes[0] if themes else None)
                     )
                 if chosen:
-                    apply_stylesheet(app, theme=chosen)
+                    _apply_stylesheet(app, theme=chosen)
         except Exception:
             # fallback to our dark theme
             self._apply_theme("Material Dark")
@@ -4103,7 +4310,7 @@ class MainWindow(QMainWindow):
             if not p.exists():
                 return
             files = sorted(
-                [f for f in p.glob("scrollback_*.json") if f.is_file()],
+                [f for f in p.glob("scrollback_*.json*") if f.is_file()],
                 key=lambda f: f.stat().st_mtime,
                 reverse=True,
             )
@@ -4188,9 +4395,10 @@ class MainWindow(QMainWindow):
         tm.apply()
 
     # ----- Bridge callbacks -----
-    def _on_message(self, nick: str, target: str, text: str, ts: float) -> None:
+    def _on_message(self, net: str, nick: str, chan: str, text: str, ts: float) -> None:
         # Always record into per-channel scrollback; render only if active
         cur = self.bridge.current_channel()
+        target = composite(net, chan) if chan else ""
         try:
             msg = text or ""
             # CTCP ACTION formatting: \x01ACTION ...\x01 -> "* nick ..."
@@ -4205,17 +4413,9 @@ class MainWindow(QMainWindow):
         # Append to scrollback buffer for this composite label
         try:
             if target and rendered:
-                sb = self._scrollback.setdefault(target, [])
-                sb.append(rendered)
-                if len(sb) > self._scrollback_limit:
-                    del sb[: -self._scrollback_limit]
-                # Persist updated scrollback for this channel
-                try:
-                    self._scrollback_save(target, sb)
-                    # Best-effort prune according to policy
-                    self._prune_scrollback()
-                except Exception:
-                    pass
+                self._chan(target).scrollback.append(rendered)
+                # Persist for this channel; pruning runs when the file is compacted
+                self._scrollback_append(target, rendered)
         except Exception:
             pass
 
@@ -4251,25 +4451,16 @@ class MainWindow(QMainWindow):
         # Unread/highlight counters
         if target:
             if target != cur:
-                self._unread[target] = self._unread.get(target, 0) + 1
+                self._chan(target).unread += 1
             # basic highlight: mention of our nick or keywords
-            hl = False
-            low = (text or "").lower()
-            if self._my_nick and self._my_nick.lower() in low:
-                hl = True
-            else:
-                for w in self._highlight_keywords:
-                    if w.lower() in low:
-                        hl = True
-                        break
-            if hl:
+            pat = self._highlight_pattern()
+            if pat is not None and text and pat.search(text):
                 # mark highlight specially (could style badge differently)
-                self._highlights[target] = self._highlights.get(target, 0) + 1
+                self._chan(target).highlights += 1
                 # Notification on highlight
                 try:
-                    ch = target.split(":", 1)[-1]
                     self._notify_event(
-                        f"Mention in {ch}", f"{nick}: {self._strip_irc_codes(text)}", highlight=True
+                        f"Mention in {chan}", f"{nick}: {self._strip_irc_codes(text)}", highlight=True
                     )
                 except Exception:
                     pass
@@ -4277,9 +4468,8 @@ class MainWindow(QMainWindow):
                 # Non-highlight unread notification (only when not current)
                 if target != cur:
                     try:
-                        ch = target.split(":", 1)[-1]
                         self._notify_event(
-                            f"New message in {ch}",
+                            f"New message in {chan}",
                             f"{nick}: {self._strip_irc_codes(text)}",
                             highlight=False,
                         )
@@ -4292,9 +4482,8 @@ class MainWindow(QMainWindow):
                     pass
                 # update sidebar labels
                 try:
-                    self.sidebar.set_unread(
-                        target, self._unread.get(target, 0), self._highlights.get(target, 0)
-                    )
+                    st = self._chan(target)
+                    self.sidebar.set_unread(target, st.unread, st.highlights)
                 except Exception:
                     pass
         # Logging
@@ -4303,14 +4492,12 @@ class MainWindow(QMainWindow):
         except Exception:
             # Fallback: buffer into per-network status log
             try:
-                net_id = (target or cur or "").split(":", 1)[0] or "default"
+                net_id = net or (cur or "").split(":", 1)[0] or "default"
             except Exception:
                 net_id = "default"
             ms = text or ""
-            buf = self._status_by_net.setdefault(net_id, [])
+            buf = self._status_lines(net_id)
             buf.append(ms)
-            if len(buf) > 500:
-                del buf[:-500]
             # If the network (top item) is currently selected, render live
             try:
                 if getattr(self, "_selected_network", None) == net_id:
@@ -4348,20 +4535,21 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def _on_names(self, channel: str, names: list[str]) -> None:
+    def _on_names(self, net: str, chan: str, names: list[str]) -> None:
         # Merge incremental updates into cache keyed by channel label
+        channel = composite(net, chan)
         try:
-            existing = set(self._names_by_channel.get(channel, []))
+            existing = set(self._chan(channel).names)
             incoming = set(names or [])
             merged = sorted(existing.union(incoming))
-            self._names_by_channel[channel] = merged
+            self._chan(channel).names = merged
         except Exception:
             # Fallback: replace cache
-            self._names_by_channel[channel] = list(names or [])
+            self._chan(channel).names = list(names or [])
         # Only update the visible list if this channel is the active one
         cur = self.bridge.current_channel()
         if cur and channel == cur:
-            current = self._names_by_channel.get(channel, list(names or []))
+            current = self._chan(channel).names
             self.members.set_members(list(current))
             # Provide names to composer for tab completion
             try:
@@ -4379,10 +4567,10 @@ class MainWindow(QMainWindow):
         try:
             # Reset unread/highlight counters in sidebar for this channel
             if comp:
-                self._unread[comp] = 0
-                self._highlights[comp] = self._highlights.get(comp, 0)
+                st = self._chan(comp)
+                st.unread = 0
                 try:
-                    self.sidebar.set_unread(comp, 0, self._highlights.get(comp, 0))
+                    self.sidebar.set_unread(comp, 0, st.highlights)
                 except Exception:
                     pass
         except Exception:
@@ -4396,17 +4584,17 @@ class MainWindow(QMainWindow):
             pass
         # Load scrollback if not in memory
         try:
-            buf = self._scrollback.get(comp)
+            buf = self._chan(comp).scrollback
             if not buf:
                 buf = self._scrollback_load(comp)
                 if buf:
-                    self._scrollback[comp] = list(buf)
+                    self._chan(comp).scrollback = deque(buf, maxlen=self._scrollback_limit)
         except Exception:
             buf = []
         # Render scrollback
         try:
-            for html in list(buf or []):
-                self.chat.page().runJavaScript(f"appendMessage({json.dumps(html)})")
+            if buf:
+                self.chat.page().runJavaScript(f"appendBatch({json.dumps(list(buf))})")
         except Exception:
             pass
         # Topic bar
@@ -4417,7 +4605,7 @@ class MainWindow(QMainWindow):
             pass
         # Members list and composer names
         try:
-            names = list(self._names_by_channel.get(comp, []))
+            names = list(self._chan(comp).names)
             self.members.set_members(list(names) or [comp.split(":", 1)[-1]])
             try:
                 self.composer.set_completion_names(list(names))
@@ -4431,24 +4619,18 @@ class MainWindow(QMainWindow):
         try:
             if not comp:
                 return
-            sb = self._scrollback.setdefault(comp, [])
             html = f"<span class='sys'><i>{self._strip_irc_codes(text)}</i></span>"
-            sb.append(html)
-            if len(sb) > self._scrollback_limit:
-                del sb[: -self._scrollback_limit]
+            self._chan(comp).scrollback.append(html)
             # Persist system messages as well
-            try:
-                self._scrollback_save(comp, sb)
-                self._prune_scrollback()
-            except Exception:
-                pass
+            self._scrollback_append(comp, html)
             if (self.bridge.current_channel() or "") == comp:
                 self.chat.page().runJavaScript(f"appendMessage({json.dumps(html)})")
             else:
                 # bump unread
                 try:
-                    self._unread[comp] = self._unread.get(comp, 0) + 1
-                    self.sidebar.set_unread(comp, self._unread[comp], self._highlights.get(comp, 0))
+                    st = self._chan(comp)
+                    st.unread += 1
+                    self.sidebar.set_unread(comp, st.unread, st.highlights)
                 except Exception:
                     pass
         except Exception:
@@ -4462,17 +4644,12 @@ class MainWindow(QMainWindow):
                 return
             # Clear memory
             try:
-                self._scrollback[comp] = []
+                self._chan(comp).scrollback.clear()
             except Exception:
                 pass
             # Remove file
             try:
-                path = self._scrollback_path(comp)
-                if path:
-                    import os as _os
-
-                    if _os.path.exists(path):
-                        _os.remove(path)
+                self._scrollback_store.clear(comp)
             except Exception:
                 pass
             # Clear chat view
@@ -4485,14 +4662,14 @@ class MainWindow(QMainWindow):
             # Keep topic bar and members; show a system notice that history was cleared
             try:
                 note = "<span class='sys'><i>History cleared for this channel.</i></span>"
-                self._scrollback.setdefault(comp, []).append(note)
+                self._chan(comp).scrollback.append(note)
                 self.chat.page().runJavaScript(f"appendMessage({json.dumps(note)})")
             except Exception:
                 pass
             # Update unread to zero
             try:
-                self._unread[comp] = 0
-                self.sidebar.set_unread(comp, 0, self._highlights.get(comp, 0))
+                self._chan(comp).unread = 0
+                self.sidebar.set_unread(comp, 0, self._chan(comp).highlights)
             except Exception:
                 pass
             self.status.showMessage("Channel history cleared", 2000)
@@ -4501,41 +4678,41 @@ class MainWindow(QMainWindow):
 
     def _members_add(self, comp: str, who: str) -> None:
         try:
-            names = set(self._names_by_channel.get(comp, []))
+            names = set(self._chan(comp).names)
             if who not in names:
                 names.add(who)
-                self._names_by_channel[comp] = sorted(names)
+                self._chan(comp).names = sorted(names)
                 if (self.bridge.current_channel() or "") == comp:
-                    self.members.set_members(list(self._names_by_channel[comp]))
-                    self.composer.set_completion_names(list(self._names_by_channel[comp]))
+                    self.members.set_members(list(self._chan(comp).names))
+                    self.composer.set_completion_names(list(self._chan(comp).names))
         except Exception:
             pass
 
     def _members_remove(self, comp: str, who: str) -> None:
         try:
-            names = list(self._names_by_channel.get(comp, []))
+            names = list(self._chan(comp).names)
             if who in names:
                 names = [x for x in names if x != who]
-                self._names_by_channel[comp] = names
+                self._chan(comp).names = names
                 if (self.bridge.current_channel() or "") == comp:
                     self.members.set_members(list(names))
                     self.composer.set_completion_names(list(names))
         except Exception:
             pass
 
-    def _on_user_joined(self, comp: str, nick: str) -> None:
-        ch = comp.split(":", 1)[1] if ":" in comp else comp
+    def _on_user_joined(self, net: str, ch: str, nick: str) -> None:
+        comp = composite(net, ch)
         self._channel_emit(comp, f"• {nick} joined {ch}")
         self._members_add(comp, nick)
 
-    def _on_user_parted(self, comp: str, nick: str) -> None:
-        ch = comp.split(":", 1)[1] if ":" in comp else comp
+    def _on_user_parted(self, net: str, ch: str, nick: str) -> None:
+        comp = composite(net, ch)
         self._channel_emit(comp, f"• {nick} left {ch}")
         self._members_remove(comp, nick)
 
     def _on_user_quit(self, net: str, nick: str) -> None:
         try:
-            for comp, names in list(self._names_by_channel.items()):
+            for comp, names in [(c, st.names) for c, st in self._channels.items()]:
                 if not comp.startswith(f"{net}:"):
                     continue
                 if nick in names:
@@ -4546,20 +4723,21 @@ class MainWindow(QMainWindow):
 
     def _on_user_nick_changed(self, net: str, old: str, new: str) -> None:
         try:
-            for comp, names in list(self._names_by_channel.items()):
+            for comp, names in [(c, st.names) for c, st in self._channels.items()]:
                 if not comp.startswith(f"{net}:"):
                     continue
                 if old in names:
                     self._channel_emit(comp, f"• {old} is now known as {new}")
                     updated = [new if x == old else x for x in names]
-                    self._names_by_channel[comp] = sorted(set(updated))
+                    self._chan(comp).names = sorted(set(updated))
                     if (self.bridge.current_channel() or "") == comp:
-                        self.members.set_members(list(self._names_by_channel[comp]))
-                        self.composer.set_completion_names(list(self._names_by_channel[comp]))
+                        self.members.set_members(list(self._chan(comp).names))
+                        self.composer.set_completion_names(list(self._chan(comp).names))
         except Exception:
             pass
 
-    def _on_channel_topic(self, comp: str, actor: str, topic: str) -> None:
+    def _on_channel_topic(self, net: str, ch: str, actor: str, topic: str) -> None:
+        comp = composite(net, ch)
         try:
             # Cache topic text for this channel
             self._topic_by_channel[comp] = topic or ""
@@ -4578,19 +4756,19 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def _on_channel_mode(self, comp: str, actor: str, modes: str) -> None:
-        ch = comp.split(":", 1)[1] if ":" in comp else comp
+    def _on_channel_mode(self, net: str, ch: str, actor: str, modes: str) -> None:
+        comp = composite(net, ch)
         self._channel_emit(comp, f"• mode/{ch} {modes}")
 
-    def _on_channel_mode_users(self, comp: str, changes: list) -> None:
+    def _on_channel_mode_users(self, net: str, ch: str, changes: list) -> None:
         # Summarize user mode changes, e.g., +o nick, -v nick
+        comp = composite(net, ch)
         try:
             parts = []
             for add, mode, nick in changes:
                 sign = "+" if add else "-"
                 parts.append(f"{sign}{mode} {nick}")
             if parts:
-                ch = comp.split(":", 1)[1] if ":" in comp else comp
                 self._channel_emit(comp, f"• mode/{ch} " + " ".join(parts))
         except Exception:
             pass
@@ -4988,10 +5166,10 @@ class MainWindow(QMainWindow):
 
     # ----- Multi-server storage (QSettings: group 'servers') -----
     def _servers_list(self) -> list[str]:
+        # Session-cached; writers below update it through store_server_names
         try:
             s = QSettings("DeadHop", "DeadHopClient")
-            names = s.value("servers/names", [], type=list) or []
-            return list(names)
+            return load_server_names(s)
         except Exception:
             return []
 
@@ -5012,9 +5190,10 @@ class MainWindow(QMainWindow):
     ) -> None:
         try:
             s = QSettings("DeadHop", "DeadHopClient")
-            names = set(self._servers_list())
-            names.add(name)
-            s.setValue("servers/names", list(names))
+            names = self._servers_list()
+            if name not in names:
+                names.append(name)
+                store_server_names(s, names)
             base = f"servers/{name}"
             s.setValue(base + "/host", host)
             s.setValue(base + "/port", int(port))
@@ -5069,7 +5248,7 @@ class MainWindow(QMainWindow):
         try:
             s = QSettings("DeadHop", "DeadHopClient")
             names = [n for n in self._servers_list() if n != name]
-            s.setValue("servers/names", names)
+            store_server_names(s, names)
             base = f"servers/{name}"
             for key in (
                 "host",
@@ -5377,12 +5556,10 @@ class MainWindow(QMainWindow):
             self._channel_labels = new_labels
             self.sidebar.set_channels(self._channel_labels)
             # Reset counters for unknown channels
-            for k in list(self._unread.keys()):
-                if k not in self._channel_labels:
-                    del self._unread[k]
-            for k in list(self._highlights.keys()):
+            for k, st in self._channels.items():
                 if k not in self._channel_labels:
-                    del self._highlights[k]
+                    st.unread = 0
+                    st.highlights = 0
             # If nothing selected, pick the first available
             if not self.bridge.current_channel() and self._channel_labels:
                 self.bridge.set_current_channel(self._channel_labels[0])
@@ -5433,8 +5610,8 @@ class MainWindow(QMainWindow):
                     self._selected_network = None
                 except Exception:
                     pass
-                self._unread[ch] = 0
-                hl = self._highlights.get(ch, 0)
+                self._chan(ch).unread = 0
+                hl = self._chan(ch).highlights
                 try:
                     self.sidebar.set_unread(ch, 0, hl)
                 except Exception:
@@ -5486,7 +5663,7 @@ class MainWindow(QMainWindow):
                     pass
                 # Refresh members list and completion names from cache, if available
                 try:
-                    names = self._names_by_channel.get(ch, [])
+                    names = self._chan(ch).names
                     self.members.set_members(list(names))
                     self.composer.set_completion_names(list(names))
                 except Exception:
@@ -116,6 +116,18 @@ class FriendsDock(QWidget):
         self._online = set(online)
         self._refresh()
 
+    def add_presence(self, nicks: list[str]) -> None:
+        changed = set(nicks) - self._online
+        if changed:
+            self._online |= changed
+            self._refresh()
+
+    def remove_presence(self, nicks: list[str]) -> None:
+        changed = self._online & set(nicks)
+        if changed:
+            self._online -= changed
+            self._refresh()
+
     def set_avatars(self, avatars: dict[str, str | None]) -> None:
         self._avatars = dict(avatars or {})
         self._refresh()
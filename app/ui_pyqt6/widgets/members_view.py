@@ -61,19 +61,44 @@ class MembersView(QWidget):
         try:
             self._online = set(online)
             # Refresh icons only
-            for i in range(self.list.count()):
-                it = self.list.item(i)
-                raw = it.text()
-                status = ""
-                name = raw
-                if name and name[0] in ("~", "&", "@", "%", "+"):
-                    status = name[0]
-                    name = name[1:].strip()
-                path = self._avatars.get(name)
-                it.setIcon(make_avatar_icon(name, path, 22, name in self._online, status))
+            self._refresh_presence_icons(None)
+        except Exception:
+            pass
+
+    def add_presence(self, nicks: list[str]) -> None:
+        """Mark nicks online, re-rendering only the rows whose state changed."""
+        try:
+            changed = set(nicks) - self._online
+            if changed:
+                self._online |= changed
+                self._refresh_presence_icons(changed)
+        except Exception:
+            pass
+
+    def remove_presence(self, nicks: list[str]) -> None:
+        """Mark nicks offline, re-rendering only the rows whose state changed."""
+        try:
+            changed = self._online & set(nicks)
+            if changed:
+                self._online -= changed
+                self._refresh_presence_icons(changed)
         except Exception:
             pass
 
+    def _refresh_presence_icons(self, only: set[str] | None) -> None:
+        for i in range(self.list.count()):
+            it = self.list.item(i)
+            raw = it.text()
+            status = ""
+            name = raw
+            if name and name[0] in ("~", "&", "@", "%", "+"):
+                status = name[0]
+                name = name[1:].strip()
+            if only is not None and name not in only:
+                continue
+            path = self._avatars.get(name)
+            it.setIcon(make_avatar_icon(name, path, 22, name in self._online, status))
+
     def set_self_nick(self, nick: str | None) -> None:
         try:
             self._me = (nick or "").strip()
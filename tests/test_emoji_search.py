@@ -0,0 +1,43 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+
+from app.ui_pyqt6.dialogs import emoji_picker as ep  # noqa: E402
+
+
+@pytest.fixture
+def catalog(monkeypatch):
+    """Swap in a small catalog (and its derived index) for the module under test."""
+
+    def use(entries):
+        monkeypatch.setattr(ep, "EMOJIS", entries)
+        monkeypatch.setattr(ep, "TRIGRAMS", ep._build_trigrams(entries))
+        monkeypatch.setattr(ep, "NAMES_LC", tuple(n.lower() for _e, n in entries))
+
+    return use
+
+
+def test_build_trigrams_indexes_lowercased_slices():
+    index = ep._build_trigrams([("a", "Fire"), ("b", "tire")])
+    assert index["fir"] == {0}
+    assert index["ire"] == {0, 1}
+    assert "Fir" not in index
+
+
+def test_trigram_search_verifies_contiguous_match(catalog):
+    # Every trigram of "abcde" (abc, bcd, cde) occurs in the name, but not contiguously
+    catalog([("x", "abcd bcde")])
+    assert ep._trigram_search("abcde") == set()
+    assert ep._trigram_search("bcde") == {0}
+
+
+def test_trigram_search_missing_trigram_returns_nothing(catalog):
+    catalog([("x", "pizza"), ("y", "burger")])
+    assert ep._trigram_search("pizzq") == set()
+
+
+def test_trigram_search_returns_every_matching_name():
+    hits = ep._trigram_search("heart")
+    expected = {i for i, (_em, name) in enumerate(ep.EMOJIS) if "heart" in name}
+    assert len(expected) > 1
+    assert hits == expected
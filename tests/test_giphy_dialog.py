@@ -0,0 +1,57 @@
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    # Held for the module: widgets die with the QApplication
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def dialog(qapp, monkeypatch, tmp_path):
+    from app.ui_pyqt6.dialogs import giphy_dialog as gd
+
+    # Keep the cache, thumbnails and key lookup away from the real profile
+    monkeypatch.setattr(gd, "CACHE_FILE", tmp_path / "giphy_cache.json.gz")
+    monkeypatch.setattr(gd, "LEGACY_CACHE_FILE", tmp_path / "giphy_cache.json")
+    monkeypatch.setattr(gd, "THUMB_DIR", tmp_path / "thumbs")
+    monkeypatch.setattr(gd, "_load_api_key", lambda: "")
+    submitted = []
+    monkeypatch.setattr(gd.GiphyDialog, "_submit", lambda self, *a, **k: submitted.append(a))
+    dlg = gd.GiphyDialog(api_key="test-key")
+    dlg.submitted = submitted
+    return dlg
+
+
+def _items(*urls):
+    return [{"images": {"original": {"url": u}}} for u in urls]
+
+
+def test_cached_search_supersedes_network_search_in_flight(dialog):
+    dogs = _items("https://giphy.test/dog.gif")
+    dialog._cache.setdefault("queries", {})["dogs"] = {
+        "ts": time.time(),
+        "ttl": 3600,
+        "items": dogs,
+    }
+    # "cats" goes to the network and is still in flight...
+    dialog.query.setText("cats")
+    dialog._do_search()
+    assert len(dialog.submitted) == 1
+    # ...when the user searches the cached "dogs"
+    dialog.query.setText("dogs")
+    dialog._do_search()
+    assert "dogs" in dialog.status.text()
+
+    dialog._on_search_done("cats", _items("https://giphy.test/cat.gif"), "")
+
+    # The late reply is cached but must not replace the dogs results
+    assert "cats" in dialog._cache["queries"]
+    assert "dogs" in dialog.status.text()
+    assert dialog._tiles[0][0].property("url") == "https://giphy.test/dog.gif"
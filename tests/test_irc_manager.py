@@ -46,3 +46,28 @@ async def test_sasl_payload_format(profile):
     # Should begin with AUTHENTICATE and contain base64 payload after a space
     assert out.startswith("AUTHENTICATE ")
     assert len(out.split(" ", 1)[1]) > 0
+
+
+@pytest.mark.asyncio
+async def test_cached_caps_nak_invalidates_and_falls_back(profile):
+    profile.cached_caps = ["server-time", "echo-message"]
+    m = IRCManager(profile)
+    dropped = []
+    m.on_caps_invalidated = lambda: dropped.append(True)
+    m._cap_from_cache = True
+    m._requested_caps.update(profile.cached_caps)
+    await m._handle_cap("NAK", "server-time echo-message")
+    # Cache is dropped and a full LS negotiation restarts instead of ending CAP
+    assert dropped == [True]
+    assert m.p.cached_caps is None
+    assert not m._requested_caps
+    assert not m._cap_ended
+
+
+@pytest.mark.asyncio
+async def test_cap_ack_reports_active_caps(profile):
+    m = IRCManager(profile)
+    seen = []
+    m.on_caps_cached = seen.append
+    await m._handle_cap("ACK", "server-time batch")
+    assert seen == [["batch", "server-time"]]
@@ -0,0 +1,39 @@
+import json
+
+from app.logging.scrollback import ScrollbackStore
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_append_past_limit_compacts_to_last_lines(tmp_path):
+    store = ScrollbackStore(tmp_path, limit=3)
+    history = []
+    compacted = []
+    for i in range(5):
+        history = (history + [f"line {i}"])[-3:]
+        compacted.append(store.append("#chan", f"line {i}", history))
+
+    # Three plain appends, then the fourth rewrites the file from the tail
+    assert compacted == [False, False, False, True, False]
+    assert _lines(store.path_for("#chan")) == ["line 1", "line 2", "line 3", "line 4"]
+    assert store.load("#chan") == ["line 2", "line 3", "line 4"]
+
+
+def test_load_skips_truncated_and_corrupt_lines(tmp_path):
+    store = ScrollbackStore(tmp_path, limit=10)
+    store.path_for("#chan").write_text('"first"\n"sec\nnot json\n"third"\n"trunc', encoding="utf-8")
+    assert store.load("#chan") == ["first", "third"]
+
+
+def test_legacy_json_file_is_migrated_then_removed(tmp_path):
+    store = ScrollbackStore(tmp_path, limit=2)
+    legacy = tmp_path / "scrollback_#chan.json"
+    legacy.write_text(json.dumps(["a", "b", "c"]), encoding="utf-8")
+
+    assert store.load("#chan") == ["b", "c"]
+    assert not legacy.exists()
+    assert _lines(store.path_for("#chan")) == ["b", "c"]
+    # Later loads read the migrated file
+    assert store.load("#chan") == ["b", "c"]